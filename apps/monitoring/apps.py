@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.monitoring'
+
+    def ready(self):
+        # Count new DB connections & collect connection pool metrics
+        import apps.monitoring.database
+        # Request metrics' execute wrappers on every new DB connection (ASGI threads too)
+        import utils.execute_wrappers
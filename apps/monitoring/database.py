@@ -0,0 +1,44 @@
+from django.db import connections
+from django.dispatch import receiver
+from django.db.backends.signals import connection_created
+
+from .metrics import registry
+
+
+# Database connection metrics: connections opened per alias (each one costs
+# a TCP/TLS handshake & backend startup, so this should stay flat with
+# CONN_MAX_AGE or pooling) & psycopg pool statistics (DB_POOL)
+POOL_STATS = {
+    # psycopg_pool stat: (metric, scale)
+    'pool_size': ('db_pool_size', 1),
+    'pool_available': ('db_pool_available', 1),
+    'pool_max': ('db_pool_max_size', 1),
+    'requests_waiting': ('db_pool_requests_waiting', 1),
+    'requests_num': ('db_pool_requests_total', 1),
+    'requests_queued': ('db_pool_requests_queued_total', 1),
+    'requests_wait_ms': ('db_pool_wait_seconds_total', 0.001),
+    'requests_errors': ('db_pool_errors_total', 1),
+}
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    registry.inc('db_connections_created_total', (('alias', connection.alias),))
+
+
+def collect_pool_metrics(registry, databases=None):
+    # Current statistics of every configured connection pool
+    for connection in databases if databases is not None else connections.all():
+        if not connection.settings_dict.get('OPTIONS', {}).get('pool'):
+            continue
+        pool = getattr(connection, 'pool', None)
+        if pool is None:
+            continue
+
+        stats = pool.get_stats()  # Counters absent from the stats are 0
+        labels = (('alias', connection.alias),)
+        for stat, (name, scale) in POOL_STATS.items():
+            registry.set_value(name, labels, stats.get(stat, 0) * scale)
+
+
+registry.add_collector(collect_pool_metrics)
@@ -0,0 +1,334 @@
+import json
+import time
+import random
+import socket
+import secrets
+import threading
+import http.client
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# Concurrent load generator against a running server (runserver, gunicorn).
+# Every worker thread is a virtual player with its own keep-alive HTTP
+# connection: it registers or logs in (as a generate_load_data user), starts
+# & submits quizzes, browses content & leaderboards, in proportions set by a
+# traffic profile. Lessons are picked with a long-tailed popularity, so hot
+# lessons see concurrent cache misses & submits like in production.
+#
+# Throttles key on the client IP; all virtual players share the load
+# generator's IP unless client_ips > 1, which sends an X-Forwarded-For
+# address per player (only honoured without a trusted proxy setup).
+#
+# slow_clients adds clients on slow networks next to the players: each one
+# trickles its leaderboard GET over slow_seconds before reading the reply.
+# Threaded WSGI workers hold a thread per such request; ASGI servers parse
+# requests on their event loop (see scripts/benchmark_asgi.py).
+PROFILES = {
+    # action: weight
+    'mixed': {'register': 2, 'login': 8, 'start': 25, 'submit': 25, 'leaderboard': 20, 'content': 20},
+    'play': {'login': 5, 'start': 45, 'submit': 45, 'leaderboard': 5},
+    'browse': {'content': 60, 'leaderboard': 40},
+    'signup': {'register': 40, 'login': 40, 'start': 10, 'submit': 10},
+}
+ACTIONS = ('register', 'login', 'start', 'submit', 'leaderboard', 'content')
+LESSON_SAMPLE = 50  # Lessons discovered & played
+
+
+def parse_mix(value):
+    # "start=30,submit=30,leaderboard=40" -> {"start": 30, ...}
+    mix = {}
+    for item in value.split(','):
+        action, _, weight = item.partition('=')
+        action = action.strip()
+        if action not in ACTIONS or not weight.strip().isdigit():
+            raise ValueError(f"Invalid traffic mix entry: '{item}' (actions: {', '.join(ACTIONS)})")
+        mix[action] = int(weight)
+    if not any(mix.values()):
+        raise ValueError("The traffic mix needs at least one positive weight.")
+    return mix
+
+
+class Recorder:
+    # Thread-safe latencies & outcomes per action
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.statuses = {}
+
+    def record(self, action, seconds, status):
+        # status: HTTP status code, or an exception name for transport errors
+        with self._lock:
+            self.latencies.setdefault(action, []).append(seconds)
+            codes = self.statuses.setdefault(action, {})
+            codes[str(status)] = codes.get(str(status), 0) + 1
+
+    def report(self, seconds):
+        actions = {}
+        total = errors = throttled = 0
+        for action, latencies in sorted(self.latencies.items()):
+            codes = self.statuses[action]
+            action_errors = sum(count for code, count in codes.items() if not code.isdigit() or int(code) >= 400)
+            action_throttled = codes.get('429', 0)
+            latencies = np.array(latencies) * 1000
+            actions[action] = {
+                'requests': len(latencies),
+                'errors': action_errors,
+                'error_rate': round(action_errors / len(latencies), 4),
+                'throttled': action_throttled,
+                'status_codes': dict(sorted(codes.items())),
+                'p50_ms': round(float(np.percentile(latencies, 50)), 2),
+                'p90_ms': round(float(np.percentile(latencies, 90)), 2),
+                'p99_ms': round(float(np.percentile(latencies, 99)), 2),
+                'max_ms': round(float(latencies.max()), 2),
+            }
+            total += len(latencies)
+            errors += action_errors
+            throttled += action_throttled
+
+        return {
+            'duration_s': round(seconds, 2),
+            'requests': total,
+            'throughput_rps': round(total / seconds, 2) if seconds else None,
+            'errors': errors,
+            'error_rate': round(errors / total, 4) if total else None,
+            'throttled': throttled,
+            'actions': actions,
+        }
+
+
+class VirtualPlayer:
+    def __init__(self, test, number):
+        self.test = test
+        self.number = number
+        self.rng = random.Random(test.seed * 100003 + number)
+        client = number % test.client_ips
+        self.address = f'10.77.{client >> 8 & 255}.{client & 255}' if test.client_ips > 1 else None
+        self.connection = None
+        self.access = None
+        self.attempt = None  # (attempt ID, question IDs) of the running quiz
+
+    def request(self, action, method, path, body=None, auth=False):
+        # Timed request; returns (status, parsed JSON or None)
+        headers = {'Accept': 'application/json'}
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+            body = json.dumps(body)
+        if auth and self.access:
+            headers['Authorization'] = f'Bearer {self.access}'
+        if self.address:
+            headers['X-Forwarded-For'] = self.address
+
+        start = time.perf_counter()
+        try:
+            if self.connection is None:
+                self.connection = self.test.connect()
+            self.connection.request(method, self.test.base_path + path, body=body, headers=headers)
+            response = self.connection.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            self.test.recorder.record(action, time.perf_counter() - start, type(e).__name__)
+            self.close()  # Reconnect on the next request
+            return None, None
+        self.test.recorder.record(action, time.perf_counter() - start, response.status)
+
+        try:
+            return response.status, json.loads(data) if data else None
+        except ValueError:
+            return response.status, None
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    # Actions
+
+    def register(self):
+        username = f'{self.test.prefix}_user_reg_{self.test.run_id}_{self.number}_{self.rng.getrandbits(32):x}'
+        status, data = self.request('register', 'POST', '/auth/register/', {
+            'username': username,
+            'password': self.test.password,
+            'confirm_password': self.test.password,
+        })
+        if status == 201 and data:
+            self.access = data.get('access')
+
+    def login(self):
+        number = self.rng.randrange(self.test.users)
+        status, data = self.request('login', 'POST', '/auth/login/', {
+            'username': f'{self.test.prefix}_user_{number:07d}',
+            'password': self.test.password,
+        })
+        if status == 200 and data:
+            self.access = data.get('access')
+
+    def start(self):
+        if not self.access:
+            return self.login()
+        lesson_id = self.test.pick_lesson(self.rng)
+        status, data = self.request('start', 'POST', f'/quiz/game/start/{lesson_id}/', auth=True)
+        if status == 200 and data:
+            self.attempt = (data['attempt_id'], [question['id'] for question in data['questions']])
+
+    def submit(self):
+        if not self.attempt:
+            return self.start()
+        attempt_id, question_ids = self.attempt
+        self.attempt = None
+        answers = {str(question_id): str(self.rng.randint(1, 3)) for question_id in question_ids}
+        self.request('submit', 'POST', f'/quiz/game/submit-answer/{attempt_id}/', {'answers': answers}, auth=True)
+
+    def leaderboard(self):
+        if self.rng.random() < 0.5 and self.test.subject_ids:
+            subject_id = self.rng.choice(self.test.subject_ids)
+            self.request('leaderboard', 'GET', f'/quiz/subjects/{subject_id}/leaderboard/')
+        else:
+            self.request('leaderboard', 'GET', '/quiz/leaderboard/')
+
+    def content(self):
+        choice = self.rng.random()
+        if choice < 0.2:
+            self.request('content', 'GET', '/quiz/subjects/')
+        elif choice < 0.5 and self.test.subject_ids:
+            self.request('content', 'GET', f'/quiz/subjects/{self.rng.choice(self.test.subject_ids)}/lessons/')
+        else:
+            self.request('content', 'GET', f'/quiz/lessons/{self.test.pick_lesson(self.rng)}/questions/')
+
+    def run(self):
+        actions, weights = zip(*self.test.mix.items())
+        try:
+            while self.test.keep_going():
+                getattr(self, self.rng.choices(actions, weights)[0])()
+        finally:
+            self.close()
+
+
+class SlowClient:
+    # Sends each request a few bytes at a time, spread over slow_seconds
+    def __init__(self, test, number):
+        self.test = test
+        self.number = number
+
+    def request(self):
+        test = self.test
+        payload = (
+            f'GET {test.base_path}/quiz/leaderboard/ HTTP/1.1\r\n'
+            f'Host: {test.host}:{test.port}\r\n'
+            'Accept: application/json\r\n'
+            'Connection: close\r\n\r\n'
+        ).encode()
+        chunks = [payload[index:index + 8] for index in range(0, len(payload), 8)]
+        pause = test.slow_seconds / len(chunks)
+
+        start = time.perf_counter()
+        try:
+            with socket.create_connection((test.host, test.port), timeout=test.timeout) as sock:
+                for chunk in chunks:
+                    sock.sendall(chunk)
+                    time.sleep(pause)
+                response = http.client.HTTPResponse(sock)
+                response.begin()
+                response.read()
+        except (OSError, http.client.HTTPException) as e:
+            test.recorder.record('slow_client', time.perf_counter() - start, type(e).__name__)
+            return
+        test.recorder.record('slow_client', time.perf_counter() - start, response.status)
+
+    def run(self):
+        while self.test.keep_going():
+            self.request()
+
+
+class LoadTest:
+    def __init__(self, url='http://127.0.0.1:8000', mix=None, concurrency=16, duration=30,
+                 max_requests=None, users=100, prefix='load', password='loadtest123',
+                 client_ips=1, timeout=30, seed=0, slow_clients=0, slow_seconds=5):
+        parts = urlsplit(url)
+        self.scheme, self.host, self.port = parts.scheme or 'http', parts.hostname, parts.port
+        self.base_path = parts.path.rstrip('/')
+        self.mix = {action: weight for action, weight in (mix or PROFILES['mixed']).items() if weight > 0}
+        self.concurrency = concurrency
+        self.duration = duration
+        self.max_requests = max_requests
+        self.users = users
+        self.prefix = prefix
+        self.password = password
+        self.client_ips = client_ips
+        self.timeout = timeout
+        self.seed = seed
+        self.slow_clients = slow_clients
+        self.slow_seconds = slow_seconds
+        self.run_id = secrets.token_hex(3)
+        self.recorder = Recorder()
+        self.subject_ids, self.lesson_ids, self.lesson_weights = [], [], []
+        self._issued = 0
+        self._lock = threading.Lock()
+        self._deadline = None
+
+    def connect(self):
+        connection_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        return connection_class(self.host, self.port, timeout=self.timeout)
+
+    def keep_going(self):
+        if time.monotonic() >= self._deadline:
+            return False
+        if self.max_requests is None:
+            return True
+        with self._lock:
+            self._issued += 1
+            return self._issued <= self.max_requests
+
+    def pick_lesson(self, rng):
+        return rng.choices(self.lesson_ids, self.lesson_weights)[0]
+
+    def discover(self):
+        # Subjects & lessons to play, from the API itself (untimed)
+        explorer = VirtualPlayer(self, 0)
+        recorder, self.recorder = self.recorder, Recorder()  # Not part of the results
+        try:
+            _, subjects = explorer.request('discover', 'GET', '/quiz/subjects/?page_size=25')
+            self.subject_ids = [subject['id'] for subject in (subjects or {}).get('results', [])]
+            for subject_id in self.subject_ids:
+                _, lessons = explorer.request('discover', 'GET', f'/quiz/subjects/{subject_id}/lessons/?page_size=50')
+                self.lesson_ids += [lesson['id'] for lesson in (lessons or {}).get('results', [])]
+                if len(self.lesson_ids) >= LESSON_SAMPLE:
+                    break
+        finally:
+            explorer.close()
+            self.recorder = recorder
+
+        if not self.lesson_ids:
+            raise ValueError(
+                f"No lessons found at {self.scheme}://{self.host}:{self.port}{self.base_path} "
+                "(is the server running & the generate_load_data dataset loaded?)"
+            )
+        self.lesson_ids = self.lesson_ids[:LESSON_SAMPLE]
+        # Long-tailed popularity: the n-th lesson is played ~1/n as often
+        self.lesson_weights = [1 / rank for rank in range(1, len(self.lesson_ids) + 1)]
+
+    def run(self):
+        self.discover()
+        start = time.monotonic()
+        self._deadline = start + self.duration
+        clients = [VirtualPlayer(self, number) for number in range(1, self.concurrency + 1)]
+        clients += [SlowClient(self, number) for number in range(1, self.slow_clients + 1)]
+        with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+            for future in [executor.submit(client.run) for client in clients]:
+                future.result()
+
+        report = self.recorder.report(time.monotonic() - start)
+        report['config'] = {
+            'url': f'{self.scheme}://{self.host}:{self.port}{self.base_path}',
+            'mix': self.mix,
+            'concurrency': self.concurrency,
+            'duration_s': self.duration,
+            'max_requests': self.max_requests,
+            'client_ips': self.client_ips,
+            'slow_clients': self.slow_clients,
+            'slow_seconds': self.slow_seconds,
+            'seed': self.seed,
+        }
+        return report
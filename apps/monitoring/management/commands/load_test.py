@@ -0,0 +1,111 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.monitoring.load_test import PROFILES, LoadTest, parse_mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Load-test a running server with concurrent virtual players replaying "
+        "a mix of register, login, quiz start/submit, leaderboard & content "
+        "traffic; reports latency distributions & error rates per action"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help="Base URL of the server under test (default: http://127.0.0.1:8000)"
+        )
+        parser.add_argument(
+            '--profile',
+            choices=sorted(PROFILES),
+            default='mixed',
+            help="Traffic profile (default: mixed)"
+        )
+        parser.add_argument(
+            '--mix',
+            help="Custom traffic mix overriding --profile, e.g. 'start=30,submit=30,leaderboard=40'"
+        )
+        parser.add_argument('--concurrency', type=int, default=16, help="Virtual players (threads) (default: 16)")
+        parser.add_argument('--duration', type=float, default=30, help="Seconds to run (default: 30)")
+        parser.add_argument('--requests', type=int, help="Stop after this many requests (default: no limit)")
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=100,
+            help="Generated users (generate_load_data) players log in as (default: 100)"
+        )
+        parser.add_argument('--prefix', default='load', help="Prefix of the generated dataset (default: load)")
+        parser.add_argument('--password', default='loadtest123', help="Password of the generated users")
+        parser.add_argument(
+            '--client-ips',
+            type=int,
+            default=1,
+            help="Distinct client IPs simulated via X-Forwarded-For (default: 1, i.e. shared throttles)"
+        )
+        parser.add_argument(
+            '--slow-clients',
+            type=int,
+            default=0,
+            help="Extra clients trickling leaderboard requests over --slow-seconds (default: 0)"
+        )
+        parser.add_argument(
+            '--slow-seconds',
+            type=float,
+            default=5,
+            help="Seconds a slow client takes to send one request (default: 5)"
+        )
+        parser.add_argument('--timeout', type=float, default=30, help="Request timeout in seconds (default: 30)")
+        parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+        parser.add_argument('--output', help="Write the report as JSON to this file")
+
+    def handle(self, *args, **options):
+        try:
+            mix = parse_mix(options['mix']) if options['mix'] else PROFILES[options['profile']]
+            load_test = LoadTest(
+                url=options['url'],
+                mix=mix,
+                concurrency=options['concurrency'],
+                duration=options['duration'],
+                max_requests=options['requests'],
+                users=options['users'],
+                prefix=options['prefix'],
+                password=options['password'],
+                client_ips=max(options['client_ips'], 1),
+                timeout=options['timeout'],
+                seed=options['seed'],
+                slow_clients=max(options['slow_clients'], 0),
+                slow_seconds=options['slow_seconds']
+            )
+            self.stdout.write(
+                f"Load-testing {options['url']} with {options['concurrency']} players "
+                f"for {options['duration']}s: {mix}"
+            )
+            report = load_test.run()
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        self.stdout.write(
+            f"{'action':<13}{'requests':>9}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}"
+            f"{'max ms':>9}{'errors':>8}{'429':>6}  status codes"
+        )
+        for action, result in report['actions'].items():
+            self.stdout.write(
+                f"{action:<13}{result['requests']:>9}{result['p50_ms']:>9.1f}{result['p90_ms']:>9.1f}"
+                f"{result['p99_ms']:>9.1f}{result['max_ms']:>9.1f}{result['errors']:>8}"
+                f"{result['throttled']:>6}  {result['status_codes']}"
+            )
+
+        summary = (
+            f"{report['requests']} requests in {report['duration_s']}s "
+            f"({report['throughput_rps']} req/s), error rate {report['error_rate']}, "
+            f"{report['throttled']} throttled"
+        )
+        self.stdout.write(self.style.SUCCESS(summary) if not report['errors'] else self.style.WARNING(summary))
+
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(report, file, indent=2)
+            self.stdout.write(f"Report written to {options['output']}")
@@ -0,0 +1,250 @@
+import os
+import glob
+import json
+import time
+import bisect
+import threading
+from collections import defaultdict
+
+from django.conf import settings
+
+
+# Request metrics in Prometheus text format.
+# Every process keeps its own counters & histograms. With METRICS_MULTIPROC_DIR
+# set (multi-worker gunicorn), each process also dumps its metrics to a file
+# in that directory & /metrics sums the files of all processes (gauges too, so
+# pool sizes add up to the totals of all workers). Values read from elsewhere
+# (connection pools) are set by collectors whenever metrics are snapshotted.
+# Files of exited workers are folded into an archive by mark_process_dead().
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+METRICS = {
+    # name: (type, help, histogram buckets)
+    'http_requests_total': (
+        'counter', 'HTTP requests by URL name, method & status code', None
+    ),
+    'http_request_duration_seconds': (
+        'histogram', 'HTTP request latency by URL name & method', LATENCY_BUCKETS
+    ),
+    'http_request_db_queries': (
+        'histogram', 'Database queries per HTTP request by URL name', QUERY_COUNT_BUCKETS
+    ),
+    'http_request_db_seconds_total': (
+        'counter', 'Time spent in database queries by URL name', None
+    ),
+    'db_connections_created_total': (
+        'counter', 'Database connections opened by alias (low with persistent or pooled connections)', None
+    ),
+    # Connection pool (DB_POOL), set by collectors when scraped or flushed
+    'db_pool_size': ('gauge', 'Connections held by the pool, idle & in use', None),
+    'db_pool_available': ('gauge', 'Idle connections in the pool', None),
+    'db_pool_max_size': ('gauge', 'Max. connections of the pool', None),
+    'db_pool_requests_waiting': ('gauge', 'Requests waiting for a pool connection', None),
+    'db_pool_requests_total': ('counter', 'Connections requested from the pool', None),
+    'db_pool_requests_queued_total': ('counter', 'Pool requests that had to wait for a connection', None),
+    'db_pool_wait_seconds_total': ('counter', 'Time spent waiting for pool connections', None),
+    'db_pool_errors_total': ('counter', 'Failed pool requests (timeouts & errors)', None),
+}
+
+FLUSH_INTERVAL = 1  # Max. seconds a process' metrics file lags behind
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(float)  # (name, labels) -> value
+        self._histograms = {}  # (name, labels) -> [bucket counts..., sum, count]
+        self._values = {}  # (name, labels) -> value set by collectors
+        self._collectors = []
+        self._last_flush = 0
+
+    def add_collector(self, collector):
+        # collector(registry) sets current values with set_value()
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def set_value(self, name, labels, value):
+        with self._lock:
+            self._values[(name, labels)] = value
+
+    def inc(self, name, labels, value=1):
+        with self._lock:
+            self._counters[(name, labels)] += value
+
+    def observe(self, name, labels, value):
+        buckets = METRICS[name][2]
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[(name, labels)] = [0] * (len(buckets) + 2)
+            # Non-cumulative bucket counts; cumulated when rendered
+            index = bisect.bisect_left(buckets, value)
+            if index < len(buckets):
+                histogram[index] += 1
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def observe_request(self, view, method, status_code, seconds, queries, db_seconds):
+        self.inc('http_requests_total', (('view', view), ('method', method), ('status', str(status_code))))
+        self.observe('http_request_duration_seconds', (('view', view), ('method', method)), seconds)
+        self.observe('http_request_db_queries', (('view', view),), queries)
+        self.inc('http_request_db_seconds_total', (('view', view),), db_seconds)
+        self.maybe_flush()
+
+    def snapshot(self):
+        # JSON-serializable copy of all metrics
+        for collector in self._collectors:
+            collector(self)
+
+        with self._lock:
+            values = {**self._counters, **self._values}
+            return {
+                'counters': [[name, list(labels), value] for (name, labels), value in values.items()],
+                'histograms': [[name, list(labels), list(values)] for (name, labels), values in self._histograms.items()],
+            }
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._values.clear()
+
+    # Multiprocess mode
+
+    def maybe_flush(self, force=False):
+        directory = getattr(settings, 'METRICS_MULTIPROC_DIR', None)
+        if not directory:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_flush < FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f'metrics_{os.getpid()}.json')
+        temp_path = f'{path}.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump(self.snapshot(), file)
+        os.replace(temp_path, path)  # Readers never see a partial file
+
+    def collect(self):
+        # Metrics of this process, or of all processes in multiprocess mode
+        directory = getattr(settings, 'METRICS_MULTIPROC_DIR', None)
+        if not directory:
+            return self.snapshot()
+
+        self.maybe_flush(force=True)
+        snapshots = []
+        for path in glob.glob(os.path.join(directory, 'metrics_*.json')):
+            try:
+                with open(path) as file:
+                    snapshots.append(json.load(file))
+            except (OSError, ValueError):
+                continue  # Removed or replaced meanwhile
+        return merge_snapshots(snapshots)
+
+
+def merge_snapshots(snapshots):
+    counters, histograms = defaultdict(float), {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot['counters']:
+            counters[(name, _labels(labels))] += value
+        for name, labels, values in snapshot['histograms']:
+            key = (name, _labels(labels))
+            if key in histograms:
+                histograms[key] = [a + b for a, b in zip(histograms[key], values)]
+            else:
+                histograms[key] = list(values)
+
+    return {
+        'counters': [[name, list(labels), value] for (name, labels), value in counters.items()],
+        'histograms': [[name, list(labels), values] for (name, labels), values in histograms.items()],
+    }
+
+
+ARCHIVE_FILE = 'metrics_archive.json'  # Counters & histograms of exited processes
+
+
+def mark_process_dead(pid, directory):
+    # Fold the metrics file of an exited process (gunicorn child_exit hook,
+    # see gunicorn.conf.py) into the archive file: its counters & histograms
+    # keep counting in the totals, its gauges (pool sizes) are dropped.
+    path = os.path.join(directory, f'metrics_{pid}.json')
+    try:
+        with open(path) as file:
+            snapshot = json.load(file)
+    except OSError:
+        return  # Never flushed or already folded
+    except ValueError:
+        os.remove(path)  # Unreadable, would be skipped by every scrape
+        return
+
+    snapshot['counters'] = [
+        entry for entry in snapshot['counters'] if METRICS.get(entry[0], ('counter',))[0] != 'gauge'
+    ]
+    snapshots = [snapshot]
+
+    archive_path = os.path.join(directory, ARCHIVE_FILE)
+    try:
+        with open(archive_path) as file:
+            snapshots.append(json.load(file))
+    except (OSError, ValueError):
+        pass  # First exited process
+
+    temp_path = f'{archive_path}.tmp'
+    with open(temp_path, 'w') as file:
+        json.dump(merge_snapshots(snapshots), file)
+    os.replace(temp_path, archive_path)
+    os.remove(path)
+
+
+def _labels(labels):
+    return tuple(tuple(pair) for pair in labels)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _format_value(value):
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render(snapshot):
+    # Prometheus text exposition format (version 0.0.4)
+    samples = defaultdict(list)
+    for name, labels, value in snapshot['counters']:
+        samples[name].append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+
+    for name, labels, values in snapshot['histograms']:
+        buckets = METRICS[name][2]
+        cumulative = 0
+        for bound, count in zip(buckets, values):
+            cumulative += count
+            samples[name].append(
+                f'{name}_bucket{_format_labels(labels, [("le", _format_value(bound))])} {cumulative}'
+            )
+        samples[name].append(f'{name}_bucket{_format_labels(labels, [("le", "+Inf")])} {values[-1]}')
+        samples[name].append(f'{name}_sum{_format_labels(labels)} {_format_value(values[-2])}')
+        samples[name].append(f'{name}_count{_format_labels(labels)} {values[-1]}')
+
+    lines = []
+    for name, (metric_type, help_text, _) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {metric_type}')
+        lines.extend(samples.get(name, []))
+    return '\n'.join(lines) + '\n'
+
+
+registry = MetricsRegistry()  # Metrics of this process
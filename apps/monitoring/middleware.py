@@ -0,0 +1,127 @@
+import time
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from utils.execute_wrappers import execute_wrapper
+
+from .metrics import registry
+from .queries import QueryInspector, QueryReport, get_query_budget, queries_inspected
+
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+# Methods recorded under their own label; anything else counts as "other"
+KNOWN_METHODS = {'GET', 'HEAD', 'OPTIONS', 'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+def _view_name(request):
+    # URL names keep the label set bounded (unlike raw paths)
+    match = getattr(request, 'resolver_match', None)
+    return match.view_name if match is not None else '<unresolved>'
+
+
+class QueryRecorder:
+    # connection.execute_wrapper counting queries & the time spent in them
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.seconds += time.perf_counter() - start
+
+
+class MetricsMiddleware:
+    # Records latency, status code, DB query count & DB time of every request,
+    # labelled with the resolved URL name (served at /metrics). Keep it first
+    # in MIDDLEWARE so the latency covers the other middleware too.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with execute_wrapper(recorder):
+            response = self.get_response(request)
+        return self.record(request, response, time.perf_counter() - start, recorder)
+
+    async def __acall__(self, request):
+        recorder = QueryRecorder()
+        start = time.perf_counter()
+        with execute_wrapper(recorder):
+            response = await self.get_response(request)
+        return self.record(request, response, time.perf_counter() - start, recorder)
+
+    def record(self, request, response, seconds, recorder):
+        method = request.method if request.method in KNOWN_METHODS else 'other'
+        registry.observe_request(
+            _view_name(request), method, response.status_code, seconds,
+            recorder.count, recorder.seconds
+        )
+        return response
+
+
+class QueryInspectorMiddleware:
+    # Dev/test aid (QUERY_INSPECTOR_ENABLED): fingerprints the SQL of every
+    # request, logs repeated query shapes (N+1) with a stack sample & requests
+    # over their view's "query_budget", adds X-Query-Count / X-Query-Budget
+    # headers & sends the report with the queries_inspected signal
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not getattr(settings, 'QUERY_INSPECTOR_ENABLED', False):
+            return self.get_response(request)
+
+        report = QueryReport(view=None, method=request.method)
+        with execute_wrapper(QueryInspector(report)):
+            response = self.get_response(request)
+        return self.inspect(request, response, report)
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'QUERY_INSPECTOR_ENABLED', False):
+            return await self.get_response(request)
+
+        report = QueryReport(view=None, method=request.method)
+        with execute_wrapper(QueryInspector(report)):
+            response = await self.get_response(request)
+        return self.inspect(request, response, report)
+
+    def inspect(self, request, response, report):
+        report.view = _view_name(request)
+        match = getattr(request, 'resolver_match', None)
+        if match is not None:
+            report.budget = get_query_budget(match.func, request.method)
+
+        response['X-Query-Count'] = str(report.count)
+        if report.budget is not None:
+            response['X-Query-Budget'] = str(report.budget)
+
+        if report.over_budget or report.repeated():
+            logger.warning(f"Query inspector: {report.describe()}")
+
+        queries_inspected.send(sender=self.__class__, request=request, report=report)
+        return response
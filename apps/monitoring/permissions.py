@@ -0,0 +1,17 @@
+import hmac
+
+from django.conf import settings
+from rest_framework import permissions
+
+
+class HasMetricsToken(permissions.BasePermission):
+    # Allow scrapers sending "Authorization: Bearer <METRICS_TOKEN>".
+    # Without a METRICS_TOKEN everyone is allowed, unless METRICS_REQUIRE_TOKEN
+    # is set (production settings), which then denies every scrape
+    def has_permission(self, request, view):
+        token = getattr(settings, 'METRICS_TOKEN', '')
+        if not token:
+            return not getattr(settings, 'METRICS_REQUIRE_TOKEN', False)
+
+        header = request.META.get('HTTP_AUTHORIZATION', '')
+        return hmac.compare_digest(header.encode(), f'Bearer {token}'.encode())
@@ -0,0 +1,111 @@
+import re
+import time
+import traceback
+from collections import Counter
+
+from django.conf import settings
+from django.dispatch import Signal
+
+
+# SQL fingerprinting & N+1 detection.
+# A fingerprint is the shape of a query: literals & parameters replaced by
+# "?" & IN lists collapsed, so "WHERE id = 1" & "WHERE id = 2" match. The same
+# shape repeated QUERY_REPEAT_THRESHOLD+ times in one request is typically a
+# query per row (N+1), e.g. a nested serializer reading a foreign key that
+# was not select_related.
+DEFAULT_REPEAT_THRESHOLD = 3
+STACK_SAMPLE_DEPTH = 6  # Project frames kept per stack sample
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDER = re.compile(r'%s|\?')
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*\?\s*,?)+\)', re.IGNORECASE)
+_WHITESPACE = re.compile(r'\s+')
+
+# Sent at the end of each inspected request with its QueryReport
+queries_inspected = Signal()
+
+
+def fingerprint_sql(sql):
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _PLACEHOLDER.sub('?', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _WHITESPACE.sub(' ', sql).strip()
+
+
+def get_query_budget(view_func, method):
+    # A view's "query_budget": max. queries per request, as an int or a
+    # {method: int} dict (None if the view declares no budget)
+    view_class = getattr(view_func, 'view_class', None)
+    budget = getattr(view_class or view_func, 'query_budget', None)
+    if isinstance(budget, dict):
+        return budget.get(method)
+    return budget
+
+
+def _stack_sample():
+    # Innermost frames of project code (no Django, DRF or this module)
+    base_dir = str(settings.BASE_DIR)
+    frames = [
+        frame for frame in traceback.extract_stack()[:-2]
+        if frame.filename.startswith(base_dir)
+        and 'site-packages' not in frame.filename
+        and not frame.filename.endswith(('monitoring/queries.py', 'monitoring/middleware.py'))
+    ]
+    return [
+        f'{frame.filename[len(base_dir) + 1:]}:{frame.lineno} in {frame.name}'
+        for frame in frames[-STACK_SAMPLE_DEPTH:]
+    ]
+
+
+class QueryReport:
+    def __init__(self, view, method, budget=None):
+        self.view = view
+        self.method = method
+        self.budget = budget
+        self.count = 0
+        self.seconds = 0.0
+        self.fingerprints = Counter()
+        self.stacks = {}  # fingerprint -> stack sample of its first repeat
+
+    @property
+    def over_budget(self):
+        return self.budget is not None and self.count > self.budget
+
+    def repeated(self, threshold=None):
+        # {fingerprint: count} of shapes run at least `threshold` times
+        if threshold is None:
+            threshold = getattr(settings, 'QUERY_REPEAT_THRESHOLD', DEFAULT_REPEAT_THRESHOLD)
+        return {
+            fingerprint: count
+            for fingerprint, count in self.fingerprints.most_common()
+            if count >= threshold
+        }
+
+    def describe(self):
+        lines = [f'{self.method} {self.view}: {self.count} queries (budget: {self.budget})']
+        for fingerprint, count in self.repeated().items():
+            lines.append(f'  {count}x {fingerprint}')
+            lines.extend(f'      at {frame}' for frame in self.stacks.get(fingerprint, []))
+        return '\n'.join(lines)
+
+
+class QueryInspector:
+    # connection.execute_wrapper filling a QueryReport
+    def __init__(self, report):
+        self.report = report
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            report = self.report
+            report.count += 1
+            report.seconds += time.perf_counter() - start
+
+            fingerprint = fingerprint_sql(sql)
+            report.fingerprints[fingerprint] += 1
+            if report.fingerprints[fingerprint] == 2:
+                report.stacks[fingerprint] = _stack_sample()  # Only for repeats
@@ -0,0 +1,2 @@
+from .cache_stats import CacheStatsView
+from .metrics import MetricsView
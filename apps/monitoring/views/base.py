@@ -0,0 +1,13 @@
+import logging
+
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from drf_yasg.utils import swagger_auto_schema
+from drf_yasg import openapi
+
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
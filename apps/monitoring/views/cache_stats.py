@@ -0,0 +1,48 @@
+import os
+
+from .base import *
+from utils.cache import get_key_cardinality
+from utils.cache_stats import cache_stats
+
+
+class CacheStatsView(APIView):
+    permission_classes = [IsAdminUser]
+
+    # Get cache statistics per key namespace (this worker process)
+    @swagger_auto_schema(
+        tags=["Monitoring"],
+        operation_id="monitoring_cache_stats",
+        operation_description=(
+            "Get cache hits, misses, sets, evictions, bytes & latency per key "
+            "namespace, plus cached page key cardinality, of the worker process "
+            "serving the request (staff only)"
+        ),
+        responses={
+            200: 'Success: Ok',
+            401: 'Error: Unauthorized',
+            403: 'Error: Forbidden',
+            500: 'Error: Internal server error'
+        }
+    )
+    def get(self, request):
+        try:
+            return Response(
+                {
+                    'pid': os.getpid(),
+                    'namespaces': cache_stats.snapshot(),
+                    'key_cardinality': get_key_cardinality()
+                },
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            # Log the error for debugging
+            logger.error(
+                f"Error in CacheStatsView.get(): {str(e)}",
+                exc_info=True
+            )
+
+            return Response(
+                {"detail": "An error occurred while processing your request."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -0,0 +1,48 @@
+from django.http import HttpResponse
+
+from .base import *
+from ..metrics import registry, render
+from ..permissions import HasMetricsToken
+
+
+class MetricsView(APIView):
+    # Scrapers authenticate with METRICS_TOKEN (not a JWT) & are not throttled
+    authentication_classes = []
+    permission_classes = [HasMetricsToken]
+    throttle_classes = []
+
+    # Get request metrics in Prometheus text format
+    @swagger_auto_schema(
+        tags=["Monitoring"],
+        operation_id="monitoring_metrics",
+        operation_description=(
+            "Get request latency histograms, status codes, DB query counts & "
+            "DB time per URL name in Prometheus text format (summed over all "
+            "worker processes if METRICS_MULTIPROC_DIR is set). Requires "
+            "'Authorization: Bearer <METRICS_TOKEN>' if a token is configured"
+        ),
+        responses={
+            200: 'Success: Ok',
+            403: 'Error: Forbidden',
+            500: 'Error: Internal server error'
+        }
+    )
+    def get(self, request):
+        try:
+            return HttpResponse(
+                render(registry.collect()),
+                content_type='text/plain; version=0.0.4; charset=utf-8',
+                status=status.HTTP_200_OK
+            )
+
+        except Exception as e:
+            # Log the error for debugging
+            logger.error(
+                f"Error in MetricsView.get(): {str(e)}",
+                exc_info=True
+            )
+
+            return Response(
+                {"detail": "An error occurred while processing your request."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
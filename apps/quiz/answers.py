@@ -0,0 +1,53 @@
+import numpy as np
+
+
+# Packed answer storage for quiz attempts.
+# Each answer takes 2 bits (4 answers per byte, lowest bits first) & is
+# aligned with QuizAttempt.question_ids: 0 = unanswered, 1-3 = selected option.
+UNANSWERED = 0
+ANSWERS_PER_BYTE = 4
+
+_SHIFTS = np.array([0, 2, 4, 6], dtype=np.uint8)
+
+
+def pack_answers(options):
+    # Pack a sequence of options (0-3) into bytes
+    data = bytearray((len(options) + ANSWERS_PER_BYTE - 1) // ANSWERS_PER_BYTE)
+    for index, option in enumerate(options):
+        data[index >> 2] |= (int(option) & 0b11) << ((index & 3) * 2)
+    return bytes(data)
+
+
+def unpack_answers(data, count):
+    # Unpack the first `count` options from packed bytes
+    data = bytes(data)
+    return [
+        (data[index >> 2] >> ((index & 3) * 2)) & 0b11 if index >> 2 < len(data) else UNANSWERED
+        for index in range(count)
+    ]
+
+
+def pack_answer_matrix(matrix):
+    # Pack a (rows, width) matrix of options (0-3) into one bytes value per row
+    matrix = np.asarray(matrix, dtype=np.uint8)
+    rows, width = matrix.shape
+    row_bytes = (width + ANSWERS_PER_BYTE - 1) // ANSWERS_PER_BYTE
+    padded = np.zeros((rows, row_bytes * ANSWERS_PER_BYTE), dtype=np.uint8)
+    padded[:, :width] = matrix & 0b11
+
+    packed = (padded.reshape(rows, row_bytes, ANSWERS_PER_BYTE) << _SHIFTS).sum(
+        axis=2, dtype=np.uint8
+    )
+    return [row.tobytes() for row in packed]
+
+
+def unpack_answer_matrix(rows, width):
+    # Unpack many packed answer rows at once into a (len(rows), width) uint8 matrix
+    row_bytes = (width + ANSWERS_PER_BYTE - 1) // ANSWERS_PER_BYTE
+    buffer = np.zeros((len(rows), row_bytes), dtype=np.uint8)
+    for index, data in enumerate(rows):
+        data = bytes(data)[:row_bytes]
+        buffer[index, :len(data)] = np.frombuffer(data, dtype=np.uint8)
+
+    matrix = (buffer[:, :, None] >> _SHIFTS) & 0b11
+    return matrix.reshape(len(rows), row_bytes * ANSWERS_PER_BYTE)[:, :width]
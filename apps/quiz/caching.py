@@ -0,0 +1,153 @@
+import time
+
+from django.core.cache import cache
+
+from .models import Lesson, Question
+
+
+# Namespaced cache invalidation.
+# Every cached content page embeds the version counters of the namespaces it
+# depends on in its key. A write bumps only the affected namespaces, so their
+# old keys are never read again (& expire on their own) while every other
+# cache entry (other subjects, throttle history) stays warm.
+CATALOG_NAMESPACE = 'catalog'  # Subject list
+LEADERBOARD_NAMESPACE = 'leaderboard'  # Global & subject leaderboards (& their stale copies)
+QUESTION_DETAILS_NAMESPACE = 'question-details'  # Every question detail (they nest their lesson & subject)
+
+NAMESPACE_VERSION_TIMEOUT = None  # Version counters never expire
+
+
+def subject_namespace(subject_id):
+    # Lessons of a subject (& everything nesting the subject)
+    return f'subject:{subject_id}'
+
+
+def lesson_namespace(lesson_id):
+    # Questions of a lesson (they nest the lesson & its subject)
+    return f'lesson:{lesson_id}'
+
+
+def question_namespace(question_id):
+    # Detail of a question, keyed without looking up its lesson; lesson &
+    # subject edits bump QUESTION_DETAILS_NAMESPACE instead
+    return f'question:{question_id}'
+
+
+def subject_lesson_namespaces(subject_id):
+    # Namespaces of every lesson within a subject (bumped on subject edits,
+    # so question pages can be keyed by lesson alone)
+    return [
+        lesson_namespace(lesson_id)
+        for lesson_id in Lesson.objects.filter(
+            subject_id=subject_id
+        ).values_list('id', flat=True)
+    ]
+
+
+def _version_key(namespace):
+    return f'ns:{namespace}:version'
+
+
+def _initial_version():
+    # Start from the clock rather than 1, so an evicted counter never
+    # resurrects entries cached under an old version number
+    return int(time.time() * 1000)
+
+
+def get_namespace_versions(*namespaces):
+    # Current versions of the namespaces, joined for use in a cache key
+    keys = [_version_key(namespace) for namespace in namespaces]
+    versions = cache.get_many(keys)
+
+    for key in keys:
+        if key not in versions:
+            version = _initial_version()
+            if not cache.add(key, version, timeout=NAMESPACE_VERSION_TIMEOUT):
+                version = cache.get(key, version)  # Set concurrently by another request
+            versions[key] = version
+
+    return '.'.join(str(versions[key]) for key in keys)
+
+
+def bump_namespaces(*namespaces):
+    # Invalidate everything cached under the namespaces
+    for namespace in namespaces:
+        key = _version_key(namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Counter missing (never read or evicted)
+            cache.set(key, _initial_version(), timeout=NAMESPACE_VERSION_TIMEOUT)
+
+
+# Question banks: IDs of a lesson's questions, sampled by QuizStartView
+QUESTION_BANK_TIMEOUT = 60*15  # 15 minutes
+
+
+def question_bank_key(lesson_id):
+    version = get_namespace_versions(lesson_namespace(lesson_id))
+    return f'quiz:bank:lesson:{lesson_id}:v{version}'
+
+
+def get_question_bank(lesson_id, refresh=False):
+    # Cached list of the lesson's question IDs (rebuilt if refresh=True)
+    cache_key = question_bank_key(lesson_id)
+
+    question_ids = None if refresh else cache.get(cache_key)
+    if question_ids is None:
+        question_ids = list(
+            Question.objects.filter(lesson_id=lesson_id).values_list('id', flat=True)
+        )
+        cache.set(cache_key, question_ids, timeout=QUESTION_BANK_TIMEOUT)
+
+    return question_ids
+
+
+# Negative caching of missing IDs.
+# Lookups of IDs that do not exist (e.g. enumeration by scrapers) are
+# remembered for a short time, so repeated 404s never reach the database.
+# Entries are dropped when an object with the ID is created (see signals.py).
+MISSING_TIMEOUT = 60  # 1 minute
+
+
+def missing_key(model, pk, **scope):
+    # e.g. "missing:quiz.subject:42" or "missing:quiz.quizattempt:7:user:3"
+    key = f'missing:{model._meta.label_lower}:{pk}'
+    for name, value in sorted(scope.items()):
+        key += f':{name}:{getattr(value, "pk", value)}'
+    return key
+
+
+def is_known_missing(model, pk, **scope):
+    return cache.get(missing_key(model, pk, **scope)) is not None
+
+
+def forget_missing(model, pk, **scope):
+    cache.delete(missing_key(model, pk, **scope))
+
+
+def get_existing(queryset, pk, **scope):
+    # queryset.get(id=pk, **scope) raising DoesNotExist straight from the
+    # cache for IDs recently found missing
+    model = queryset.model
+    if is_known_missing(model, pk, **scope):
+        raise model.DoesNotExist(f"{model.__name__} {pk} not found (cached).")
+
+    try:
+        return queryset.get(id=pk, **scope)
+    except model.DoesNotExist:
+        cache.set(missing_key(model, pk, **scope), True, timeout=MISSING_TIMEOUT)
+        raise
+
+
+async def aget_existing(queryset, pk, **scope):
+    # get_existing() for async views, with the async cache & ORM APIs
+    model = queryset.model
+    if await cache.aget(missing_key(model, pk, **scope)) is not None:
+        raise model.DoesNotExist(f"{model.__name__} {pk} not found (cached).")
+
+    try:
+        return await queryset.aget(id=pk, **scope)
+    except model.DoesNotExist:
+        await cache.aset(missing_key(model, pk, **scope), True, timeout=MISSING_TIMEOUT)
+        raise
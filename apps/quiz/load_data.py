@@ -0,0 +1,256 @@
+import io
+import csv
+import json
+from itertools import islice
+
+import numpy as np
+from django.db import connection, transaction
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+
+from .answers import UNANSWERED, pack_answer_matrix
+from .caching import (
+    CATALOG_NAMESPACE,
+    LEADERBOARD_NAMESPACE,
+    QUESTION_DETAILS_NAMESPACE,
+    subject_namespace,
+    lesson_namespace,
+    bump_namespaces
+)
+from .models import Subject, Lesson, Question, QuizAttempt
+
+
+# Synthetic production-scale data for benchmarks & load tests.
+# Everything is derived from one seed, so the same options produce the same
+# rows. Scores follow player skill (Beta distributed) against lesson
+# difficulty; a few players & lessons get most of the traffic (long-tailed
+# activity), like on a real quiz site. User stats (total_played,
+# highest_score) match the generated attempts.
+MAX_QUESTIONS_PER_LESSON = 30  # Same rule as the enforce_question_limit signal
+SERVED_QUESTIONS = 15  # Questions per quiz (see QuizStartView)
+COMPLETED_RATIO = 0.92  # Share of attempts that were submitted
+DEFAULT_BATCH_SIZE = 5000
+DEFAULT_PASSWORD = 'loadtest123'
+
+User = get_user_model()
+
+
+def _batches(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _bulk_create(model, objects, batch_size):
+    count = 0
+    for batch in _batches(objects, batch_size):
+        with transaction.atomic():
+            model.objects.bulk_create(batch, batch_size=batch_size)
+        count += len(batch)
+    return count
+
+
+def _copy_attempts(rows):
+    # PostgreSQL COPY of QuizAttempt rows (much faster than INSERTs)
+    fields = [
+        QuizAttempt._meta.get_field(name) for name in (
+            'user', 'lesson', 'score', 'completed', 'start_time',
+            'question_ids', 'answers', 'option_seed'
+        )
+    ]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for user_id, lesson_id, score, completed, start_time, question_ids, answers, option_seed in rows:
+        writer.writerow([
+            user_id, lesson_id, score, 't' if completed else 'f', start_time.isoformat(),
+            json.dumps(question_ids), '\\x' + answers.hex(), option_seed
+        ])
+    buffer.seek(0)
+
+    columns = ', '.join(connection.ops.quote_name(field.column) for field in fields)
+    table = connection.ops.quote_name(QuizAttempt._meta.db_table)
+    sql = f'COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)'
+    with transaction.atomic(), connection.cursor() as cursor:
+        if hasattr(cursor.cursor, 'copy_expert'):  # psycopg2
+            cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3 (e.g. with DB_POOL)
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+
+
+def clear_load_data(prefix):
+    # Delete the subjects (with their lessons, questions & attempts) & users
+    # generated with the prefix; returns the number of deleted rows
+    subjects = Subject.objects.filter(name__startswith=f'{prefix} subject ')
+    namespaces = [CATALOG_NAMESPACE, LEADERBOARD_NAMESPACE, QUESTION_DETAILS_NAMESPACE]
+    namespaces += [subject_namespace(subject_id) for subject_id in subjects.values_list('id', flat=True)]
+    namespaces += [
+        lesson_namespace(lesson_id)
+        for lesson_id in Lesson.objects.filter(subject__in=subjects).values_list('id', flat=True)
+    ]
+
+    deleted, _ = subjects.delete()
+    deleted += User.objects.filter(username__startswith=f'{prefix}_user_').delete()[0]
+    bump_namespaces(*namespaces)
+    return deleted
+
+
+def generate_load_data(subjects=20, lessons=10, questions=20, users=1000, attempts=100000,
+                       batch_size=DEFAULT_BATCH_SIZE, seed=0, prefix='load',
+                       password=DEFAULT_PASSWORD, use_copy=None, log=None):
+    # Create `subjects` subjects with `lessons` lessons each, `questions`
+    # questions per lesson, `users` players & `attempts` quiz attempts.
+    # use_copy: COPY attempts on PostgreSQL (default: if available).
+    # Returns {model name: rows created}.
+    if not 1 <= questions <= MAX_QUESTIONS_PER_LESSON:
+        raise ValueError(
+            f"Questions per lesson must be between 1 and {MAX_QUESTIONS_PER_LESSON}."
+        )
+    if min(subjects, lessons, users) < 1 or attempts < 0:
+        raise ValueError("Subjects, lessons & users must be at least 1, attempts at least 0.")
+    if Subject.objects.filter(name__startswith=f'{prefix} subject ').exists():
+        raise ValueError(f"Data with the prefix '{prefix}' exists already (clear it first).")
+    if use_copy is None:
+        use_copy = connection.vendor == 'postgresql'
+
+    log = log or (lambda message: None)
+    rng = np.random.default_rng(seed)
+    created = {}
+
+    # Content
+    created['subjects'] = _bulk_create(
+        Subject,
+        (Subject(name=f'{prefix} subject {index:05d}') for index in range(subjects)),
+        batch_size
+    )
+    subject_ids = list(
+        Subject.objects.filter(name__startswith=f'{prefix} subject ').order_by('id').values_list('id', flat=True)
+    )
+    log(f"Created {created['subjects']} subjects")
+
+    created['lessons'] = _bulk_create(
+        Lesson,
+        (
+            Lesson(title=f'Lesson {index:04d}', subject_id=subject_id)
+            for subject_id in subject_ids for index in range(lessons)
+        ),
+        batch_size
+    )
+    lesson_ids = np.array(
+        Lesson.objects.filter(subject_id__in=subject_ids).order_by('id').values_list('id', flat=True)
+    )
+    log(f"Created {created['lessons']} lessons")
+
+    correct_answers = rng.integers(1, 4, size=(len(lesson_ids), questions))
+    created['questions'] = _bulk_create(
+        Question,
+        (
+            Question(
+                text=f'Question {index + 1} of lesson {lesson_id}: which option is correct?',
+                options={'1': 'Option A', '2': 'Option B', '3': 'Option C'},
+                correct_answer=int(correct_answers[lesson_index, index]),
+                lesson_id=lesson_id
+            )
+            for lesson_index, lesson_id in enumerate(lesson_ids.tolist())
+            for index in range(questions)
+        ),
+        batch_size
+    )
+    question_ids = np.array(
+        Question.objects.filter(lesson_id__in=lesson_ids.tolist()).order_by('id').values_list('id', flat=True)
+    ).reshape(len(lesson_ids), questions)  # Created lesson by lesson, in order
+    log(f"Created {created['questions']} questions")
+
+    # Attempt plan: who played which lesson & scored what
+    user_weights = rng.lognormal(0, 1.2, users)
+    lesson_weights = 1 / rng.permutation(np.arange(1, len(lesson_ids) + 1)) ** 0.8
+    skill = rng.beta(4, 2.5, users)
+    difficulty = rng.normal(0, 0.1, len(lesson_ids))
+
+    attempt_users = rng.choice(users, attempts, p=user_weights / user_weights.sum())
+    attempt_lessons = rng.choice(len(lesson_ids), attempts, p=lesson_weights / lesson_weights.sum())
+    completed = rng.random(attempts) < COMPLETED_RATIO
+    served = min(questions, SERVED_QUESTIONS)
+    chance = np.clip(skill[attempt_users] - difficulty[attempt_lessons], 0.05, 0.98)
+    scores = rng.binomial(served, chance) * completed
+
+    # Players, with stats matching their attempts
+    total_played = np.bincount(attempt_users[completed], minlength=users)
+    highest_scores = np.zeros(users, dtype=np.int64)
+    np.maximum.at(highest_scores, attempt_users, scores)
+
+    password_hash = make_password(password)  # Hashed once for every player
+    created['users'] = _bulk_create(
+        User,
+        (
+            User(
+                username=f'{prefix}_user_{index:07d}',
+                password=password_hash,
+                total_played=int(total_played[index]),
+                highest_score=int(highest_scores[index])
+            )
+            for index in range(users)
+        ),
+        batch_size
+    )
+    user_ids = np.array(
+        User.objects.filter(username__startswith=f'{prefix}_user_').order_by('username').values_list('id', flat=True)
+    )
+    log(f"Created {created['users']} users")
+
+    # Attempts, generated & written batch by batch
+    start_time = timezone.now()
+    progress_step = max(attempts // 10, 1)  # Log progress about 10 times
+    created['attempts'] = 0
+    for start in range(0, attempts, batch_size):
+        stop = min(start + batch_size, attempts)
+        size = stop - start
+        batch_lessons = attempt_lessons[start:stop]
+        batch_scores = scores[start:stop]
+
+        # Served questions: a random sample of the lesson's questions
+        positions = rng.random((size, questions)).argsort(axis=1)[:, :served]
+        batch_questions = question_ids[batch_lessons[:, None], positions]
+        batch_correct = correct_answers[batch_lessons[:, None], positions]
+
+        # Exactly `score` answers are correct, the others pick a wrong option
+        ranks = rng.random((size, served)).argsort(axis=1).argsort(axis=1)
+        wrong = (batch_correct - 1 + rng.integers(1, 3, size=(size, served))) % 3 + 1
+        selected = np.where(ranks < batch_scores[:, None], batch_correct, wrong)
+        selected[~completed[start:stop]] = UNANSWERED
+        answers = pack_answer_matrix(selected)
+        option_seeds = rng.integers(0, 2**31, size=size)
+
+        batch = [
+            (
+                int(user_ids[attempt_users[start + row]]), int(lesson_ids[batch_lessons[row]]),
+                int(batch_scores[row]), bool(completed[start + row]), start_time,
+                batch_questions[row].tolist(),
+                answers[row] if completed[start + row] else b'',
+                int(option_seeds[row])
+            )
+            for row in range(size)
+        ]
+
+        if use_copy:
+            _copy_attempts(batch)
+        else:
+            with transaction.atomic():
+                QuizAttempt.objects.bulk_create(
+                    [
+                        QuizAttempt(
+                            user_id=user_id, lesson_id=lesson_id, score=score, completed=is_completed,
+                            question_ids=served_ids, answers=packed, option_seed=option_seed
+                        )
+                        for user_id, lesson_id, score, is_completed, _, served_ids, packed, option_seed in batch
+                    ],
+                    batch_size=batch_size
+                )
+        created['attempts'] += size
+        if stop == attempts or stop // progress_step != start // progress_step:
+            log(f"Created {created['attempts']}/{attempts} attempts")
+
+    # Cached subject lists & leaderboards predate the new subjects & attempts
+    bump_namespaces(CATALOG_NAMESPACE, LEADERBOARD_NAMESPACE)
+    return created
@@ -0,0 +1,88 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.quiz.load_data import (
+    MAX_QUESTIONS_PER_LESSON,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_PASSWORD,
+    clear_load_data,
+    generate_load_data
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a synthetic, production-scale dataset for benchmarks & load "
+        "tests: subjects, lessons, questions, users & quiz attempts with "
+        "realistic score distributions (reproducible with --seed)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subjects', type=int, default=20, help="Number of subjects (default: 20)")
+        parser.add_argument('--lessons', type=int, default=10, help="Lessons per subject (default: 10)")
+        parser.add_argument(
+            '--questions',
+            type=int,
+            default=20,
+            help=f"Questions per lesson (default: 20, max: {MAX_QUESTIONS_PER_LESSON})"
+        )
+        parser.add_argument('--users', type=int, default=1000, help="Number of players (default: 1000)")
+        parser.add_argument('--attempts', type=int, default=100000, help="Number of quiz attempts (default: 100000)")
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows per bulk insert (default: {DEFAULT_BATCH_SIZE})"
+        )
+        parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+        parser.add_argument(
+            '--prefix',
+            default='load',
+            help="Prefix of generated subject names & usernames (default: load)"
+        )
+        parser.add_argument(
+            '--password',
+            default=DEFAULT_PASSWORD,
+            help=f"Password of every generated user (default: {DEFAULT_PASSWORD})"
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help="Delete data generated earlier with the same prefix first"
+        )
+        parser.add_argument(
+            '--no-copy',
+            action='store_true',
+            help="Insert attempts with bulk_create even on PostgreSQL (default: COPY)"
+        )
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        prefix = options['prefix']
+
+        if options['clear']:
+            deleted = clear_load_data(prefix)
+            self.stdout.write(f"Deleted {deleted} rows generated with the prefix '{prefix}'")
+
+        try:
+            created = generate_load_data(
+                subjects=options['subjects'],
+                lessons=options['lessons'],
+                questions=options['questions'],
+                users=options['users'],
+                attempts=options['attempts'],
+                batch_size=options['batch_size'],
+                seed=options['seed'],
+                prefix=prefix,
+                password=options['password'],
+                use_copy=False if options['no_copy'] else None,
+                log=self.stdout.write
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        summary = ', '.join(f"{count} {name}" for name, count in created.items())
+        self.stdout.write(self.style.SUCCESS(
+            f"Generated {summary} in {time.perf_counter() - start:.2f}s"
+        ))
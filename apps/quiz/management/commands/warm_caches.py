@@ -0,0 +1,71 @@
+import os
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.quiz.warmers import (
+    WARMUP_SUBJECT_LIMIT,
+    WARMUP_LESSON_LIMIT,
+    get_warmup_plan,
+    warm_caches
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Warm the API caches after a deploy or restart: subject catalog, "
+        "lesson lists & leaderboards of the most played subjects, question "
+        "pages & question banks of the most played lessons"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--subjects',
+            type=int,
+            default=WARMUP_SUBJECT_LIMIT,
+            help=f"Number of most played subjects to warm (default: {WARMUP_SUBJECT_LIMIT})"
+        )
+        parser.add_argument(
+            '--lessons',
+            type=int,
+            default=WARMUP_LESSON_LIMIT,
+            help=f"Number of most played lessons to warm (default: {WARMUP_LESSON_LIMIT})"
+        )
+        parser.add_argument(
+            '--host',
+            default=os.environ.get('WARM_CACHES_HOST'),
+            help="Public host of the API for the warm requests, e.g. api.example.com (default: WARM_CACHES_HOST)"
+        )
+        parser.add_argument(
+            '--secure',
+            action='store_true',
+            help="Send the warm requests over https"
+        )
+
+    def handle(self, *args, **options):
+        if not options['host']:
+            raise CommandError("--host (or WARM_CACHES_HOST) is required: the public host of the API")
+
+        start = time.perf_counter()
+
+        endpoints, lesson_ids = get_warmup_plan(
+            subject_limit=options['subjects'],
+            lesson_limit=options['lessons']
+        )
+        timings = warm_caches(
+            endpoints,
+            lesson_ids,
+            host=options['host'],
+            secure=options['secure']
+        )
+
+        for target, seconds in timings.items():
+            self.stdout.write(f"{seconds * 1000:8.1f} ms  {target}")
+
+        summary = f"Warmed {len(timings)} targets in {time.perf_counter() - start:.2f}s"
+        failed = len(endpoints) + len(lesson_ids) - len(timings)
+        if failed:
+            # Non-200 responses & errors, so deploy scripts notice
+            raise CommandError(f"{summary}, {failed} targets failed (see logs)")
+
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0002_alter_question_correct_answer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizattempt',
+            name='answers',
+            field=models.BinaryField(blank=True, default=b''),
+        ),
+        migrations.AddField(
+            model_name='quizattempt',
+            name='question_ids',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.7 on 2026-10-19 11:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0003_quizattempt_answers_quizattempt_question_ids'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='quizattempt',
+            name='option_seed',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
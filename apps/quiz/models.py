@@ -80,6 +80,9 @@ class QuizAttempt(models.Model):
     start_time = models.DateTimeField(auto_now_add=True)
     completed = models.BooleanField(default=False)
     lesson = models.ForeignKey(Lesson, on_delete=models.CASCADE)
+    question_ids = models.JSONField(default=list, blank=True)  # Question order served at quiz start
+    answers = models.BinaryField(default=b'', blank=True)  # Submitted options packed 2 bits per question (see answers.py)
+    option_seed = models.PositiveIntegerField(null=True, blank=True)  # Seed of per-question option shuffling (see shuffle.py)
 
     def __str__(self):
         return f"{self.id}. {self.user.username} - {self.score}"
@@ -0,0 +1,153 @@
+import logging
+
+import numpy as np
+
+from django.db import transaction
+from django.db.models import Max, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.contrib.auth import get_user_model
+
+from .answers import UNANSWERED, unpack_answer_matrix
+from .caching import LEADERBOARD_NAMESPACE, bump_namespaces
+from .models import Question, QuizAttempt
+
+
+User = get_user_model()
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+# Number of attempts loaded & scored per batch
+REGRADE_BATCH_SIZE = 5000
+
+
+def score_attempts(question_id_rows, answer_rows, key_ids, key_answers):
+    # Score attempts in bulk against an answer key.
+    # question_id_rows: list of question id lists (attempt question order)
+    # answer_rows: list of packed answers aligned with question_id_rows
+    # key_ids/key_answers: sorted question ids & their correct answers
+    width = max((len(row) for row in question_id_rows), default=0)
+    if width == 0 or len(key_ids) == 0:
+        return np.zeros(len(question_id_rows), dtype=np.int64)
+
+    # Question id matrix padded with 0 (never a valid primary key)
+    id_matrix = np.zeros((len(question_id_rows), width), dtype=np.int64)
+    for index, row in enumerate(question_id_rows):
+        id_matrix[index, :len(row)] = row
+
+    answer_matrix = unpack_answer_matrix(answer_rows, width)
+
+    # Look up every (attempt, position) in the answer key at once
+    positions = np.searchsorted(key_ids, id_matrix)
+    positions = np.clip(positions, 0, len(key_ids) - 1)
+    known = key_ids[positions] == id_matrix
+    correct = (
+        known
+        & (answer_matrix != UNANSWERED)
+        & (answer_matrix == key_answers[positions])
+    )
+    return correct.sum(axis=1)
+
+
+def _regrade_batch(batch, key_ids, key_answers):
+    attempt_ids, user_ids, question_id_rows, answer_rows, old_scores = zip(*batch)
+    scores = score_attempts(
+        list(question_id_rows),
+        list(answer_rows),
+        key_ids,
+        key_answers
+    )
+    changed = np.nonzero(scores != np.asarray(old_scores))[0]
+
+    # Set-based write: one UPDATE ... CASE statement per batch
+    QuizAttempt.objects.bulk_update(
+        [QuizAttempt(id=attempt_ids[i], score=int(scores[i])) for i in changed],
+        ['score'],
+        batch_size=1000
+    )
+    return len(changed), {user_ids[i] for i in changed}
+
+
+def refresh_highest_scores(user_ids):
+    # Recompute highest_score from completed attempts in a single UPDATE
+    best_score = QuizAttempt.objects.filter(
+        user=OuterRef('pk'),
+        completed=True
+    ).values('user').annotate(best=Max('score')).values('best')
+
+    return User.objects.filter(id__in=user_ids).update(
+        highest_score=Coalesce(Subquery(best_score), Value(0))
+    )
+
+
+@transaction.atomic
+def regrade_questions(question_ids):
+    # Recompute scores of all completed attempts that may include the questions.
+    # Returns the number of attempts whose score changed.
+    lesson_ids = set(
+        Question.objects.filter(id__in=question_ids).values_list('lesson_id', flat=True)
+    )
+    if not lesson_ids:
+        return 0
+
+    key = np.array(
+        list(
+            Question.objects.filter(lesson_id__in=lesson_ids)
+            .order_by('id')
+            .values_list('id', 'correct_answer')
+        ),
+        dtype=np.int64
+    ).reshape(-1, 2)
+    key_ids, key_answers = key[:, 0], key[:, 1]
+
+    attempts = QuizAttempt.objects.filter(
+        lesson_id__in=lesson_ids,
+        completed=True
+    ).values_list('id', 'user_id', 'question_ids', 'answers', 'score')
+
+    regraded = 0
+    affected_users = set()
+    batch = []
+    for attempt in attempts.iterator(chunk_size=REGRADE_BATCH_SIZE):
+        if not attempt[2]:
+            continue  # Attempt submitted before answers were stored
+
+        batch.append(attempt)
+        if len(batch) >= REGRADE_BATCH_SIZE:
+            changed, users = _regrade_batch(batch, key_ids, key_answers)
+            regraded += changed
+            affected_users |= users
+            batch = []
+
+    if batch:
+        changed, users = _regrade_batch(batch, key_ids, key_answers)
+        regraded += changed
+        affected_users |= users
+
+    if affected_users:
+        refresh_highest_scores(affected_users)
+        # Cached leaderboards (& their stale copies) hold the old scores; drop
+        # them once the new ones are visible
+        transaction.on_commit(lambda: bump_namespaces(LEADERBOARD_NAMESPACE))
+
+    logger.info(
+        f"Regraded {regraded} quiz attempts for questions {list(question_ids)}"
+    )
+    return regraded
+
+
+def schedule_regrade(question_ids):
+    # Regrade once the answer-key change commits. A failed regrade is logged,
+    # never raised: the edit itself stands & its response is not affected.
+    question_ids = list(question_ids)
+
+    def run():
+        try:
+            regrade_questions(question_ids)
+        except Exception as e:
+            logger.error(
+                f"Regrade of questions {question_ids} failed: {str(e)}",
+                exc_info=True
+            )
+
+    transaction.on_commit(run, robust=True)
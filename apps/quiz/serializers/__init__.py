@@ -1,5 +1,5 @@
 from .subject import SubjectSerializer, SubjectPaginatedResponseSerializer
 from .lesson import LessonSerializer, LessonResponseSerializer, LessonPaginatedResponseSerializer
 from .question import QuestionSerializer, QuestionResponseSerializer, QuestionPaginatedResponseSerializer
-from .quiz import QuizStartResponseSerializer, QuizSubmitSerializer, QuizSubmitResponseSerializer
+from .quiz import QuizStartResponseSerializer, QuizSubmitSerializer, QuizSubmitResponseSerializer, QuizReviewResponseSerializer
 from .leaderboard import LeaderboardResponseSerializer, LeaderboardPaginatedResponseSerializer
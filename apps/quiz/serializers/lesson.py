@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from utils.serializers import SparseFieldsetMixin
+
 from ..models import Lesson
 from .subject import SubjectSerializer
 
@@ -15,7 +17,7 @@ class LessonSerializer(serializers.ModelSerializer):
         fields = ['title']
 
 
-class LessonResponseSerializer(serializers.ModelSerializer):
+class LessonResponseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     subject = SubjectSerializer(read_only=True)
     
     class Meta:
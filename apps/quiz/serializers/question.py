@@ -1,5 +1,7 @@
 from rest_framework import serializers
 
+from utils.serializers import SparseFieldsetMixin
+
 from ..models import Question
 from .lesson import LessonResponseSerializer
 
@@ -32,7 +34,7 @@ class QuestionSerializer(serializers.ModelSerializer):
         return value
 
 
-class QuestionResponseSerializer(serializers.ModelSerializer):
+class QuestionResponseSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     lesson = LessonResponseSerializer(read_only=True)
 
     class Meta:
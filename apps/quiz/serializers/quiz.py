@@ -2,15 +2,36 @@ from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
 
 from ..models import Question, QuizAttempt
-from .question import QuestionResponseSerializer
+from ..shuffle import option_permutation, shuffle_options
 from .lesson import LessonResponseSerializer
 
 
+class QuizQuestionSerializer(serializers.ModelSerializer):
+    # Compact quiz-play question: no lesson & no correct answer
+    class Meta:
+        model = Question
+        fields = ['id', 'text', 'options']
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+
+        # Shuffle options for the quiz attempt (seed passed through context)
+        if 'option_seed' in self.context:
+            permutation = option_permutation(self.context['option_seed'], instance.id)
+            data['options'] = shuffle_options(instance.options, permutation)
+
+        return data
+
+
 class QuizStartResponseSerializer(serializers.Serializer):
     attempt_id = serializers.IntegerField(
         help_text="ID of the created quiz attempt"
     )
-    questions = QuestionResponseSerializer(
+    lesson = LessonResponseSerializer(
+        help_text="Lesson the quiz is played for",
+        read_only=True
+    )
+    questions = QuizQuestionSerializer(
         many=True,
         help_text="List of randomized questions for the quiz",
         read_only=True
@@ -58,3 +79,34 @@ class QuizSubmitResponseSerializer(serializers.ModelSerializer):
     class Meta:
         model = QuizAttempt
         fields = ['id', 'user', 'score', 'start_time', 'completed', 'lesson']
+
+
+
+class QuizReviewQuestionSerializer(serializers.Serializer):
+    question_id = serializers.IntegerField(
+        help_text="ID of the question"
+    )
+    selected_option = serializers.IntegerField(
+        help_text="Option submitted by the player, at its displayed (shuffled) position (null if unanswered)",
+        allow_null=True
+    )
+    correct_answer = serializers.IntegerField(
+        help_text="Correct option, at its displayed (shuffled) position (null if the question was deleted)",
+        allow_null=True
+    )
+    is_correct = serializers.BooleanField(
+        help_text="Whether the submitted option is correct"
+    )
+
+
+class QuizReviewResponseSerializer(serializers.Serializer):
+    attempt_id = serializers.IntegerField(
+        help_text="ID of the quiz attempt"
+    )
+    score = serializers.IntegerField(
+        help_text="Score of the quiz attempt"
+    )
+    questions = QuizReviewQuestionSerializer(
+        many=True,
+        help_text="Per-question review in the order the questions were served"
+    )
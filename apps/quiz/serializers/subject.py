@@ -1,9 +1,11 @@
 from rest_framework import serializers
 
+from utils.serializers import SparseFieldsetMixin
+
 from ..models import Subject
 
 
-class SubjectSerializer(serializers.ModelSerializer):
+class SubjectSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = Subject
         fields = '__all__'
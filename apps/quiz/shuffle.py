@@ -0,0 +1,47 @@
+import random
+from itertools import permutations
+
+
+# Per-attempt option shuffling.
+# The permutation of a question's options is derived from the attempt's
+# option_seed & the question ID, so nothing per question has to be stored:
+# the same permutation is recomputed on submit to map answers back.
+OPTION_PERMUTATIONS = tuple(permutations((1, 2, 3)))  # 6 orders of 3 options
+IDENTITY_PERMUTATION = OPTION_PERMUTATIONS[0]
+
+SEED_BITS = 31  # Fits a PositiveIntegerField on every database backend
+
+
+def new_option_seed():
+    return random.getrandbits(SEED_BITS)
+
+
+def option_permutation(seed, question_id):
+    # Displayed option i shows original option permutation[i - 1]
+    if seed is None:
+        return IDENTITY_PERMUTATION  # Attempts without a seed are not shuffled
+
+    # Cheap integer mix (murmur3 finalizer) of seed & question ID
+    value = (seed ^ (question_id * 0x9E3779B1)) & 0xFFFFFFFF
+    value = ((value ^ (value >> 16)) * 0x85EBCA6B) & 0xFFFFFFFF
+    value = ((value ^ (value >> 13)) * 0xC2B2AE35) & 0xFFFFFFFF
+    value ^= value >> 16
+    return OPTION_PERMUTATIONS[value % len(OPTION_PERMUTATIONS)]
+
+
+def shuffle_options(options, permutation):
+    # Reorder {"1": ..., "2": ..., "3": ...} options for display
+    return {
+        str(position): options[str(original)]
+        for position, original in enumerate(permutation, start=1)
+    }
+
+
+def displayed_option(original, permutation):
+    # Position at which an original option is displayed
+    return permutation.index(original) + 1
+
+
+def original_option(displayed, permutation):
+    # Original option behind a displayed position
+    return permutation[displayed - 1]
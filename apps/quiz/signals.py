@@ -1,8 +1,12 @@
+from functools import partial
+
+from django.db import transaction
 from django.dispatch import receiver
-from django.db.models.signals import pre_save
+from django.db.models.signals import pre_save, post_save
 from django.core.exceptions import ValidationError
 
-from .models import Question
+from .caching import forget_missing
+from .models import Subject, Lesson, Question, QuizAttempt
 
 
 @receiver(pre_save, sender=Question)
@@ -11,3 +15,20 @@ def enforce_question_limit(sender, instance, **kwargs):
         raise ValidationError(
             "A lesson cannot have more than 30 questions."
         )
+
+
+@receiver(post_save, sender=Subject)
+@receiver(post_save, sender=Lesson)
+@receiver(post_save, sender=Question)
+def forget_missing_content(sender, instance, created, **kwargs):
+    # A created ID must not be served from the negative cache. Forgotten once
+    # the row is committed: a lookup from another request before that would
+    # still miss it & cache it as missing again.
+    if created:
+        transaction.on_commit(partial(forget_missing, sender, instance.pk))
+
+
+@receiver(post_save, sender=QuizAttempt)
+def forget_missing_attempt(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(partial(forget_missing, sender, instance.pk, user=instance.user_id))
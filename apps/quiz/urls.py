@@ -1,8 +1,10 @@
+from django.conf import settings
 from django.urls import path
 
 from .views import (
     QuizStartView,
     QuizSubmitView,
+    QuizAttemptReviewView,
     SubjectLeaderboardView,
     GlobalLeaderboardView,
     SubjectListCreateView,
@@ -12,26 +14,36 @@ from .views import (
     QuestionListCreateView,
     QuestionDetailView
 )
+from .views.async_read import ASYNC_READ_VIEWS
+
+
+def read_view(view_class):
+    # GET of the hot read endpoints is served by their async variant under
+    # ASGI (ASYNC_READ_VIEWS), other methods by the DRF view
+    if settings.ASYNC_READ_VIEWS:
+        return ASYNC_READ_VIEWS[view_class].as_view()
+    return view_class.as_view()
 
 
 urlpatterns = [
     # Quiz-Game endpoints
     path('game/start/<int:lesson_id>/', QuizStartView.as_view(), name='quiz_start'),
     path('game/submit-answer/<int:attempt_id>/', QuizSubmitView.as_view(), name='quiz_submit'),
+    path('game/attempts/<int:attempt_id>/review/', QuizAttemptReviewView.as_view(), name='quiz_attempt_review'),
 
     # Quiz-Leaderboard endpoints
-    path('subjects/<int:subject_id>/leaderboard/', SubjectLeaderboardView.as_view(), name='subject_leaderboard'),
-    path('leaderboard/', GlobalLeaderboardView.as_view(), name='global_leaderboard'),
+    path('subjects/<int:subject_id>/leaderboard/', read_view(SubjectLeaderboardView), name='subject_leaderboard'),
+    path('leaderboard/', read_view(GlobalLeaderboardView), name='global_leaderboard'),
 
     # Quiz-Subject endpoints
-    path('subjects/', SubjectListCreateView.as_view(), name='subject_list_create'),
-    path('subjects/<int:subject_id>/', SubjectDetailView.as_view(), name='subject_detail'),
+    path('subjects/', read_view(SubjectListCreateView), name='subject_list_create'),
+    path('subjects/<int:subject_id>/', read_view(SubjectDetailView), name='subject_detail'),
 
     # Quiz-Lesson endpoints
-    path('subjects/<int:subject_id>/lessons/', LessonListCreateView.as_view(), name='lesson_list_create'),
-    path('lessons/<int:lesson_id>/', LessonDetailView.as_view(), name='lesson_detail'),
+    path('subjects/<int:subject_id>/lessons/', read_view(LessonListCreateView), name='lesson_list_create'),
+    path('lessons/<int:lesson_id>/', read_view(LessonDetailView), name='lesson_detail'),
 
     # Quiz-Question endpoints
-    path('lessons/<int:lesson_id>/questions/', QuestionListCreateView.as_view(), name='question_list_create'),
-    path('questions/<int:question_id>/', QuestionDetailView.as_view(), name='question_detail'),
+    path('lessons/<int:lesson_id>/questions/', read_view(QuestionListCreateView), name='question_list_create'),
+    path('questions/<int:question_id>/', read_view(QuestionDetailView), name='question_detail'),
 ]
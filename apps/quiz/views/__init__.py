@@ -1,4 +1,4 @@
-from .quiz import QuizStartView, QuizSubmitView
+from .quiz import QuizStartView, QuizSubmitView, QuizAttemptReviewView
 from .leaderboard import SubjectLeaderboardView, GlobalLeaderboardView
 from .subject import SubjectListCreateView, SubjectDetailView
 from .lesson import LessonListCreateView, LessonDetailView
@@ -0,0 +1,59 @@
+from utils.async_views import AsyncReadView
+
+from .leaderboard import SubjectLeaderboardView, GlobalLeaderboardView
+from .subject import SubjectListCreateView, SubjectDetailView
+from .lesson import LessonListCreateView, LessonDetailView
+from .question import QuestionListCreateView, QuestionDetailView
+
+
+# Async variants of the hot read endpoints (GET only), served under ASGI
+# with ASYNC_READ_VIEWS. Each builds its DRF view's payload with
+# abuild_payload() (payloads.py): the description & error handling its
+# get() uses, through the async ORM & cache APIs.
+
+
+class AsyncSubjectLeaderboardView(AsyncReadView):
+    sync_view = SubjectLeaderboardView
+
+
+class AsyncGlobalLeaderboardView(AsyncReadView):
+    sync_view = GlobalLeaderboardView
+
+
+class AsyncSubjectListView(AsyncReadView):
+    sync_view = SubjectListCreateView
+
+
+class AsyncSubjectDetailView(AsyncReadView):
+    sync_view = SubjectDetailView
+
+
+class AsyncLessonListView(AsyncReadView):
+    sync_view = LessonListCreateView
+
+
+class AsyncLessonDetailView(AsyncReadView):
+    sync_view = LessonDetailView
+
+
+class AsyncQuestionListView(AsyncReadView):
+    sync_view = QuestionListCreateView
+
+
+class AsyncQuestionDetailView(AsyncReadView):
+    sync_view = QuestionDetailView
+
+
+# DRF view -> async variant serving its GET requests
+ASYNC_READ_VIEWS = {
+    view.sync_view: view for view in (
+        AsyncSubjectLeaderboardView,
+        AsyncGlobalLeaderboardView,
+        AsyncSubjectListView,
+        AsyncSubjectDetailView,
+        AsyncLessonListView,
+        AsyncLessonDetailView,
+        AsyncQuestionListView,
+        AsyncQuestionDetailView,
+    )
+}
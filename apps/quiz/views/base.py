@@ -11,8 +11,33 @@ from rest_framework.response import Response
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
+from utils.cache import cache_page_payload, get_page_cache_key
+from utils.serializers import get_sparse_cache_key
+from utils.replicas import ReplicaReadMixin
+from utils.timeouts import StatementTimeout
+
 from ..permissions import IsAdminOrReadOnly
 
 
 # Create a logger instance
 logger = logging.getLogger(__name__)
+
+
+# Sparse fieldset query parameters for content GET endpoints
+fields_parameter = openapi.Parameter(
+    'fields',
+    openapi.IN_QUERY,
+    description="Comma separated fields to return (e.g. id,text)",
+    type=openapi.TYPE_STRING,
+    required=False
+)
+expand_parameter = openapi.Parameter(
+    'expand',
+    openapi.IN_QUERY,
+    description=(
+        "Comma separated relations to return in full (e.g. lesson,subject); "
+        "with fields/expand given, other relations are returned as IDs"
+    ),
+    type=openapi.TYPE_STRING,
+    required=False
+)
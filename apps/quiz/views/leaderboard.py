@@ -1,6 +1,8 @@
 from django.db.models import Max, Avg, Count, F
 
 from .base import *
+from .payloads import ReadPayloadMixin
+from ..caching import LEADERBOARD_NAMESPACE, get_namespace_versions, is_known_missing
 from ..models import Subject, QuizAttempt
 from ..paginators import (
     SubjectLeaderboardPagination,
@@ -12,12 +14,41 @@ from ..serializers import (
 )
 
 
-class SubjectLeaderboardView(APIView):
+def get_leaderboard(limit, **filters):
+    # Top players by high score over their completed attempts
+    return QuizAttempt.objects.filter(
+        completed=True,
+        **filters
+    ).values(username=F('user__username')).annotate(
+        high_score=Max('score'),
+        avg_score=Avg('score'),
+        total_played=Count('id')
+    ).order_by('-high_score')[:limit]
+
+
+class SubjectLeaderboardView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [AllowAny]
     pagination_class = SubjectLeaderboardPagination
-
-    def get_cache_key(self, subject_id, page_number, page_size):
-        return f'leaderboard:subject:{subject_id}:page:{page_number}:size:{page_size}'
+    payload_serializer_class = LeaderboardResponseSerializer
+    payload_lookup = (Subject, 'subject_id')  # Missing subjects: 404
+    query_budget = {'GET': 4}  # Max. queries per request, incl. the JWT user lookup
+    statement_timeout = {'GET': 2}  # Seconds per query, so the aggregate never hogs a connection
+
+    def get_payload_queryset(self, subject, context):
+        return get_leaderboard(10, lesson__subject=subject)  # Filter by subject through lesson
+
+    def get_cache_key(self, request, subject_id):
+        # Canonical key of the requested page (None for invalid pages &
+        # subjects known to be missing)
+        if is_known_missing(Subject, subject_id):
+            return None
+
+        version = get_namespace_versions(LEADERBOARD_NAMESPACE)
+        return get_page_cache_key(
+            f'leaderboard:subject:{subject_id}:v{version}',
+            request,
+            self.pagination_class
+        )
 
     # Get subject-specific leaderboard (top 10)
     @swagger_auto_schema(
@@ -58,82 +89,33 @@ class SubjectLeaderboardView(APIView):
             400: 'Error: Bad request',
             404: 'Error: Not found',
             429: 'Error: Too many requests',
-            500: 'Error: Internal server error'
+            500: 'Error: Internal server error',
+            503: 'Error: Service unavailable (query timed out, retry later)'
         }
     )
+    @cache_page_payload(timeout=60, stale_timeout=3600)  # Cache serialized page for 1 minute, keep a stale copy for 1 hour
     def get(self, request, subject_id):
-        try:
-            # Check if the subject exists
-            subject = Subject.objects.get(id=subject_id)  
-
-            # Get current page from request
-            page_number = request.query_params.get('page', 1)
-
-            # Get page size from request, default to the pagination class default
-            page_size = request.query_params.get(
-                'page_size',
-                self.pagination_class.page_size
-            )
-
-            cache_key = self.get_cache_key(subject_id, page_number, page_size)  # Unique key for caching leaderboard data
-            leaderboard_data = cache.get(cache_key)  # Try getting cached data
+        return self.build_payload(request, subject_id=subject_id)
 
-            if not leaderboard_data:
-                leaderboard_data = QuizAttempt.objects.filter(
-                    lesson__subject=subject,  # Filter by subject through lesson
-                    completed=True
-                ).values(username=F('user__username')).annotate(
-                    high_score=Max('score'),
-                    avg_score=Avg('score'),
-                    total_played=Count('id')
-                ).order_by('-high_score')[:10]
-
-                cache.set(cache_key, leaderboard_data, timeout=60)  # Cache for 1 minute
-
-            # Enforce pagination
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(leaderboard_data, request)
-            if page is not None:
-                serializer = LeaderboardResponseSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
-            
-            # If pagination is not applied, throw an error
-            return Response(
-                {"error": "Pagination is required for this endpoint."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        except Subject.DoesNotExist:
-            return Response(
-                {"detail": "Subject not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except NotFound as e:
-            return Response(
-                {"detail": str(e)},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in SubjectLeaderboardView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
 
-
-class GlobalLeaderboardView(APIView):
+class GlobalLeaderboardView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [AllowAny]
     pagination_class = GlobalLeaderboardPagination
-
-    def get_cache_key(self, page_number, page_size):
-        return f'leaderboard:global:page:{page_number}:size:{page_size}'
+    payload_serializer_class = LeaderboardResponseSerializer
+    query_budget = {'GET': 3}  # Max. queries per request, incl. the JWT user lookup
+    statement_timeout = {'GET': 3}  # Seconds per query, so the aggregate never hogs a connection
+
+    def get_payload_queryset(self, parent, context):
+        return get_leaderboard(25)
+
+    def get_cache_key(self, request):
+        # Canonical key of the requested page (None for invalid pages)
+        version = get_namespace_versions(LEADERBOARD_NAMESPACE)
+        return get_page_cache_key(
+            f'leaderboard:global:v{version}',
+            request,
+            self.pagination_class
+        )
 
     # Get global leaderboard (top 25) accross all lessons
     @swagger_auto_schema(
@@ -169,61 +151,10 @@ class GlobalLeaderboardView(APIView):
             400: 'Error: Bad request',
             404: 'Error: Not found',
             429: 'Error: Too many requests',
-            500: 'Error: Internal server error'
+            500: 'Error: Internal server error',
+            503: 'Error: Service unavailable (query timed out, retry later)'
         }
     )
+    @cache_page_payload(timeout=60, stale_timeout=3600)  # Cache serialized page for 1 minute, keep a stale copy for 1 hour
     def get(self, request):
-        try:
-            # Get current page from request
-            page_number = request.query_params.get('page', 1)
-
-            # Get page size from request, default to the pagination class default
-            page_size = request.query_params.get(
-                'page_size',
-                self.pagination_class.page_size
-            )
-
-            cache_key = self.get_cache_key(page_number, page_size)  # Unique key for caching leaderboard data
-            leaderboard_data = cache.get(cache_key)  # Try getting cached data
-
-            if not leaderboard_data:
-                leaderboard_data = QuizAttempt.objects.filter(
-                    completed=True
-                ).values(username=F('user__username')).annotate(
-                    high_score=Max('score'),
-                    avg_score=Avg('score'),
-                    total_played=Count('id')
-                ).order_by('-high_score')[:25]
-
-                cache.set(cache_key, leaderboard_data, timeout=60)  # Cache for 1 minute
-
-            # Enforce pagination
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(leaderboard_data, request)
-            if page is not None:
-                serializer = LeaderboardResponseSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
-
-            # If paginaation is not applied, throw an error
-            return Response(
-                {"error": "Pagination is required for this endpoint."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        except NotFound as e:
-            return Response(
-                {"detail": str(e)},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in GlobalLeaderboardView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request)
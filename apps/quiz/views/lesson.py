@@ -1,7 +1,18 @@
 from django.db.utils import IntegrityError
 
 from .base import *
+from .payloads import ReadPayloadMixin
+from ..caching import (
+    LEADERBOARD_NAMESPACE,
+    QUESTION_DETAILS_NAMESPACE,
+    subject_namespace,
+    lesson_namespace,
+    get_namespace_versions,
+    bump_namespaces,
+    is_known_missing
+)
 from ..models import Subject, Lesson
+from ..warmers import schedule_lesson_warmup
 from ..paginators import LessonListPagination
 from ..serializers import (
     LessonSerializer,
@@ -10,12 +21,33 @@ from ..serializers import (
 )
 
 
-class LessonListCreateView(APIView):
+class LessonListCreateView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [IsAdminOrReadOnly]
     pagination_class = LessonListPagination
+    payload_serializer_class = LessonResponseSerializer
+    payload_lookup = (Subject, 'subject_id')  # Missing subjects: 404
+    query_budget = {'GET': 4, 'POST': 3}  # Max. queries per request, incl. the JWT user lookup
+
+    def get_payload_queryset(self, subject, context):
+        # Load only the columns & relations the response needs
+        return LessonResponseSerializer.optimize_queryset(
+            Lesson.objects.filter(subject=subject),
+            context
+        )
     
-    def get_cache_key(self, subject_id, page_number, page_size):
-        return f'lessons:subject:{subject_id}:page:{page_number}:size:{page_size}'
+    def get_cache_key(self, request, subject_id):
+        # Canonical key of the requested page (None for invalid pages &
+        # subjects known to be missing)
+        if is_known_missing(Subject, subject_id):
+            return None
+
+        version = get_namespace_versions(subject_namespace(subject_id))
+        return get_page_cache_key(
+            f'lessons:subject:{subject_id}:v{version}',
+            request,
+            self.pagination_class,
+            extra=get_sparse_cache_key(request, LessonResponseSerializer)
+        )
 
     # Get/retrieve all lessons for a subject
     @swagger_auto_schema(
@@ -46,7 +78,9 @@ class LessonListCreateView(APIView):
                 ),
                 type=openapi.TYPE_INTEGER,
                 required=False
-            )
+            ),
+            fields_parameter,
+            expand_parameter
         ],
         responses={
             200: openapi.Response(
@@ -59,64 +93,9 @@ class LessonListCreateView(APIView):
             500: 'Error: Internal server error'
         }
     )
+    @cache_page_payload(timeout=60*15)  # Cache serialized pages for 15 minutes
     def get(self, request, subject_id):
-        try:
-            # Check if the subject exists
-            subject = Subject.objects.get(id=subject_id)  
-
-            # Get current page from request
-            page_number = request.query_params.get('page', 1)
-
-            # Get page size from request, default to the pagination class default
-            page_size = request.query_params.get(
-                'page_size',
-                self.pagination_class.page_size
-            )
-
-            cache_key = self.get_cache_key(subject_id, page_number, page_size)  # Unique key for caching lessons
-            lessons = cache.get(cache_key)  # Try getting cached data
-
-            if not lessons:  # If empty cache
-                lessons = Lesson.objects.filter(subject=subject)
-
-                cache.set(cache_key, lessons, timeout=60*15)  # Cache for 15 minutes
-
-            # Enforce pagination
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(lessons, request)
-            if page is not None:
-                serializer = LessonResponseSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
-            
-            # If pagination is not applied, throw an error
-            return Response(
-                {"error": "Pagination is required for this endpoint."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        except Subject.DoesNotExist:
-            return Response(
-                {"detail": "Subject not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except NotFound as e:
-            return Response(
-                {"detail": str(e)},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in LessonListCreateView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request, subject_id=subject_id)
 
     # Create a new lesson within a subject
     @swagger_auto_schema(
@@ -154,7 +133,8 @@ class LessonListCreateView(APIView):
             serializer.is_valid(raise_exception=True)
             lesson = serializer.save(subject=subject)
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(subject_namespace(subject.id))  # Invalidate the subject's lesson pages
+            schedule_lesson_warmup(request, subject.id, lesson.id)  # Rebuild them after commit
 
             return Response(
                 LessonResponseSerializer(lesson).data,
@@ -192,8 +172,19 @@ class LessonListCreateView(APIView):
             )
 
 
-class LessonDetailView(APIView):
+class LessonDetailView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [IsAdminOrReadOnly]
+    payload_serializer_class = LessonResponseSerializer
+    payload_lookup = (Lesson, 'lesson_id')
+    query_budget = {'GET': 2, 'PUT': 4, 'PATCH': 4, 'DELETE': 5}  # Max. queries per request, incl. the JWT user lookup
+
+    def get_cache_key(self, request, lesson_id):
+        # Lesson namespaces are bumped on subject edits too (nested subject)
+        if is_known_missing(Lesson, lesson_id):
+            return None
+
+        version = get_namespace_versions(lesson_namespace(lesson_id))
+        return f'lessons:detail:{lesson_id}:v{version}{get_sparse_cache_key(request, LessonResponseSerializer)}'
 
     # Get/retrieve a lesson by ID
     @swagger_auto_schema(
@@ -207,6 +198,8 @@ class LessonDetailView(APIView):
                 type=openapi.TYPE_INTEGER,
                 required=True
             ),
+            fields_parameter,
+            expand_parameter
         ],
         responses={
             200: openapi.Response(
@@ -218,31 +211,9 @@ class LessonDetailView(APIView):
             500: 'Error: Internal server error'
         }
     )
+    @cache_page_payload(timeout=60*15)  # Cache serialized payloads for 15 minutes
     def get(self, request, lesson_id):
-        try:
-            lesson = Lesson.objects.get(id=lesson_id)
-            return Response(
-                LessonResponseSerializer(lesson).data,
-                status=status.HTTP_200_OK
-            )
-        
-        except Lesson.DoesNotExist:
-            return Response(
-                {"detail": "Lesson not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in LessonDetailView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request, lesson_id=lesson_id)
 
     # Update a lesson by ID using PUT method
     @swagger_auto_schema(
@@ -279,7 +250,12 @@ class LessonDetailView(APIView):
             serializer.is_valid(raise_exception=True)
             lesson = serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                subject_namespace(lesson.subject_id),
+                lesson_namespace(lesson.id),
+                QUESTION_DETAILS_NAMESPACE
+            )  # Invalidate pages showing the lesson
+            schedule_lesson_warmup(request, lesson.subject_id, lesson.id)  # Rebuild them after commit
 
             return Response(
                 LessonResponseSerializer(lesson).data,
@@ -351,7 +327,12 @@ class LessonDetailView(APIView):
             serializer.is_valid(raise_exception=True)
             lesson = serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                subject_namespace(lesson.subject_id),
+                lesson_namespace(lesson.id),
+                QUESTION_DETAILS_NAMESPACE
+            )  # Invalidate pages showing the lesson
+            schedule_lesson_warmup(request, lesson.subject_id, lesson.id)  # Rebuild them after commit
 
             return Response(
                 LessonResponseSerializer(lesson).data,
@@ -415,7 +396,13 @@ class LessonDetailView(APIView):
             lesson = Lesson.objects.get(id=lesson_id)
             lesson.delete()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                subject_namespace(lesson.subject_id),
+                lesson_namespace(lesson_id),  # lesson.id is reset by delete()
+                QUESTION_DETAILS_NAMESPACE,
+                LEADERBOARD_NAMESPACE  # Its quiz attempts are deleted with it
+            )  # Invalidate pages showing the lesson
+            schedule_lesson_warmup(request, lesson.subject_id)  # Rebuild the lesson list after commit
             return Response(status=status.HTTP_204_NO_CONTENT)
         
         except Lesson.DoesNotExist:
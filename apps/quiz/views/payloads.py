@@ -0,0 +1,111 @@
+from utils.async_views import apaginate
+
+from .base import *
+from ..caching import get_existing, aget_existing
+
+
+class ReadPayloadMixin:
+    # Uncached GET payload of a list or detail view, built by its get()
+    # (build_payload) & by its async variant (abuild_payload, see
+    # async_read.py) from one description, so both run the same queries &
+    # return the same payloads & error responses:
+    #   payload_serializer_class: serializes the object or the page rows
+    #   payload_lookup: (model, URL kwarg) of the object fetched first with
+    #     get_existing(): the parent of a list, or the object of a detail
+    #     payload (loaded with the serializer's optimize_queryset()); a
+    #     missing ID answers 404 "<Model> not found."
+    #   get_payload_queryset(parent, context): rows of the paginated list
+    #     (pagination_class); detail views leave it None
+    payload_serializer_class = None
+    payload_lookup = None
+    get_payload_queryset = None
+
+    def build_payload(self, request, **kwargs):
+        try:
+            context = {'request': request}
+            instance = None
+            if self.payload_lookup is not None:
+                kwarg = self.payload_lookup[1]
+                instance = get_existing(self.get_lookup_queryset(context), kwargs[kwarg])  # Missing IDs are cached briefly
+
+            if self.get_payload_queryset is None:
+                return self.detail_response(instance, context)
+
+            # Enforce pagination
+            paginator = self.pagination_class()
+            page = paginator.paginate_queryset(self.get_payload_queryset(instance, context), request)
+            return self.page_response(paginator, page, context)
+
+        except Exception as e:
+            return self.payload_error_response(e)
+
+    async def abuild_payload(self, request, **kwargs):
+        # build_payload() with the async ORM & cache APIs
+        try:
+            context = {'request': request}
+            instance = None
+            if self.payload_lookup is not None:
+                kwarg = self.payload_lookup[1]
+                instance = await aget_existing(self.get_lookup_queryset(context), kwargs[kwarg])
+
+            if self.get_payload_queryset is None:
+                return self.detail_response(instance, context)
+
+            paginator = self.pagination_class()
+            page = await apaginate(paginator, self.get_payload_queryset(instance, context), request)
+            return self.page_response(paginator, page, context)
+
+        except Exception as e:
+            return self.payload_error_response(e)
+
+    def get_lookup_queryset(self, context):
+        model = self.payload_lookup[0]
+        if self.get_payload_queryset is None:
+            # Load only the columns & relations the response needs
+            return self.payload_serializer_class.optimize_queryset(model.objects.all(), context)
+        return model.objects.all()
+
+    def detail_response(self, instance, context):
+        return Response(
+            self.payload_serializer_class(instance, context=context).data,
+            status=status.HTTP_200_OK
+        )
+
+    def page_response(self, paginator, page, context):
+        if page is not None:
+            serializer = self.payload_serializer_class(page, many=True, context=context)
+            return paginator.get_paginated_response(serializer.data)
+
+        # If pagination is not applied, throw an error
+        return Response(
+            {"error": "Pagination is required for this endpoint."},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    def payload_error_response(self, error):
+        # Called within the except block of the payload builders
+        if self.payload_lookup is not None and isinstance(error, self.payload_lookup[0].DoesNotExist):
+            return Response(
+                {"detail": f"{self.payload_lookup[0].__name__} not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if isinstance(error, NotFound):
+            return Response(
+                {"detail": str(error)},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if isinstance(error, StatementTimeout):
+            raise error  # Served from the stale copy, or as a 503 with Retry-After
+
+        # Log the error for debugging
+        logger.error(
+            f"Error in {type(self).__name__}.get(): {str(error)}",
+            exc_info=True
+        )
+
+        return Response(
+            {"detail": "An error occurred while processing your request."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
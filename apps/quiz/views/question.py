@@ -1,7 +1,18 @@
 from django.core.exceptions import ValidationError as DjangoValidationError
 
 from .base import *
+from .payloads import ReadPayloadMixin
+from ..caching import (
+    QUESTION_DETAILS_NAMESPACE,
+    lesson_namespace,
+    question_namespace,
+    get_namespace_versions,
+    bump_namespaces,
+    is_known_missing
+)
 from ..models import Lesson, Question
+from ..regrade import schedule_regrade
+from ..warmers import schedule_question_warmup
 from ..paginators import QuestionListPagination
 from ..serializers import (
     QuestionSerializer,
@@ -10,12 +21,33 @@ from ..serializers import (
 )
 
 
-class QuestionListCreateView(APIView):
+class QuestionListCreateView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [IsAdminOrReadOnly]
     pagination_class = QuestionListPagination
+    payload_serializer_class = QuestionResponseSerializer
+    payload_lookup = (Lesson, 'lesson_id')  # Missing lessons: 404
+    query_budget = {'GET': 4, 'POST': 5}  # Max. queries per request, incl. the JWT user lookup
+
+    def get_payload_queryset(self, lesson, context):
+        # Load only the columns & relations the response needs
+        return QuestionResponseSerializer.optimize_queryset(
+            Question.objects.filter(lesson=lesson),
+            context
+        )
     
-    def get_cache_key(self, lesson_id, page_number, page_size):
-        return f'questions:lesson:{lesson_id}:page:{page_number}:size:{page_size}'
+    def get_cache_key(self, request, lesson_id):
+        # Canonical key of the requested page (None for invalid pages &
+        # lessons known to be missing)
+        if is_known_missing(Lesson, lesson_id):
+            return None
+
+        version = get_namespace_versions(lesson_namespace(lesson_id))
+        return get_page_cache_key(
+            f'questions:lesson:{lesson_id}:v{version}',
+            request,
+            self.pagination_class,
+            extra=get_sparse_cache_key(request, QuestionResponseSerializer)
+        )
 
     # Get/retrieve all questions for a lesson
     @swagger_auto_schema(
@@ -46,7 +78,9 @@ class QuestionListCreateView(APIView):
                 ),
                 type=openapi.TYPE_INTEGER,
                 required=False
-            )
+            ),
+            fields_parameter,
+            expand_parameter
         ],
         responses={
             200: openapi.Response(
@@ -59,64 +93,9 @@ class QuestionListCreateView(APIView):
             500: 'Error: Internal server error'
         }
     )
+    @cache_page_payload(timeout=60*15)  # Cache serialized pages for 15 minutes
     def get(self, request, lesson_id):
-        try:
-            # Check if the lesson exists
-            lesson = Lesson.objects.get(id=lesson_id)  
-
-            # Get current page from request
-            page_number = request.query_params.get('page', 1)
-
-            # Get page size from request, default to the pagination class default
-            page_size = request.query_params.get(
-                'page_size',
-                self.pagination_class.page_size
-            )
-            
-            cache_key = self.get_cache_key(lesson_id, page_number, page_size)  # Unique key for caching questions
-            questions = cache.get(cache_key)  # Try getting cached data
-
-            if not questions:  # If empty cache
-                questions = Question.objects.filter(lesson=lesson)
-
-                cache.set(cache_key, questions, timeout=60*15)  # Cache for 15 minutes
-
-            # Enforce pagination
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(questions, request)
-            if page is not None:
-                serializer = QuestionResponseSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
-            
-            # If pagination is not applied, throw an error
-            return Response(
-                {"error": "Pagination is required for this endpoint."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        except Lesson.DoesNotExist:
-            return Response(
-                {"detail": "Lesson not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except NotFound as e:
-            return Response(
-                {"detail": str(e)},
-                status=status.HTTP_404_NOT_FOUND
-            )
-
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in QuestionListCreateView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request, lesson_id=lesson_id)
 
     # Create a new question within a lesson
     @swagger_auto_schema(
@@ -186,7 +165,8 @@ class QuestionListCreateView(APIView):
             serializer.is_valid(raise_exception=True)
             question = serializer.save(lesson=lesson)
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(lesson_namespace(question.lesson_id))  # Invalidate the lesson's question pages
+            schedule_question_warmup(request, question.lesson_id, question.id)  # Rebuild them after commit
 
             return Response(
                 QuestionResponseSerializer(question).data,
@@ -224,8 +204,20 @@ class QuestionListCreateView(APIView):
             )
 
 
-class QuestionDetailView(APIView):
+class QuestionDetailView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [IsAdminOrReadOnly]
+    payload_serializer_class = QuestionResponseSerializer
+    payload_lookup = (Question, 'question_id')
+    query_budget = {'GET': 2, 'PUT': 6, 'PATCH': 6, 'DELETE': 3}  # Max. queries per request, incl. the JWT user lookup
+
+    def get_cache_key(self, request, question_id):
+        # Versioned by the question & by lesson/subject edits (nested), so no
+        # lookup of its lesson is needed
+        if is_known_missing(Question, question_id):
+            return None
+
+        version = get_namespace_versions(QUESTION_DETAILS_NAMESPACE, question_namespace(question_id))
+        return f'questions:detail:{question_id}:v{version}{get_sparse_cache_key(request, QuestionResponseSerializer)}'
 
     # Get/retrieve a question by ID
     @swagger_auto_schema(
@@ -239,6 +231,8 @@ class QuestionDetailView(APIView):
                 type=openapi.TYPE_INTEGER,
                 required=True
             ),
+            fields_parameter,
+            expand_parameter
         ],
         responses={
             200: openapi.Response(
@@ -250,31 +244,9 @@ class QuestionDetailView(APIView):
             500: 'Error: Internal server error'
         }
     )
+    @cache_page_payload(timeout=60*15)  # Cache serialized payloads for 15 minutes
     def get(self, request, question_id):
-        try:
-            question = Question.objects.get(id=question_id)
-            return Response(
-                QuestionResponseSerializer(question).data,
-                status=status.HTTP_200_OK
-            )
-        
-        except Question.DoesNotExist:
-            return Response(
-                {"detail": "Question not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in QuestionDetailView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request, question_id=question_id)
 
     # Update a question by ID using PUT method
     @swagger_auto_schema(
@@ -337,12 +309,22 @@ class QuestionDetailView(APIView):
     def put(self, request, question_id):
         try:
             question = Question.objects.get(id=question_id)
+            previous_answer = question.correct_answer
 
             serializer = QuestionSerializer(question, data=request.data)
             serializer.is_valid(raise_exception=True)
             question = serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                lesson_namespace(question.lesson_id),
+                question_namespace(question.id)
+            )  # Invalidate the lesson's question pages & the question's detail
+            schedule_question_warmup(request, question.lesson_id, question.id)  # Rebuild them after commit
+
+            # Regrade past attempts if the correct answer was fixed (after
+            # commit, once the caches are handled; failures are only logged)
+            if question.correct_answer != previous_answer:
+                schedule_regrade([question.id])
 
             return Response(
                 QuestionResponseSerializer(question).data,
@@ -440,12 +422,22 @@ class QuestionDetailView(APIView):
     def patch(self, request, question_id):
         try:
             question = Question.objects.get(id=question_id)
+            previous_answer = question.correct_answer
 
             serializer = QuestionSerializer(question, data=request.data, partial=True)
             serializer.is_valid(raise_exception=True)
             question = serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                lesson_namespace(question.lesson_id),
+                question_namespace(question.id)
+            )  # Invalidate the lesson's question pages & the question's detail
+            schedule_question_warmup(request, question.lesson_id, question.id)  # Rebuild them after commit
+
+            # Regrade past attempts if the correct answer was fixed (after
+            # commit, once the caches are handled; failures are only logged)
+            if question.correct_answer != previous_answer:
+                schedule_regrade([question.id])
 
             return Response(
                 QuestionResponseSerializer(question).data,
@@ -509,7 +501,11 @@ class QuestionDetailView(APIView):
             question = Question.objects.get(id=question_id)
             question.delete()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                lesson_namespace(question.lesson_id),
+                question_namespace(question_id)  # question.id is reset by delete()
+            )  # Invalidate the lesson's question pages & the question's detail
+            schedule_question_warmup(request, question.lesson_id)  # Rebuild them after commit
             return Response(status=status.HTTP_204_NO_CONTENT)
         
         except Question.DoesNotExist:
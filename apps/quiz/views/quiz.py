@@ -3,17 +3,21 @@ import random
 from django.db import transaction
 
 from .base import *
+from ..caching import get_existing, get_question_bank
+from ..answers import UNANSWERED, pack_answers, unpack_answers
 from ..models import Lesson, Question, QuizAttempt
+from ..shuffle import new_option_seed, option_permutation, original_option, displayed_option
 from ..serializers import (
     QuizStartResponseSerializer,
-    QuestionResponseSerializer,
     QuizSubmitSerializer,
     QuizSubmitResponseSerializer,
+    QuizReviewResponseSerializer,
 )
 
 
 class QuizStartView(APIView):
     permission_classes = [IsAuthenticated]
+    query_budget = {'POST': 5}  # Max. queries per request, incl. the JWT user lookup
 
     # Start a new quiz with randomized questions for a lesson
     @swagger_auto_schema(
@@ -45,12 +49,11 @@ class QuizStartView(APIView):
     )
     def post(self, request, lesson_id):
         try:
-            lesson = Lesson.objects.get(id=lesson_id)
+            # Fetch the lesson with its subject (serialized once per quiz)
+            lesson = get_existing(Lesson.objects.select_related('subject'), lesson_id)
 
-            # Get a list of question IDs for the lesson
-            question_ids = list(
-                lesson.questions.values_list('id', flat=True)
-            )
+            # Get a list of question IDs for the lesson (cached question bank)
+            question_ids = get_question_bank(lesson.id)
             
             # Select random IDs (up to 15)
             selected_ids = random.sample(
@@ -58,21 +61,29 @@ class QuizStartView(APIView):
                 min(len(question_ids), 15)
             )
             
-            # Fetch only the selected questions
-            questions = lesson.questions.filter(id__in=selected_ids)
+            # Fetch only the selected questions & the fields players need
+            questions = list(
+                Question.objects.filter(id__in=selected_ids).only('id', 'text', 'options')
+            )
             
-            # Create a new quiz attempt
+            # Create a new quiz attempt (remember the served question order)
             attempt = QuizAttempt.objects.create(
                 user=request.user,
                 lesson=lesson,
-                score=0
+                score=0,
+                question_ids=[question.id for question in questions],
+                option_seed=new_option_seed()  # Options are shuffled per attempt
             )
             
             return Response(
-                {
-                    'attempt_id': attempt.id,
-                    'questions': QuestionResponseSerializer(questions, many=True).data
-                },
+                QuizStartResponseSerializer(
+                    {
+                        'attempt_id': attempt.id,
+                        'lesson': lesson,
+                        'questions': questions
+                    },
+                    context={'option_seed': attempt.option_seed}
+                ).data,
                 status=status.HTTP_200_OK
             )
         
@@ -103,6 +114,7 @@ class QuizStartView(APIView):
 
 class QuizSubmitView(APIView):
     permission_classes = [IsAuthenticated]
+    query_budget = {'POST': 8}  # Max. queries per request, incl. the JWT user lookup
 
     # Submit quiz answers, calculate score & update user profile
     @swagger_auto_schema(
@@ -154,8 +166,12 @@ class QuizSubmitView(APIView):
     @transaction.atomic
     def post(self, request, attempt_id):
         try:
-            attempt = QuizAttempt.objects.select_for_update().get(
-                id=attempt_id,
+            # Lock only the attempt row; lesson & subject are joined for the response
+            attempt = get_existing(
+                QuizAttempt.objects.select_for_update(
+                    of=('self',)
+                ).select_related('lesson__subject'),
+                attempt_id,
                 user=request.user
             )
             # Return detailed message if quiz is already completed
@@ -170,18 +186,33 @@ class QuizSubmitView(APIView):
             serializer.is_valid(raise_exception=True)
             
             answers = serializer.validated_data['answers']  # {"question_id": "selected_option"}
-            questions = Question.objects.filter(
-                id__in=answers.keys()
-            ).values('id', 'correct_answer')
+
+            # Attempts started before question order was stored fall back to the answered IDs
+            question_ids = attempt.question_ids or sorted(int(question_id) for question_id in answers)
+            correct_answers = dict(
+                Question.objects.filter(
+                    id__in=question_ids
+                ).values_list('id', 'correct_answer')
+            )
             
-            score = 0
-            for question in questions:
-                user_answer = int(answers[str(question['id'])])
-                if user_answer == question['correct_answer']:
-                    score += 1
+            # Answers aligned with the attempt's question order,
+            # mapped back from shuffled to original option numbers
+            selected = []
+            for question_id in question_ids:
+                option = int(answers.get(str(question_id), UNANSWERED))
+                if option != UNANSWERED:
+                    permutation = option_permutation(attempt.option_seed, question_id)
+                    option = original_option(option, permutation)
+                selected.append(option)
+            score = sum(
+                1 for question_id, option in zip(question_ids, selected)
+                if option != UNANSWERED and option == correct_answers.get(question_id)
+            )
             
             attempt.score = score
             attempt.completed = True
+            attempt.question_ids = question_ids
+            attempt.answers = pack_answers(selected)  # Keep answers for regrading
             attempt.save()
             
             # Update user profile
@@ -218,3 +249,106 @@ class QuizSubmitView(APIView):
                 {"detail": "An error occurred while processing your request."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+
+class QuizAttemptReviewView(APIView):
+    permission_classes = [IsAuthenticated]
+    query_budget = {'GET': 3}  # Max. queries per request, incl. the JWT user lookup
+
+    # Review a completed quiz attempt question by question
+    @swagger_auto_schema(
+        tags=["Quiz-Game"],
+        operation_id="quiz_game_attempt_review",
+        operation_description=(
+            "Review a completed quiz attempt: submitted option & correctness "
+            "for every question in the order they were served"
+        ),
+        manual_parameters=[
+            openapi.Parameter(
+                'attempt_id',
+                openapi.IN_PATH,
+                description="ID of the quiz attempt to review",
+                type=openapi.TYPE_INTEGER,
+                required=True
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                'Success: Ok',
+                QuizReviewResponseSerializer
+            ),
+            400: 'Error: Bad request',
+            401: 'Error: Unauthorized',
+            404: 'Error: Not found',
+            429: 'Error: Too many requests',
+            500: 'Error: Internal server error'
+        }
+    )
+    def get(self, request, attempt_id):
+        try:
+            attempt = get_existing(
+                QuizAttempt.objects.only(
+                    'id', 'score', 'completed', 'question_ids', 'answers', 'option_seed'
+                ),
+                attempt_id,
+                user=request.user
+            )
+
+            if not attempt.completed:
+                return Response(
+                    {"detail": "Quiz not completed yet."},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            
+            question_ids = attempt.question_ids
+            selected = unpack_answers(attempt.answers, len(question_ids))
+            correct_answers = dict(
+                Question.objects.filter(
+                    id__in=question_ids
+                ).values_list('id', 'correct_answer')
+            )
+
+            # Answers are stored in original option numbers: report them at
+            # the positions the player saw (options shuffled per attempt)
+            review = []
+            for question_id, option in zip(question_ids, selected):
+                correct_answer = correct_answers.get(question_id)
+                permutation = option_permutation(attempt.option_seed, question_id)
+                review.append({
+                    'question_id': question_id,
+                    'selected_option': (
+                        displayed_option(option, permutation) if option != UNANSWERED else None
+                    ),
+                    'correct_answer': (
+                        displayed_option(correct_answer, permutation) if correct_answer is not None else None
+                    ),
+                    'is_correct': option != UNANSWERED and option == correct_answer
+                })
+
+            return Response(
+                QuizReviewResponseSerializer({
+                    'attempt_id': attempt.id,
+                    'score': attempt.score,
+                    'questions': review
+                }).data,
+                status=status.HTTP_200_OK
+            )
+        
+        except QuizAttempt.DoesNotExist:
+            return Response(
+                {"detail": "Quiz attempt not found."},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        
+        except Exception as e:
+            # Log the error for debugging
+            logger.error(
+                f"Error in QuizAttemptReviewView.get(): {str(e)}",
+                exc_info=True
+            )
+
+            return Response(
+                {"detail": "An error occurred while processing your request."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
@@ -1,5 +1,17 @@
 from .base import *
+from .payloads import ReadPayloadMixin
+from ..caching import (
+    CATALOG_NAMESPACE,
+    LEADERBOARD_NAMESPACE,
+    QUESTION_DETAILS_NAMESPACE,
+    subject_namespace,
+    subject_lesson_namespaces,
+    get_namespace_versions,
+    bump_namespaces,
+    is_known_missing
+)
 from ..models import Subject
+from ..warmers import schedule_subject_warmup
 from ..paginators import SubjectListPagination
 from ..serializers import (
     SubjectSerializer,
@@ -7,12 +19,28 @@ from ..serializers import (
 )
 
 
-class SubjectListCreateView(APIView):
+class SubjectListCreateView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [IsAdminOrReadOnly]
     pagination_class = SubjectListPagination
+    payload_serializer_class = SubjectSerializer
+    query_budget = {'GET': 3, 'POST': 3}  # Max. queries per request, incl. the JWT user lookup
+
+    def get_payload_queryset(self, parent, context):
+        # Load only the columns the response needs
+        return SubjectSerializer.optimize_queryset(
+            Subject.objects.all().order_by('name'),
+            context
+        )
     
-    def get_cache_key(self, page_number, page_size):
-        return f'subjects:page:{page_number}:size:{page_size}'
+    def get_cache_key(self, request):
+        # Canonical key of the requested page (None for invalid pages)
+        version = get_namespace_versions(CATALOG_NAMESPACE)
+        return get_page_cache_key(
+            f'subjects:v{version}',
+            request,
+            self.pagination_class,
+            extra=get_sparse_cache_key(request, SubjectSerializer)
+        )
 
     # Get/retrieve all subjects
     @swagger_auto_schema(
@@ -35,7 +63,8 @@ class SubjectListCreateView(APIView):
                 ),
                 type=openapi.TYPE_INTEGER,
                 required=False
-            )
+            ),
+            fields_parameter
         ],
         responses={
             200: openapi.Response(
@@ -48,55 +77,9 @@ class SubjectListCreateView(APIView):
             500: 'Error: Internal server error'
         }
     )
+    @cache_page_payload(timeout=60*15)  # Cache serialized pages for 15 minutes
     def get(self, request):
-        try:
-            # Get current page from request
-            page_number = request.query_params.get('page', 1)
-
-            # Get page size from request, default to the pagination class default
-            page_size = request.query_params.get(
-                'page_size',
-                self.pagination_class.page_size
-            )
-
-            cache_key = self.get_cache_key(page_number, page_size)  # Unique key for caching subjects
-            subjects = cache.get(cache_key)  # Try getting cached data
-
-            if not subjects:  # If empty cache
-                subjects = Subject.objects.all().order_by('name')
-
-                cache.set(cache_key, subjects, timeout=60*15)  # Cache for 15 minutes
-            
-            # Enforce pagination
-            paginator = self.pagination_class()
-            page = paginator.paginate_queryset(subjects, request)
-            if page is not None:
-                serializer = SubjectSerializer(page, many=True)
-                return paginator.get_paginated_response(serializer.data)
-            
-            # If pagination is not applied, throw an error
-            return Response(
-                {"error": "Pagination is required for this endpoint."},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        except NotFound as e:
-            return Response(
-                {"detail": str(e)},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in SubjectListCreateView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request)
 
     # Create a new subject
     @swagger_auto_schema(
@@ -121,7 +104,8 @@ class SubjectListCreateView(APIView):
             serializer.is_valid(raise_exception=True)
             serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(CATALOG_NAMESPACE)  # Invalidate subject list pages
+            schedule_subject_warmup(request)  # Rebuild them after commit
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         
         except ValidationError as e:
@@ -143,8 +127,18 @@ class SubjectListCreateView(APIView):
             )
 
 
-class SubjectDetailView(APIView):
+class SubjectDetailView(ReadPayloadMixin, ReplicaReadMixin, APIView):
     permission_classes = [IsAdminOrReadOnly]
+    payload_serializer_class = SubjectSerializer
+    payload_lookup = (Subject, 'subject_id')
+    query_budget = {'GET': 2, 'PUT': 5, 'PATCH': 5, 'DELETE': 5}  # Max. queries per request, incl. the JWT user lookup
+
+    def get_cache_key(self, request, subject_id):
+        if is_known_missing(Subject, subject_id):
+            return None
+
+        version = get_namespace_versions(subject_namespace(subject_id))
+        return f'subjects:detail:{subject_id}:v{version}{get_sparse_cache_key(request, SubjectSerializer)}'
 
     # Get/retrieve a subject by ID
     @swagger_auto_schema(
@@ -158,6 +152,7 @@ class SubjectDetailView(APIView):
                 type=openapi.TYPE_INTEGER,
                 required=True
             ),
+            fields_parameter
         ],
         responses={
             200: openapi.Response(
@@ -169,31 +164,9 @@ class SubjectDetailView(APIView):
             500: 'Error: Internal server error'
         }
     )
+    @cache_page_payload(timeout=60*15)  # Cache serialized payloads for 15 minutes
     def get(self, request, subject_id):
-        try:
-            subject = Subject.objects.get(id=subject_id)
-            return Response(
-                SubjectSerializer(subject).data,
-                status=status.HTTP_200_OK
-            )
-        
-        except Subject.DoesNotExist:
-            return Response(
-                {"detail": "Subject not found."},
-                status=status.HTTP_404_NOT_FOUND
-            )
-        
-        except Exception as e:
-            # Log the error for debugging
-            logger.error(
-                f"Error in SubjectDetailView.get(): {str(e)}",
-                exc_info=True
-            )
-
-            return Response(
-                {"detail": "An error occurred while processing your request."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR
-            )
+        return self.build_payload(request, subject_id=subject_id)
 
     # Update a subject by ID using PUT method
     @swagger_auto_schema(
@@ -230,7 +203,13 @@ class SubjectDetailView(APIView):
             serializer.is_valid(raise_exception=True)
             serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                CATALOG_NAMESPACE,
+                subject_namespace(subject_id),
+                *subject_lesson_namespaces(subject_id),
+                QUESTION_DETAILS_NAMESPACE
+            )  # Invalidate pages showing the subject
+            schedule_subject_warmup(request, subject_id)  # Rebuild them after commit
             return Response(serializer.data, status=status.HTTP_200_OK)
         
         except Subject.DoesNotExist:
@@ -292,7 +271,13 @@ class SubjectDetailView(APIView):
             serializer.is_valid(raise_exception=True)
             serializer.save()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                CATALOG_NAMESPACE,
+                subject_namespace(subject_id),
+                *subject_lesson_namespaces(subject_id),
+                QUESTION_DETAILS_NAMESPACE
+            )  # Invalidate pages showing the subject
+            schedule_subject_warmup(request, subject_id)  # Rebuild them after commit
             return Response(serializer.data, status=status.HTTP_200_OK)
         
         except Subject.DoesNotExist:
@@ -344,9 +329,17 @@ class SubjectDetailView(APIView):
     def delete(self, request, subject_id):
         try:
             subject = Subject.objects.get(id=subject_id)
+            lesson_namespaces = subject_lesson_namespaces(subject_id)  # Lessons are deleted with the subject
             subject.delete()
 
-            cache.clear()  # Invalidate cache as database updated
+            bump_namespaces(
+                CATALOG_NAMESPACE,
+                subject_namespace(subject_id),
+                *lesson_namespaces,
+                QUESTION_DETAILS_NAMESPACE,
+                LEADERBOARD_NAMESPACE  # Its quiz attempts are deleted with it
+            )  # Invalidate pages showing the subject
+            schedule_subject_warmup(request)  # Rebuild the subject list after commit
             return Response(status=status.HTTP_204_NO_CONTENT)
         
         except Subject.DoesNotExist:
@@ -0,0 +1,195 @@
+import time
+import logging
+import threading
+from functools import partial
+
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import RequestFactory
+from django.urls import resolve, reverse
+
+from rest_framework.views import APIView
+
+from .caching import get_question_bank
+from .models import Subject, Lesson
+
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+
+# Write-through cache warming.
+# Content writes bump cache namespaces (see caching.py); once the write is
+# committed the affected pages are rebuilt, so the first readers after an
+# edit hit a warm cache instead of stampeding the database.
+
+
+MISSING_HOST = "Cache warming needs the public host of the API (one of ALLOWED_HOSTS)"
+
+
+def build_warm_request(path, host, secure=False):
+    # Synthetic GET request for the public host & scheme, as a client sends
+    # it: the paginator builds its links through request.get_host(), which
+    # rejects hosts outside ALLOWED_HOSTS. Cached pages store no links.
+    if not host:
+        raise ValueError(MISSING_HOST)
+    request = RequestFactory().get(path, secure=secure, HTTP_HOST=host)
+    return APIView().initialize_request(request)
+
+
+def warm_endpoint(url_name, kwargs=None, host=None, secure=False):
+    # Render a cached GET endpoint (first page) through its view, which caches
+    # the payload under the current namespace versions. Authentication &
+    # throttling are skipped, so warming never uses up anyone's rate limit.
+    kwargs = kwargs or {}
+    path = reverse(url_name, kwargs=kwargs)
+    request = build_warm_request(path, host=host, secure=secure)
+
+    view = resolve(path).func.view_class()
+    view.setup(request, **kwargs)
+    view.format_kwarg = None
+    return view.get(request, **kwargs).status_code
+
+
+def _warm_page(url_name, kwargs, host, secure):
+    # Only 200 responses are cached: anything else is a failed target
+    status_code = warm_endpoint(url_name, kwargs, host, secure)
+    if status_code != 200:
+        raise RuntimeError(f"HTTP {status_code}")
+
+
+def warm_caches(endpoints=(), lesson_ids=(), host=None, secure=False):
+    # Warm endpoints [(url_name, kwargs), ...] & question banks of lessons.
+    # Returns {target: seconds}; failures (including non-200 responses) are
+    # logged, never raised. Endpoints need the public host (see
+    # build_warm_request()), checked before anything is warmed.
+    if endpoints and not host:
+        raise ValueError(MISSING_HOST)
+
+    timings = {}
+
+    targets = [
+        (reverse(url_name, kwargs=kwargs), partial(_warm_page, url_name, kwargs, host, secure))
+        for url_name, kwargs in endpoints
+    ] + [
+        (f'question bank of lesson {lesson_id}', partial(get_question_bank, lesson_id))
+        for lesson_id in lesson_ids
+    ]
+
+    for target, warm in targets:
+        start = time.perf_counter()
+        try:
+            warm()
+        except Exception as e:
+            logger.warning(f"Cache warming of {target} failed: {str(e)}", exc_info=True)
+            continue
+        timings[target] = time.perf_counter() - start
+
+    return timings
+
+
+def schedule_warmup(request, endpoints=(), lesson_ids=()):
+    # Warm the caches once the current transaction commits
+    transaction.on_commit(partial(
+        warm_caches,
+        endpoints=list(endpoints),
+        lesson_ids=list(lesson_ids),
+        host=request.get_host(),
+        secure=request.is_secure()
+    ))
+
+
+def schedule_subject_warmup(request, subject_id=None):
+    # Subject list (+ the subject's detail & lesson list unless deleted)
+    endpoints = [('subject_list_create', {})]
+    if subject_id is not None:
+        endpoints += [
+            ('subject_detail', {'subject_id': subject_id}),
+            ('lesson_list_create', {'subject_id': subject_id})
+        ]
+    schedule_warmup(request, endpoints)
+
+
+def schedule_lesson_warmup(request, subject_id, lesson_id=None):
+    # Subject's lesson list & detail (+ the lesson's detail, question list &
+    # question bank unless deleted)
+    endpoints = [
+        ('lesson_list_create', {'subject_id': subject_id}),
+        ('subject_detail', {'subject_id': subject_id})
+    ]
+    lesson_ids = []
+    if lesson_id is not None:
+        endpoints += [
+            ('lesson_detail', {'lesson_id': lesson_id}),
+            ('question_list_create', {'lesson_id': lesson_id})
+        ]
+        lesson_ids.append(lesson_id)
+    schedule_warmup(request, endpoints, lesson_ids)
+
+
+def schedule_question_warmup(request, lesson_id, question_id=None):
+    # Lesson's question list & question bank (+ the question's detail unless
+    # deleted)
+    endpoints = [('question_list_create', {'lesson_id': lesson_id})]
+    if question_id is not None:
+        endpoints.append(('question_detail', {'question_id': question_id}))
+    schedule_warmup(request, endpoints, [lesson_id])
+
+
+# Deploy/restart warm-up: the subject catalog, lesson lists & leaderboards of
+# the most played subjects, question pages & banks of the most played lessons
+WARMUP_SUBJECT_LIMIT = 25
+WARMUP_LESSON_LIMIT = 50
+
+
+def get_warmup_plan(subject_limit=WARMUP_SUBJECT_LIMIT, lesson_limit=WARMUP_LESSON_LIMIT):
+    # Returns (endpoints, lesson_ids) for warm_caches()
+    subject_ids = list(
+        Subject.objects.annotate(
+            plays=Count('lessons__quizattempt')
+        ).order_by('-plays', 'id').values_list('id', flat=True)[:subject_limit]
+    )
+    lesson_ids = list(
+        Lesson.objects.annotate(
+            plays=Count('quizattempt')
+        ).order_by('-plays', 'id').values_list('id', flat=True)[:lesson_limit]
+    )
+
+    endpoints = [('subject_list_create', {}), ('global_leaderboard', {})]
+    for subject_id in subject_ids:
+        endpoints += [
+            ('lesson_list_create', {'subject_id': subject_id}),
+            ('subject_leaderboard', {'subject_id': subject_id})
+        ]
+    for lesson_id in lesson_ids:
+        endpoints.append(('question_list_create', {'lesson_id': lesson_id}))
+
+    return endpoints, lesson_ids
+
+
+def warm_all(host, secure=False, **limits):
+    endpoints, lesson_ids = get_warmup_plan(**limits)
+    return warm_caches(endpoints, lesson_ids, host=host, secure=secure)
+
+
+def start_background_warmup(host, secure=False):
+    # Warm up in a daemon thread, so a starting worker serves requests at once
+    if not host:
+        raise ValueError(MISSING_HOST)
+
+    def run():
+        start = time.perf_counter()
+        try:
+            timings = warm_all(host=host, secure=secure)
+            logger.info(
+                f"Cache warm-up: {len(timings)} targets in "
+                f"{time.perf_counter() - start:.2f}s"
+            )
+        except Exception as e:
+            logger.warning(f"Cache warm-up failed: {str(e)}", exc_info=True)
+        finally:
+            connection.close()  # This thread's database connection
+
+    thread = threading.Thread(target=run, name='cache-warmup', daemon=True)
+    thread.start()
+    return thread
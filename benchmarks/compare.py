@@ -0,0 +1,63 @@
+"""
+Compare two benchmark result files (benchmarks.run --output).
+
+Prints p50/p99 latency, throughput & queries per request of every scenario
+in both runs with the relative change; changes beyond --threshold percent
+are flagged.
+
+Usage (from the project root):
+    python -m benchmarks.compare benchmarks/results/base.json benchmarks/results/head.json
+"""
+import sys
+import json
+import argparse
+
+
+METRICS = (
+    # (key, label, True if higher is better)
+    ('p50_ms', 'p50 ms', False),
+    ('p99_ms', 'p99 ms', False),
+    ('throughput_rps', 'req/s', True),
+    ('queries_mean', 'queries', False),
+)
+
+
+def compare(base, head, threshold=10):
+    # Rows of (scenario, label, base value, head value, change %, flag);
+    # flag: "+" better, "-" worse beyond the threshold, "" otherwise
+    rows = []
+    for scenario in base['results'].keys() & head['results'].keys():
+        for key, label, higher_is_better in METRICS:
+            old, new = base['results'][scenario][key], head['results'][scenario][key]
+            change = (new - old) / old * 100 if old else 0.0
+            flag = ''
+            if abs(change) >= threshold:
+                flag = '+' if (change > 0) == higher_is_better else '-'
+            rows.append((scenario, label, old, new, change, flag))
+    return sorted(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('base', help="Results of the baseline run")
+    parser.add_argument('head', help="Results of the run to compare")
+    parser.add_argument('--threshold', type=float, default=10, help="Flag changes beyond this percent (default: 10)")
+    args = parser.parse_args()
+
+    with open(args.base) as file:
+        base = json.load(file)
+    with open(args.head) as file:
+        head = json.load(file)
+
+    print(f"base: {base['meta'].get('commit')}  head: {head['meta'].get('commit')}")
+    print(f"{'scenario':<28}{'metric':<9}{'base':>10}{'head':>10}{'change':>9}")
+    worse = 0
+    for scenario, label, old, new, change, flag in compare(base, head, args.threshold):
+        print(f"{scenario:<28}{label:<9}{old:>10}{new:>10}{change:>+8.1f}% {flag}")
+        worse += flag == '-'
+
+    sys.exit(1 if worse else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Benchmark the API endpoints against a generated dataset.
+
+Measures p50/p90/p99 latency, throughput (sequential requests per second)
+& queries per request of quiz start/submit, both leaderboards, the subject,
+lesson & question lists (cold & warm cache), login & token refresh. Results
+are written as JSON, to be compared across commits with benchmarks.compare.
+
+Run against a dedicated database & cache: cold-cache scenarios clear the
+cache (writes are rolled back).
+
+Usage (from the project root):
+    python manage.py generate_load_data --seed 42
+    python -m benchmarks.run [--iterations 200] [--only quiz_start login]
+                             [--output benchmarks/results/<commit>.json]
+"""
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+from datetime import datetime, timezone
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(iterations=200, only=None, prefix='load', password=None, log=print):
+    # Run the scenarios; returns the JSON-serializable results
+    import django
+    from django.conf import settings
+    from django.db import connection
+
+    from apps.quiz.load_data import DEFAULT_PASSWORD
+    from .scenarios import SCENARIOS, Dataset
+
+    dataset = Dataset(prefix=prefix, password=password or DEFAULT_PASSWORD)
+    results = {}
+    for name, scenario in SCENARIOS.items():
+        if only and name not in only:
+            continue
+        results[name] = scenario(dataset, iterations)
+        result = results[name]
+        log(
+            f"{name:<28}{result['p50_ms']:>9.2f}{result['p99_ms']:>10.2f}"
+            f"{result['throughput_rps']:>10.1f}{result['queries_mean']:>9.1f}{result['errors']:>8}"
+        )
+
+    return {
+        'meta': {
+            'commit': git_commit(),
+            'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'django': django.get_version(),
+            'database': connection.vendor,
+            'cache': settings.CACHES['default']['BACKEND'],
+            'iterations': iterations,
+            'dataset': dataset.counts,
+        },
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=200, help="Requests per scenario (default: 200)")
+    parser.add_argument('--only', nargs='+', help="Scenarios to run (default: all)")
+    parser.add_argument('--prefix', default='load', help="Prefix of the generated dataset (default: load)")
+    parser.add_argument('--password', help="Password of the generated users")
+    parser.add_argument('--output', help="JSON file to write (default: print only)")
+    parser.add_argument('--settings', help="Django settings module (default: $DJANGO_SETTINGS_MODULE or config.settings.dev)")
+    args = parser.parse_args()
+
+    if args.settings:
+        os.environ['DJANGO_SETTINGS_MODULE'] = args.settings
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+
+    import django
+    django.setup()
+
+    from .scenarios import SCENARIOS
+    unknown = set(args.only or ()) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))} (choose from {', '.join(SCENARIOS)})")
+
+    print(f"{'scenario':<28}{'p50 ms':>9}{'p99 ms':>10}{'req/s':>10}{'queries':>9}{'errors':>8}")
+    try:
+        report = run(args.iterations, args.only, args.prefix, args.password)
+    except ValueError as e:
+        sys.exit(str(e))
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import time
+import itertools
+from contextlib import contextmanager
+
+import numpy as np
+from django.db import transaction
+from rest_framework.test import APIClient
+
+from apps.monitoring.middleware import QueryRecorder, execute_wrapper
+
+
+# Measurement of one benchmark scenario: requests are made in-process with
+# DRF's test client (no network), one at a time. Setup work per request
+# (tokens, started quizzes, cache clearing) is not timed. Every request runs
+# in a transaction that is rolled back, so writes (attempts, blacklisted
+# tokens, user stats) never change the dataset between runs.
+_addresses = itertools.count(1)
+
+
+def next_address():
+    # A fresh client IP per request, so per-IP throttles never trigger
+    number = next(_addresses)
+    return f'10.{number >> 16 & 255}.{number >> 8 & 255}.{number & 255}'
+
+
+@contextmanager
+def rolled_back():
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
+
+
+def summarize(latencies, queries, statuses, seconds):
+    # Latency percentiles (ms), throughput, queries per request & status codes
+    latencies = np.array(latencies) * 1000
+    errors = sum(count for code, count in statuses.items() if int(code) >= 400)
+    return {
+        'iterations': len(latencies),
+        'errors': errors,
+        'status_codes': dict(sorted(statuses.items())),
+        'p50_ms': round(float(np.percentile(latencies, 50)), 3),
+        'p90_ms': round(float(np.percentile(latencies, 90)), 3),
+        'p99_ms': round(float(np.percentile(latencies, 99)), 3),
+        'mean_ms': round(float(latencies.mean()), 3),
+        'max_ms': round(float(latencies.max()), 3),
+        'throughput_rps': round(len(latencies) / seconds, 2) if seconds else None,
+        'queries_mean': round(float(np.mean(queries)), 2),
+        'queries_max': int(max(queries)),
+    }
+
+
+def measure(request, iterations, setup=None):
+    # Time `iterations` calls of request(client, prepared) -> response, where
+    # `prepared` is what setup(index) returned (untimed)
+    client = APIClient()
+    latencies, queries, statuses = [], [], {}
+
+    for index in range(iterations):
+        with rolled_back():
+            prepared = setup(index) if setup else None
+            recorder = QueryRecorder()
+            with execute_wrapper(recorder):
+                start = time.perf_counter()
+                response = request(client, prepared, index)
+                latencies.append(time.perf_counter() - start)
+            queries.append(recorder.count)
+            code = str(response.status_code)
+            statuses[code] = statuses.get(code, 0) + 1
+
+    return summarize(latencies, queries, statuses, sum(latencies))
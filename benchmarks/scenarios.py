@@ -0,0 +1,179 @@
+import random
+
+from django.core.cache import cache
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from apps.quiz.load_data import DEFAULT_PASSWORD, SERVED_QUESTIONS
+from apps.quiz.models import Subject, Lesson, Question, QuizAttempt
+from apps.quiz.shuffle import new_option_seed
+
+from .runner import measure, next_address
+
+
+# Benchmark scenarios against a generated dataset (generate_load_data).
+# Requests rotate over a sample of players, subjects & lessons. List
+# endpoints & leaderboards run twice: "cold" clears the cache before every
+# request, "warm" serves pages cached by a priming pass.
+TARGET_SAMPLE = 20  # Subjects & lessons requests rotate over
+USER_SAMPLE = 200  # Players requests rotate over
+LOGIN_MAX_ITERATIONS = 20  # Password hashing makes logins slow by design
+
+
+class Dataset:
+    def __init__(self, prefix='load', password=DEFAULT_PASSWORD):
+        User = get_user_model()
+        self.password = password
+        self.users = list(
+            User.objects.filter(username__startswith=f'{prefix}_user_').order_by('id')[:USER_SAMPLE]
+        )
+        self.lesson_ids = list(
+            Lesson.objects.filter(
+                subject__name__startswith=f'{prefix} subject ',
+                questions__isnull=False
+            ).distinct().order_by('id').values_list('id', flat=True)[:TARGET_SAMPLE]
+        )
+        self.subject_ids = list(
+            Subject.objects.filter(lessons__id__in=self.lesson_ids).distinct().values_list('id', flat=True)
+        )
+        if not (self.users and self.lesson_ids):
+            raise ValueError(
+                f"No data generated with the prefix '{prefix}' "
+                "(run the generate_load_data command first)."
+            )
+
+        self.question_banks = {
+            lesson_id: list(Question.objects.filter(lesson_id=lesson_id).values_list('id', flat=True))
+            for lesson_id in self.lesson_ids
+        }
+        self.tokens = {user.id: str(AccessToken.for_user(user)) for user in self.users}
+
+        self.counts = {
+            'subjects': Subject.objects.count(),
+            'lessons': Lesson.objects.count(),
+            'questions': Question.objects.count(),
+            'users': User.objects.count(),
+            'attempts': QuizAttempt.objects.count(),
+        }
+
+    def user(self, index):
+        return self.users[index % len(self.users)]
+
+    def headers(self, index):
+        return {
+            'HTTP_AUTHORIZATION': f'Bearer {self.tokens[self.user(index).id]}',
+            'REMOTE_ADDR': next_address(),
+        }
+
+    def lesson_id(self, index):
+        return self.lesson_ids[index % len(self.lesson_ids)]
+
+    def subject_id(self, index):
+        return self.subject_ids[index % len(self.subject_ids)]
+
+
+def _clear_cache(index):
+    cache.clear()
+
+
+def _read(dataset, url_for):
+    # GET url_for(dataset, index) as an anonymous client from a fresh address
+    def request(client, prepared, index):
+        return client.get(url_for(dataset, index), REMOTE_ADDR=next_address())
+    return request
+
+
+def _read_scenarios(name, url_for):
+    def cold(dataset, iterations):
+        return measure(_read(dataset, url_for), iterations, setup=_clear_cache)
+
+    def warm(dataset, iterations):
+        cache.clear()
+        measure(_read(dataset, url_for), min(iterations, TARGET_SAMPLE))  # Prime the cache
+        return measure(_read(dataset, url_for), iterations)
+
+    return {f'{name}_cold': cold, f'{name}_warm': warm}
+
+
+def quiz_start(dataset, iterations):
+    def request(client, prepared, index):
+        return client.post(
+            reverse('quiz_start', kwargs={'lesson_id': dataset.lesson_id(index)}),
+            **dataset.headers(index)
+        )
+    return measure(request, iterations)
+
+
+def quiz_submit(dataset, iterations):
+    def setup(index):
+        # A freshly started quiz & a full set of answers
+        lesson_id = dataset.lesson_id(index)
+        bank = dataset.question_banks[lesson_id]
+        question_ids = random.sample(bank, min(len(bank), SERVED_QUESTIONS))
+        attempt = QuizAttempt.objects.create(
+            user=dataset.user(index),
+            lesson_id=lesson_id,
+            score=0,
+            question_ids=question_ids,
+            option_seed=new_option_seed()
+        )
+        answers = {str(question_id): str(random.randint(1, 3)) for question_id in question_ids}
+        return attempt.id, answers
+
+    def request(client, prepared, index):
+        attempt_id, answers = prepared
+        return client.post(
+            reverse('quiz_submit', kwargs={'attempt_id': attempt_id}),
+            {'answers': answers},
+            format='json',
+            **dataset.headers(index)
+        )
+    return measure(request, iterations, setup=setup)
+
+
+def login(dataset, iterations):
+    def request(client, prepared, index):
+        return client.post(
+            reverse('login'),
+            {'username': dataset.user(index).username, 'password': dataset.password},
+            format='json',
+            REMOTE_ADDR=next_address()
+        )
+    return measure(request, min(iterations, LOGIN_MAX_ITERATIONS))
+
+
+def token_refresh(dataset, iterations):
+    def setup(index):
+        return str(RefreshToken.for_user(dataset.user(index)))
+
+    def request(client, refresh, index):
+        return client.post(
+            reverse('token_refresh'),
+            {'refresh': refresh},
+            format='json',
+            REMOTE_ADDR=next_address()
+        )
+    return measure(request, iterations, setup=setup)
+
+
+SCENARIOS = {
+    'quiz_start': quiz_start,
+    'quiz_submit': quiz_submit,
+    **_read_scenarios(
+        'subject_leaderboard',
+        lambda dataset, index: reverse('subject_leaderboard', kwargs={'subject_id': dataset.subject_id(index)})
+    ),
+    **_read_scenarios('global_leaderboard', lambda dataset, index: reverse('global_leaderboard')),
+    **_read_scenarios('subject_list', lambda dataset, index: reverse('subject_list_create')),
+    **_read_scenarios(
+        'lesson_list',
+        lambda dataset, index: reverse('lesson_list_create', kwargs={'subject_id': dataset.subject_id(index)})
+    ),
+    **_read_scenarios(
+        'question_list',
+        lambda dataset, index: reverse('question_list_create', kwargs={'lesson_id': dataset.lesson_id(index)})
+    ),
+    'login': login,
+    'token_refresh': token_refresh,
+}
@@ -1,4 +1,5 @@
 import os
+import tempfile
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -27,14 +28,20 @@ INSTALLED_APPS = [
     # Custom apps
     'apps.authentication',
     'apps.quiz',
+    'apps.monitoring',
 ]
 
 MIDDLEWARE = [
+    'apps.monitoring.middleware.MetricsMiddleware',  # First, so its latency covers all middleware
+    'apps.monitoring.middleware.QueryInspectorMiddleware',  # N+1 & query budget checks (dev/test)
+    'utils.timeouts.StatementTimeoutMiddleware',  # Per-view statement timeouts, 503 on timeouts
+    'utils.admission.AdmissionControlMiddleware',  # Per-endpoint concurrency limits, 503 when over
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'utils.replicas.ReplicaPinMiddleware',  # Read-your-writes after a user's writes (with replicas)
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -44,6 +51,15 @@ AUTH_USER_MODEL = 'authentication.CustomUser'
 
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "utils.exceptions.custom_exception_handler",
+    'DEFAULT_RENDERER_CLASSES': [
+        'utils.renderers.FastJSONRenderer',  # orjson, falls back to DRF's JSONRenderer
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'utils.parsers.FastJSONParser',  # orjson, falls back to DRF's JSONParser
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
         'rest_framework_simplejwt.authentication.JWTAuthentication',  # Use Simple JWT
     ],
@@ -70,12 +86,94 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Shared cache tier (seen by every worker): Redis if configured, else files
+if os.environ.get('CACHE_REDIS_URL'):
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.environ['CACHE_REDIS_URL'],
+    }
+    SHARED_CACHE_COMPRESS_MIN_SIZE = 1024  # Codec zlib-compresses values from 1 KB
+else:
+    # Development & single-worker setups only (production requires Redis):
+    # incr() & add() are a get + set that races across processes, and
+    # culling lists the whole cache directory.
+    # Past MAX_ENTRIES files, every set culls 1/CULL_FREQUENCY of the entries
+    # at random, throttle histories & namespace version stamps included. The
+    # default cap sits well above the key space of a deployment (pages &
+    # stale copies per subject/lesson/question, question banks, missing-ID
+    # markers, throttle histories per user & IP); raise it with the catalog.
+    SHARED_CACHE = {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.environ.get(
+            'CACHE_DIR',
+            os.path.join(tempfile.gettempdir(), 'quizLeaderAPI-cache')
+        ),
+        'OPTIONS': {
+            'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', '50000')),
+            'CULL_FREQUENCY': 10,  # Cull 10% of the entries when full (Django's default: a third)
+        },
+    }
+    SHARED_CACHE_COMPRESS_MIN_SIZE = None  # FileBasedCache zlib-compresses every file itself
+
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',  # In-memory cache
-        'LOCATION': 'quizLeaderAPI-cache',  # A unique identifier for the cache (can be anything for django default cache)
-    }
+        'BACKEND': 'utils.cache_backends.TwoTierCache',  # Per-process LRU in front of the shared cache
+        'LOCATION': 'quizLeaderAPI-cache',  # A unique identifier of the local (in-memory) tier
+        'OPTIONS': {
+            'SHARED_ALIAS': 'shared',
+            'LOCAL_MAX_ENTRIES': 1000,
+            'LOCAL_TIMEOUT': 5,  # Max. seconds a worker serves its local copy
+            'SHARED_ONLY_PREFIXES': ('ns:', 'throttle_'),  # Version stamps & throttle history
+            'CODEC': {
+                'FORMAT': 'json',  # Shared-tier values as JSON ('msgpack' if installed, or 'pickle')
+                'COMPRESS_MIN_SIZE': SHARED_CACHE_COMPRESS_MIN_SIZE,  # zlib unless the backend compresses
+                'COMPRESS_LEVEL': 1,
+            },
+        },
+    },
+    'shared': SHARED_CACHE,
+}
+
+# Request metrics at /metrics (Prometheus text format)
+# With several worker processes (gunicorn), set METRICS_MULTIPROC_DIR to a
+# directory shared by them (emptied on deploy) to serve the sum of all workers
+METRICS_MULTIPROC_DIR = os.environ.get('METRICS_MULTIPROC_DIR') or None
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')  # Required as a Bearer token if set
+METRICS_REQUIRE_TOKEN = False  # /metrics is public without METRICS_TOKEN (denied in prod settings)
+
+# SQL fingerprinting per request: repeated query shapes (N+1) & views over
+# their query_budget are logged (enabled in dev & test settings)
+QUERY_INSPECTOR_ENABLED = os.environ.get('QUERY_INSPECTOR_ENABLED', 'False') == 'True'
+QUERY_REPEAT_THRESHOLD = 3  # Same query shape this often in one request = N+1
+
+# Read replicas: database aliases that catalog & leaderboard GETs read from
+# (views with ReplicaReadMixin); empty: all queries go to `default`.
+# Configured in prod settings (DB_REPLICA_HOSTS) & dev settings (DB_REPLICA).
+DATABASE_ROUTERS = ['utils.replicas.ReplicaRouter']
+REPLICA_DATABASES = []
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', '10'))  # Reads stay on the primary after a user's write
+
+# Statement timeouts (PostgreSQL) per view: a view's "statement_timeout",
+# overridden here by URL name, e.g. {'global_leaderboard': 5} (seconds).
+# Timed out requests get a stale cached page or a 503 with Retry-After.
+STATEMENT_TIMEOUTS = {}
+STATEMENT_TIMEOUT_RETRY_AFTER = 5  # Seconds
+
+# Admission control: max. concurrent requests per URL name & worker process.
+# Excess requests wait up to queue_timeout seconds (max_queue of them,
+# default: concurrency), the rest get a 503 with Retry-After at once.
+# Keep the limits below the threads per worker (gunicorn --threads).
+ADMISSION_LIMITS = {
+    'global_leaderboard': {
+        'concurrency': int(os.environ.get('ADMISSION_GLOBAL_LEADERBOARD', '4')),
+        'queue_timeout': 0.5
+    },
+    'subject_leaderboard': {
+        'concurrency': int(os.environ.get('ADMISSION_SUBJECT_LEADERBOARD', '6')),
+        'queue_timeout': 0.5
+    },
 }
+ADMISSION_RETRY_AFTER = 1  # Seconds
 
 TEMPLATES = [
     {
@@ -95,6 +193,11 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'config.wsgi.application'
 
+# ASGI deployments (config.asgi): serve GET of the leaderboard & catalog
+# endpoints with their async variants (apps/quiz/views/async_read.py).
+# Keep it off under WSGI, where async views run through async_to_sync.
+ASYNC_READ_VIEWS = os.environ.get('ASYNC_READ_VIEWS', 'False') == 'True'
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True
@@ -156,6 +259,11 @@ LOGGING = {
             'level': None,  # Config later
             'propagate': False,
         },
+        'apps.monitoring': {
+            'handlers': ['console', 'file'],
+            'level': None,  # Config later
+            'propagate': False,
+        },
     }
 }
 
@@ -6,6 +6,8 @@ load_dotenv()  # Load environment variables from .env file
 
 DEBUG = True
 
+QUERY_INSPECTOR_ENABLED = True  # Log N+1 queries & query budget overruns
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -17,6 +19,11 @@ DATABASES = {
     }
 }
 
+# A second alias on the same database, to try the replica routing locally
+if os.environ.get('DB_REPLICA', 'False') == 'True':
+    DATABASES['replica'] = {**DATABASES['default']}
+    REPLICA_DATABASES = ['replica']
+
 os.makedirs(LOGS_DIR, exist_ok=True)
 
 LOGGING['handlers']['console']['level'] = 'DEBUG'
@@ -1,3 +1,8 @@
+import copy
+from importlib.util import find_spec
+
+from django.core.exceptions import ImproperlyConfigured
+
 from .base import *
 
 
@@ -11,15 +16,62 @@ DATABASES = {
         'PASSWORD': os.environ.get('DB_PASSWORD'),
         'HOST': os.environ.get('DB_HOST'),
         'PORT': os.environ.get('DB_PORT'),
+        # Persistent connections: reused by the requests of a worker thread
+        # for up to DB_CONN_MAX_AGE seconds (0: a connection per request)
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': os.environ.get('DB_CONN_HEALTH_CHECKS', 'True') == 'True',  # Drop dead connections before reuse
+        'OPTIONS': {
+            'connect_timeout': int(os.environ.get('DB_CONNECT_TIMEOUT', '5')),  # Seconds
+            # Connection-wide statement timeout (seconds, 0: none); views set shorter ones
+            'options': f"-c statement_timeout={int(float(os.environ.get('DB_STATEMENT_TIMEOUT', '30')) * 1000)}",
+        },
     }
 }
 
+# Connection pool per worker process (psycopg 3 only: "psycopg[binary,pool]" in
+# requirements/prod.txt). Replaces persistent connections; see "Connection
+# Management" in the README for sizing.
+if os.environ.get('DB_POOL', 'False') == 'True':
+    if find_spec('psycopg') is None or find_spec('psycopg_pool') is None:
+        raise ImproperlyConfigured('DB_POOL needs psycopg 3 with its pool: pip install "psycopg[binary,pool]"')
+    DATABASES['default']['CONN_MAX_AGE'] = 0  # Required with pooling; connections return to the pool
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.environ.get('DB_POOL_MIN_SIZE', '2')),
+        'max_size': int(os.environ.get('DB_POOL_MAX_SIZE', '4')),
+        'timeout': float(os.environ.get('DB_POOL_TIMEOUT', '10')),  # Max. seconds a request waits for a connection
+        'max_idle': float(os.environ.get('DB_POOL_MAX_IDLE', '600')),  # Close connections idle this long (down to min_size)
+        'max_lifetime': float(os.environ.get('DB_POOL_MAX_LIFETIME', '3600')),  # Recycle connections after this long
+    }
+
+# Read replicas ("host" or "host:port", comma separated): same database name
+# & credentials as the primary unless DB_REPLICA_USER / DB_REPLICA_PASSWORD are set
+REPLICA_DATABASES = []
+for index, address in enumerate(filter(None, os.environ.get('DB_REPLICA_HOSTS', '').split(',')), start=1):
+    host, _, port = address.strip().partition(':')
+    alias = f'replica_{index}'
+    DATABASES[alias] = copy.deepcopy(DATABASES['default'])
+    DATABASES[alias].update({
+        'HOST': host,
+        'PORT': port or os.environ.get('DB_PORT'),
+        'USER': os.environ.get('DB_REPLICA_USER') or DATABASES['default']['USER'],
+        'PASSWORD': os.environ.get('DB_REPLICA_PASSWORD') or DATABASES['default']['PASSWORD'],
+    })
+    REPLICA_DATABASES.append(alias)
+
+# The file-based shared cache tier is for development & single-worker setups
+# only: its incr() & add() are not atomic across processes & culling scans
+# the cache directory
+if not os.environ.get('CACHE_REDIS_URL'):
+    raise ImproperlyConfigured('Production needs a Redis shared cache: set CACHE_REDIS_URL')
+
 SECURE_SSL_REDIRECT = True
 SESSION_COOKIE_SECURE = True
 CSRF_COOKIE_SECURE = True
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
 
+METRICS_REQUIRE_TOKEN = True  # /metrics (traffic & pool data) is denied unless METRICS_TOKEN is set
+
 os.makedirs(LOGS_DIR, exist_ok=True)
 
 LOGGING['handlers']['console']['level'] = 'INFO'
@@ -6,6 +6,8 @@ load_dotenv()  # Load environment variables from .env file
 
 DEBUG = True
 
+QUERY_INSPECTOR_ENABLED = True  # Log N+1 queries & query budget overruns
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -17,6 +19,10 @@ DATABASES = {
     }
 }
 
+# Replica alias for routing tests, a mirror of the test database
+# (REPLICA_DATABASES stays empty unless a test routes reads to it)
+DATABASES['replica'] = {**DATABASES['default'], 'TEST': {'MIRROR': 'default'}}
+
 # Disable security features that might slow down tests
 SECURE_SSL_REDIRECT = False
 SESSION_COOKIE_SECURE = False
@@ -5,6 +5,8 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from apps.monitoring.views import MetricsView
+
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -34,6 +36,8 @@ urlpatterns = [
     # Config URLs for custom apps
     path('auth/', include('apps.authentication.urls')),
     path('quiz/', include('apps.quiz.urls')),
+    path('monitoring/', include('apps.monitoring.urls')),
+    path('metrics', MetricsView.as_view(), name='metrics'),  # Prometheus scrape target
 
     # Config URLs for Swagger
     path('swagger<format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),  # example path: domain/swagger.json/
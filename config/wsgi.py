@@ -17,3 +17,17 @@ load_dotenv()
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', os.environ.get('SETTINGS_MODULE', 'config.settings.dev'))
 
 application = get_wsgi_application()
+
+# Optionally warm the caches in the background when a worker starts
+# (WARM_CACHES_HOST, the public host of the API, is required)
+if os.environ.get('WARM_CACHES_ON_STARTUP', 'False') == 'True':
+    from django.core.exceptions import ImproperlyConfigured
+    from apps.quiz.warmers import start_background_warmup
+
+    if not os.environ.get('WARM_CACHES_HOST'):
+        raise ImproperlyConfigured("WARM_CACHES_ON_STARTUP needs WARM_CACHES_HOST, the public host of the API")
+
+    start_background_warmup(
+        host=os.environ.get('WARM_CACHES_HOST'),
+        secure=os.environ.get('WARM_CACHES_SECURE', 'False') == 'True'
+    )
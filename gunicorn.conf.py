@@ -0,0 +1,25 @@
+# Gunicorn settings hooks, loaded from the project root by default
+# (gunicorn config.wsgi:application ..., also with uvicorn workers).
+# Worker & thread counts are passed on the command line (see the README).
+import os
+
+
+def worker_exit(server, worker):
+    # Runs in the exiting worker: write its last metrics to METRICS_MULTIPROC_DIR
+    if os.environ.get('METRICS_MULTIPROC_DIR'):
+        try:
+            from apps.monitoring.metrics import registry
+
+            registry.maybe_flush(force=True)
+        except Exception:
+            worker.log.exception("Flushing metrics of the exiting worker failed")
+
+
+def child_exit(server, worker):
+    # Runs in the master: fold the exited worker's metrics file into the
+    # archive, so its counters stay in the totals & its gauges are dropped
+    directory = os.environ.get('METRICS_MULTIPROC_DIR')
+    if directory:
+        from apps.monitoring.metrics import mark_process_dead
+
+        mark_process_dead(worker.pid, directory)
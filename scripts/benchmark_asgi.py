@@ -0,0 +1,132 @@
+"""
+Compare the WSGI deployment (gunicorn, gthread workers) against the ASGI one
+(gunicorn with uvicorn workers & ASYNC_READ_VIEWS) under the same load.
+
+Each server is started in turn with the same number of worker processes &
+loaded by apps/monitoring/load_test.py: virtual players browsing content &
+leaderboards, plus --slow-clients trickling their requests over
+--slow-seconds (clients on slow networks). Prints throughput, error rate &
+latency percentiles per action for both servers.
+
+Needs gunicorn, uvicorn & uvicorn-worker (requirements/prod.txt), a migrated
+database with the generate_load_data dataset & a cache shared by the workers.
+
+Usage (from the project root):
+    python -m scripts.benchmark_asgi [--workers 2] [--threads 4] [--concurrency 32]
+        [--slow-clients 16] [--slow-seconds 5] [--duration 30] [--settings config.settings.prod]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import http.client
+from importlib.util import find_spec
+
+from apps.monitoring.load_test import PROFILES, LoadTest
+
+
+def server_commands(workers, threads, port):
+    bind = f'127.0.0.1:{port}'
+    return {
+        'wsgi': [
+            sys.executable, '-m', 'gunicorn', 'config.wsgi:application', '--bind', bind,
+            '--workers', str(workers), '--worker-class', 'gthread', '--threads', str(threads)
+        ],
+        'asgi': [
+            sys.executable, '-m', 'gunicorn', 'config.asgi:application', '--bind', bind,
+            '--workers', str(workers), '--worker-class', 'uvicorn_worker.UvicornWorker'
+        ],
+    }
+
+
+def wait_until_ready(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+        try:
+            connection.request('GET', '/quiz/subjects/', headers={'Accept': 'application/json'})
+            if connection.getresponse().status == 200:
+                return
+        except (OSError, http.client.HTTPException):
+            pass
+        finally:
+            connection.close()
+        time.sleep(0.5)
+    raise RuntimeError(f"Server on port {port} not ready after {timeout}s")
+
+
+def run_server(command, env, options):
+    server = subprocess.Popen(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        wait_until_ready(options.port)
+        return LoadTest(
+            url=f'http://127.0.0.1:{options.port}',
+            mix=PROFILES[options.profile],
+            concurrency=options.concurrency,
+            duration=options.duration,
+            users=options.users,
+            prefix=options.prefix,
+            client_ips=options.concurrency,  # Keep per-IP throttles out of the comparison
+            slow_clients=options.slow_clients,
+            slow_seconds=options.slow_seconds,
+            seed=options.seed
+        ).run()
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--workers', type=int, default=2, help="Worker processes per server (default: 2)")
+    parser.add_argument('--threads', type=int, default=4, help="Threads per WSGI worker (default: 4)")
+    parser.add_argument('--concurrency', type=int, default=32, help="Virtual players (default: 32)")
+    parser.add_argument('--slow-clients', type=int, default=16, help="Slow clients (default: 16)")
+    parser.add_argument('--slow-seconds', type=float, default=5, help="Seconds to send a slow request (default: 5)")
+    parser.add_argument('--duration', type=float, default=30, help="Seconds per server (default: 30)")
+    parser.add_argument('--profile', choices=sorted(PROFILES), default='browse', help="Traffic profile (default: browse)")
+    parser.add_argument('--users', type=int, default=100, help="Generated users players log in as (default: 100)")
+    parser.add_argument('--prefix', default='load', help="Prefix of the generated dataset (default: load)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--port', type=int, default=8765, help="Port the servers listen on (default: 8765)")
+    parser.add_argument(
+        '--settings',
+        default=os.environ.get('SETTINGS_MODULE', 'config.settings.prod'),
+        help="Settings module of both servers (default: SETTINGS_MODULE or config.settings.prod)"
+    )
+    parser.add_argument('--output', help="Write both reports as JSON to this file")
+    options = parser.parse_args()
+
+    missing = [package for package in ('gunicorn', 'uvicorn', 'uvicorn_worker') if find_spec(package) is None]
+    if missing:
+        parser.exit(1, f"Install {', '.join(missing)} to run this benchmark (requirements/prod.txt).\n")
+
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': options.settings, 'SETTINGS_MODULE': options.settings}
+    reports = {}
+    for name, command in server_commands(options.workers, options.threads, options.port).items():
+        server_env = {**env, 'ASYNC_READ_VIEWS': 'True' if name == 'asgi' else 'False'}
+        print(f"{name}: {' '.join(command[1:])}", flush=True)
+        reports[name] = run_server(command, server_env, options)
+
+    print(f"\n{'server':<8}{'action':<13}{'requests':>9}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'errors':>8}")
+    for name, report in reports.items():
+        for action, result in report['actions'].items():
+            print(
+                f"{name:<8}{action:<13}{result['requests']:>9}{result['p50_ms']:>9.1f}"
+                f"{result['p90_ms']:>9.1f}{result['p99_ms']:>9.1f}{result['errors']:>8}"
+            )
+        print(f"{name:<8}{'total':<13}{report['requests']:>9}  {report['throughput_rps']} req/s, "
+              f"error rate {report['error_rate']}")
+
+    if options.output:
+        with open(options.output, 'w') as file:
+            json.dump(reports, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Compare the cache codec (utils/cache_codec.py) against plain pickling.
+
+For representative cached values (question page, subject page, leaderboard
+page, question bank) prints the encoded size & mean encode/decode time of:
+pickle (Django's default), JSON, JSON + zlib, pickle + zlib and msgpack
+(+ zlib, if installed).
+
+Usage (from the project root):
+    python -m scripts.benchmark_cache_codec [--iterations 2000]
+"""
+import argparse
+import pickle
+import timeit
+
+from utils.cache_codec import CacheCodec, msgpack
+
+
+def question_page(size=30):
+    return {
+        'count': 120,
+        'next': 'https://api.example.com/quiz/lessons/7/questions/?page=2&page_size=30',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'text': f'What is the result of operation number {i} in this lesson?',
+                'options': {'1': f'Answer {i}a', '2': f'Answer {i}b', '3': f'Answer {i}c'},
+                'correct_answer': i % 3 + 1,
+                'lesson': {
+                    'id': 7,
+                    'title': 'Linear equations',
+                    'subject': {'id': 2, 'name': 'Mathematics'}
+                }
+            }
+            for i in range(size)
+        ]
+    }
+
+
+def subject_page(size=10):
+    return {
+        'count': size,
+        'next': None,
+        'previous': None,
+        'results': [{'id': i, 'name': f'Subject {i}'} for i in range(size)]
+    }
+
+
+def leaderboard_page(size=25):
+    return {
+        'count': size,
+        'next': None,
+        'previous': None,
+        'results': [
+            {'username': f'player{i}', 'high_score': 15 - i % 15, 'avg_score': 9.5 - i / 10, 'total_played': 40 + i}
+            for i in range(size)
+        ]
+    }
+
+
+VALUES = {
+    'question page (30)': question_page(),
+    'subject page (10)': subject_page(),
+    'leaderboard page (25)': leaderboard_page(),
+    'question bank (30 IDs)': list(range(1000, 1030)),
+}
+
+
+def get_codecs():
+    codecs = {
+        'pickle': (
+            lambda value: pickle.dumps(value, pickle.DEFAULT_PROTOCOL),
+            pickle.loads
+        ),
+    }
+    for name, codec in [
+        ('json', CacheCodec(compress_min_size=None)),
+        ('json+zlib', CacheCodec()),
+        ('pickle+zlib', CacheCodec(format='pickle')),
+        ('msgpack', CacheCodec(format='msgpack', compress_min_size=None)),
+        ('msgpack+zlib', CacheCodec(format='msgpack')),
+    ]:
+        if name.startswith('msgpack') and msgpack is None:
+            continue  # Not installed
+        codecs[name] = (codec.dumps, codec.loads)
+    return codecs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000)
+    iterations = parser.parse_args().iterations
+
+    print(f"{'value':<24}{'codec':<14}{'bytes':>8}{'dumps us':>11}{'loads us':>11}")
+    for value_name, value in VALUES.items():
+        for codec_name, (dumps, loads) in get_codecs().items():
+            data = dumps(value)
+            dumps_us = timeit.timeit(lambda: dumps(value), number=iterations) / iterations * 1e6
+            loads_us = timeit.timeit(lambda: loads(data), number=iterations) / iterations * 1e6
+            print(f"{value_name:<24}{codec_name:<14}{len(data):>8}{dumps_us:>11.1f}{loads_us:>11.1f}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+Compare the orjson renderer & parser (utils/renderers.py, utils/parsers.py)
+against DRF's JSONRenderer & JSONParser.
+
+For representative response payloads (leaderboard page, question page &
+quiz attempts with datetimes & Decimals) prints the rendered size, mean
+render & parse time of both & whether their output is identical. Without
+orjson installed both sides run DRF's json-module code.
+
+Usage (from the project root):
+    python -m scripts.benchmark_json [--iterations 2000] [--settings config.settings.dev]
+"""
+import os
+import io
+import argparse
+import timeit
+from decimal import Decimal
+from datetime import datetime, timedelta, timezone
+
+from scripts.benchmark_cache_codec import question_page, leaderboard_page
+
+
+def attempt_page(size=30):
+    start = datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    return {
+        'count': 240,
+        'next': 'https://api.example.com/quiz/attempts/?page=2',
+        'previous': None,
+        'results': [
+            {
+                'id': i,
+                'user': 3,
+                'score': i % 15,
+                'start_time': start + timedelta(minutes=7 * i),
+                'completed': True,
+                'lesson': 7,
+                'accuracy': Decimal(i % 15) / Decimal(15),
+            }
+            for i in range(size)
+        ]
+    }
+
+
+PAYLOADS = {
+    'leaderboard page (25)': leaderboard_page(),
+    'question page (30)': question_page(),
+    'attempt page (30)': attempt_page(),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--settings', help="Django settings module (default: $DJANGO_SETTINGS_MODULE or config.settings.dev)")
+    args = parser.parse_args()
+
+    if args.settings:
+        os.environ['DJANGO_SETTINGS_MODULE'] = args.settings
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings.dev')
+
+    import django
+    django.setup()
+
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+    from utils.parsers import FastJSONParser
+    from utils.renderers import FastJSONRenderer, orjson
+
+    if orjson is None:
+        print("orjson is not installed: FastJSONRenderer & FastJSONParser fall back to DRF's\n")
+
+    iterations = args.iterations
+    pairs = {'drf': (JSONRenderer(), JSONParser()), 'orjson': (FastJSONRenderer(), FastJSONParser())}
+
+    print(f"{'payload':<24}{'codec':<9}{'bytes':>8}{'render us':>12}{'parse us':>11}  same output")
+    for payload_name, payload in PAYLOADS.items():
+        outputs = {}
+        for name, (renderer, json_parser) in pairs.items():
+            data = outputs[name] = renderer.render(payload)
+            render_us = timeit.timeit(lambda: renderer.render(payload), number=iterations) / iterations * 1e6
+            parse_us = timeit.timeit(
+                lambda: json_parser.parse(io.BytesIO(data)), number=iterations
+            ) / iterations * 1e6
+            same = '' if name == 'drf' else ('yes' if data == outputs['drf'] else 'NO')
+            print(f"{payload_name:<24}{name:<9}{len(data):>8}{render_us:>12.1f}{parse_us:>11.1f}  {same}")
+        print()
+
+
+if __name__ == '__main__':
+    main()
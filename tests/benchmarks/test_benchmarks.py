@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from apps.quiz.load_data import generate_load_data
+from benchmarks.compare import compare
+from benchmarks.run import run
+from benchmarks.scenarios import SCENARIOS, Dataset
+from apps.quiz.models import QuizAttempt
+
+
+@pytest.fixture
+def dataset(db):
+    generate_load_data(subjects=2, lessons=2, questions=16, users=5, attempts=30, seed=1)
+
+
+@pytest.mark.django_db
+class TestBenchmarks:
+    def test_runs_every_scenario(self, dataset):
+        report = run(iterations=3, log=lambda line: None)
+
+        assert set(report['results']) == set(SCENARIOS)
+        assert report['meta']['dataset']['attempts'] == 30
+        for name, result in report['results'].items():
+            assert result['errors'] == 0, name
+            assert result['p50_ms'] <= result['p99_ms']
+            assert result['queries_max'] >= result['queries_mean']
+        assert report['results']['quiz_submit']['status_codes'] == {'200': 3}
+        json.dumps(report)  # Serializable
+
+    def test_writes_are_rolled_back(self, dataset):
+        run(iterations=2, only=['quiz_start', 'quiz_submit'], log=lambda line: None)
+        assert QuizAttempt.objects.count() == 30
+
+    def test_requires_generated_data(self, db):
+        with pytest.raises(ValueError, match="generate_load_data"):
+            Dataset()
+
+
+def test_compare_flags_regressions():
+    base = {'results': {'quiz_start': {'p50_ms': 10, 'p99_ms': 20, 'throughput_rps': 100, 'queries_mean': 4}}}
+    head = {'results': {'quiz_start': {'p50_ms': 15, 'p99_ms': 20, 'throughput_rps': 120, 'queries_mean': 4}}}
+
+    rows = {label: (change, flag) for _, label, _, _, change, flag in compare(base, head)}
+
+    assert rows['p50 ms'] == (50.0, '-')
+    assert rows['req/s'] == (20.0, '+')
+    assert rows['p99 ms'] == (0.0, '')
@@ -1,6 +1,7 @@
 import pytest
 
 from django.test import RequestFactory
+from django.core.cache import cache
 from django.contrib.auth import get_user_model
 
 from rest_framework.test import APIClient
@@ -18,6 +19,19 @@ def request_factory():
     # Fixture for creating test requests
     return RequestFactory()
 
+@pytest.fixture
+def locmem_cache(settings):
+    # Fixture for a real in-memory cache (test settings use DummyCache)
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'quizLeaderAPI-test-cache',
+        }
+    }
+    cache.clear()
+    yield cache
+    cache.clear()
+
 @pytest.fixture
 def user(db):
     User = get_user_model()
@@ -0,0 +1,77 @@
+import json
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from apps.monitoring.load_test import PROFILES, LoadTest, parse_mix
+from apps.quiz.load_data import generate_load_data
+from apps.quiz.models import QuizAttempt
+
+
+@pytest.fixture
+def dataset(transactional_db):
+    generate_load_data(subjects=2, lessons=2, questions=16, users=5, attempts=10, seed=1)
+
+
+class TestParseMix:
+    def test_custom_mix(self):
+        assert parse_mix('start=30, submit=30,leaderboard=0') == {'start': 30, 'submit': 30, 'leaderboard': 0}
+
+    @pytest.mark.parametrize('value', ['dance=3', 'start=x', 'start=0'])
+    def test_invalid_mix(self, value):
+        with pytest.raises(ValueError):
+            parse_mix(value)
+
+
+class TestLoadTest:
+    def test_play_traffic(self, dataset, live_server):
+        # One player: the test server shares a single SQLite connection
+        # between its threads, so concurrent transactions would collide
+        load_test = LoadTest(
+            url=live_server.url, mix=PROFILES['play'], concurrency=1, duration=10,
+            max_requests=40, users=5, client_ips=3, seed=1
+        )
+
+        report = load_test.run()
+
+        assert report['requests'] == 40
+        assert set(report['actions']) <= {'login', 'start', 'submit', 'leaderboard'}
+        assert report['actions']['start']['status_codes'].get('200')
+        assert report['errors'] == 0, {action: result['status_codes'] for action, result in report['actions'].items()}
+        submitted = report['actions'].get('submit', {}).get('status_codes', {}).get('200', 0)
+        assert QuizAttempt.objects.filter(completed=False).count() >= report['actions']['start']['requests'] - submitted
+        assert report['config']['concurrency'] == 1
+
+    def test_slow_clients(self, dataset, live_server):
+        load_test = LoadTest(
+            url=live_server.url, mix=PROFILES['browse'], concurrency=1, duration=1,
+            users=5, slow_clients=1, slow_seconds=0.2, seed=1
+        )
+
+        report = load_test.run()
+
+        slow = report['actions']['slow_client']
+        assert slow['status_codes'] == {'200': slow['requests']}
+        assert slow['p50_ms'] >= 200
+        assert report['config']['slow_clients'] == 1
+
+    def test_command_writes_report(self, dataset, live_server, tmp_path):
+        output = tmp_path / 'report.json'
+        out = StringIO()
+
+        call_command(
+            'load_test', f'--url={live_server.url}', '--profile=browse', '--concurrency=2',
+            '--duration=10', '--requests=10', f'--output={output}', stdout=out
+        )
+
+        report = json.loads(output.read_text())
+        assert report['requests'] == 10
+        assert 'content' in out.getvalue() or 'leaderboard' in out.getvalue()
+        assert '10 requests' in out.getvalue()
+
+    def test_requires_a_server_with_data(self, transactional_db):
+        with pytest.raises(CommandError, match="No lessons found"):
+            call_command('load_test', '--url=http://127.0.0.1:9', '--duration=1', stdout=StringIO())
@@ -0,0 +1,82 @@
+from unittest.mock import patch
+
+import pytest
+
+from django.http import HttpResponse
+from django.urls import reverse, resolve
+
+from apps.quiz.models import Lesson, Question
+from apps.quiz.views import SubjectListCreateView
+from apps.monitoring.middleware import QueryInspectorMiddleware
+from apps.monitoring.queries import queries_inspected
+
+
+@pytest.fixture
+def reports(settings):
+    settings.QUERY_INSPECTOR_ENABLED = True
+    reports = []
+
+    def collect(sender, report, **kwargs):
+        reports.append(report)
+
+    queries_inspected.connect(collect)
+    yield reports
+    queries_inspected.disconnect(collect)
+
+
+def n_plus_one_view(request):
+    # One query per question for its lesson (no select_related)
+    for question in Question.objects.all():
+        Lesson.objects.get(id=question.lesson_id)
+    return HttpResponse()
+
+
+@pytest.mark.django_db
+class TestQueryInspectorMiddleware:
+    def test_flags_repeated_queries(self, reports, request_factory, questions):
+        request = request_factory.get('/quiz/questions/')
+        request.resolver_match = resolve(reverse('question_list_create', args=[1]))
+        middleware = QueryInspectorMiddleware(n_plus_one_view)
+
+        with patch('apps.monitoring.middleware.logger') as mock_logger:
+            response = middleware(request)
+
+        report, = reports
+        assert report.view == 'question_list_create'
+        assert report.count == 16
+        assert response['X-Query-Count'] == '16'
+        assert response['X-Query-Budget'] == '4'
+        assert report.over_budget
+        assert list(report.repeated().values()) == [15]
+
+        message = mock_logger.warning.call_args[0][0]
+        assert '15x SELECT' in message
+        assert 'test_query_inspector.py' in message  # Stack sample
+        assert 'in n_plus_one_view' in message
+
+    def test_within_budget(self, reports, api_client, subject):
+        with patch('apps.monitoring.middleware.logger') as mock_logger:
+            response = api_client.get(reverse('subject_list_create'))
+
+        report, = reports
+        assert report.view == 'subject_list_create'
+        assert not report.over_budget
+        assert response['X-Query-Budget'] == '3'
+        mock_logger.warning.assert_not_called()
+
+    def test_over_budget(self, reports, api_client, subject, monkeypatch):
+        monkeypatch.setattr(SubjectListCreateView, 'query_budget', {'GET': 0})
+
+        with patch('apps.monitoring.middleware.logger') as mock_logger:
+            api_client.get(reverse('subject_list_create'))
+
+        assert reports[0].over_budget
+        assert 'budget: 0' in mock_logger.warning.call_args[0][0]
+
+    def test_disabled(self, reports, settings, api_client):
+        settings.QUERY_INSPECTOR_ENABLED = False
+
+        response = api_client.get(reverse('subject_list_create'))
+
+        assert reports == []
+        assert 'X-Query-Count' not in response
@@ -0,0 +1,30 @@
+import pytest
+
+from django.urls import reverse
+
+from rest_framework import status
+
+from utils.cache_stats import cache_stats
+
+
+@pytest.mark.django_db
+class TestCacheStatsView:
+    def test_cache_stats_as_staff(self, staff_client):
+        cache_stats.reset()
+        cache_stats.record_get('questions:lesson:1', 0.001, 'misses')
+
+        response = staff_client.get(reverse('cache_stats'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['namespaces']['questions']['misses'] == 1
+        assert 'key_cardinality' in response.data
+        assert 'pid' in response.data
+        cache_stats.reset()
+
+    def test_cache_stats_as_user(self, authenticated_client):
+        response = authenticated_client.get(reverse('cache_stats'))
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_cache_stats_unauthorized(self, api_client):
+        response = api_client.get(reverse('cache_stats'))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -0,0 +1,80 @@
+import pytest
+
+from django.urls import reverse
+
+from rest_framework import status
+
+from apps.monitoring.metrics import registry
+
+
+@pytest.fixture
+def metrics(settings):
+    settings.METRICS_MULTIPROC_DIR = None
+    registry.reset()
+    yield registry
+    registry.reset()
+
+
+@pytest.mark.django_db
+class TestMetricsMiddleware:
+    def test_records_requests_per_url_name(self, metrics, api_client, subject):
+        api_client.get(reverse('subject_list_create'))
+        response = api_client.get(reverse('metrics'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'].startswith('text/plain; version=0.0.4')
+        text = response.content.decode()
+        assert 'http_requests_total{view="subject_list_create",method="GET",status="200"} 1' in text
+        assert 'http_request_duration_seconds_count{view="subject_list_create",method="GET"} 1' in text
+        assert 'http_request_db_queries_count{view="subject_list_create"} 1' in text
+        assert 'http_request_db_queries_bucket{view="subject_list_create",le="0"} 0' in text
+
+    def test_unresolved_paths_share_one_label(self, metrics, api_client):
+        api_client.get('/no-such-page/1/')
+        api_client.get('/no-such-page/2/')
+
+        text = api_client.get(reverse('metrics')).content.decode()
+
+        assert 'http_requests_total{view="<unresolved>",method="GET",status="404"} 2' in text
+        assert 'no-such-page' not in text
+
+
+@pytest.mark.django_db
+class TestMetricsView:
+    def test_metrics_with_token(self, metrics, settings, api_client):
+        settings.METRICS_TOKEN = 'scrape-secret'
+
+        response = api_client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer scrape-secret')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert '# TYPE http_requests_total counter' in response.content.decode()
+
+    def test_metrics_with_wrong_token(self, metrics, settings, api_client):
+        settings.METRICS_TOKEN = 'scrape-secret'
+
+        response = api_client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer wrong')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_metrics_without_token(self, metrics, settings, api_client):
+        settings.METRICS_TOKEN = 'scrape-secret'
+
+        response = api_client.get(reverse('metrics'))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_metrics_public_without_configured_token(self, metrics, settings, api_client):
+        settings.METRICS_TOKEN = ''
+        settings.METRICS_REQUIRE_TOKEN = False
+
+        response = api_client.get(reverse('metrics'))
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_metrics_denied_without_configured_token_when_required(self, metrics, settings, api_client):
+        settings.METRICS_TOKEN = ''
+        settings.METRICS_REQUIRE_TOKEN = True
+
+        response = api_client.get(reverse('metrics'), HTTP_AUTHORIZATION='Bearer ')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
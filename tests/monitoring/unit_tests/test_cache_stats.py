@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from utils.cache_backends import TwoTierCache
+from utils.cache_stats import CacheStats, cache_stats, key_namespace
+
+
+@pytest.fixture
+def stats():
+    cache_stats.reset()
+    yield cache_stats
+    cache_stats.reset()
+
+
+@pytest.fixture
+def worker(settings):
+    settings.CACHES = {
+        **settings.CACHES,
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'stats-shared',
+        }
+    }
+    worker = TwoTierCache('stats-worker', {
+        'OPTIONS': {'SHARED_ALIAS': 'shared', 'LOCAL_TIMEOUT': 60, 'LOCAL_MAX_ENTRIES': 3}
+    })
+    yield worker
+    worker.clear()
+
+
+@pytest.mark.parametrize('key, namespace', [
+    ('questions:lesson:1:v1:page:1:size:15', 'questions'),
+    ('subjects:v1:page:1:size:10', 'subjects'),
+    ('leaderboard:global:page:1:size:25', 'leaderboard'),
+    ('ns:catalog:version', 'ns'),
+    ('throttle_anon_127.0.0.1', 'throttle'),
+])
+def test_key_namespace(key, namespace):
+    assert key_namespace(key) == namespace
+
+
+class TestCacheStats:
+    def test_hits_misses_and_sets(self, stats, worker):
+        worker.get('questions:lesson:1:page:1')  # Miss
+        worker.set('questions:lesson:1:page:1', {'count': 0})
+        worker.get('questions:lesson:1:page:1')  # Local hit
+        worker.local.clear()
+        worker.get('questions:lesson:1:page:1')  # Shared hit
+
+        questions = stats.snapshot()['questions']
+        assert questions['misses'] == 1
+        assert questions['local_hits'] == 1
+        assert questions['shared_hits'] == 1
+        assert questions['sets'] == 1
+        assert questions['bytes'] > 0
+        assert questions['hit_ratio'] == round(2 / 3, 4)
+        assert questions['avg_get_ms'] is not None
+
+    def test_get_many(self, stats, worker):
+        worker.set('ns:catalog:version', 1)
+        worker.get_many(['ns:catalog:version', 'ns:subject:1:version'])
+
+        assert stats.snapshot()['ns']['shared_hits'] == 1
+        assert stats.snapshot()['ns']['misses'] == 1
+
+    def test_evictions(self, stats, worker):
+        for page in range(6):
+            worker.set(f'subjects:page:{page}', page)
+
+        assert stats.snapshot()['subjects']['evictions'] > 0
+
+    def test_summary_is_logged_periodically(self):
+        stats = CacheStats(log_interval=0)
+        with patch('utils.cache_stats.logger') as logger:
+            stats.record_set('leaderboard:global:page:1', 0.001, 100)
+
+        logger.info.assert_called_once()
+        assert '[leaderboard]' in logger.info.call_args.args[0]
@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from django.db.backends.signals import connection_created
+
+from apps.monitoring.database import collect_pool_metrics
+from apps.monitoring.metrics import MetricsRegistry, registry as default_registry, render
+
+
+class FakePool:
+    def __init__(self, stats):
+        self.stats = stats
+
+    def get_stats(self):
+        return self.stats
+
+
+class FakeConnection:
+    def __init__(self, alias, options, pool=None):
+        self.alias = alias
+        self.settings_dict = {'OPTIONS': options}
+        self.pool = pool
+
+
+@pytest.fixture
+def registry(settings):
+    settings.METRICS_MULTIPROC_DIR = None
+    return MetricsRegistry()
+
+
+class TestConnectionMetrics:
+    def test_new_connections_are_counted(self, settings):
+        settings.METRICS_MULTIPROC_DIR = None
+        default_registry.reset()
+
+        connection_created.send(sender=connection.__class__, connection=connection)
+        connection_created.send(sender=connection.__class__, connection=connection)
+
+        text = render(default_registry.collect())
+        assert 'db_connections_created_total{alias="default"} 2' in text
+        default_registry.reset()
+
+    def test_pool_statistics_are_collected(self, registry):
+        pooled = FakeConnection('default', {'pool': {'max_size': 4}}, FakePool({
+            'pool_size': 3,
+            'pool_available': 1,
+            'pool_max': 4,
+            'requests_num': 120,
+            'requests_queued': 7,
+            'requests_wait_ms': 250,
+        }))
+        registry.add_collector(lambda registry: collect_pool_metrics(registry, [pooled]))
+
+        text = render(registry.collect())
+
+        assert '# TYPE db_pool_size gauge' in text
+        assert 'db_pool_size{alias="default"} 3' in text
+        assert 'db_pool_available{alias="default"} 1' in text
+        assert 'db_pool_max_size{alias="default"} 4' in text
+        assert 'db_pool_requests_total{alias="default"} 120' in text
+        assert 'db_pool_requests_queued_total{alias="default"} 7' in text
+        assert 'db_pool_wait_seconds_total{alias="default"} 0.25' in text
+        # Counters absent from the pool's stats are reported as 0
+        assert 'db_pool_errors_total{alias="default"} 0' in text
+        assert 'db_pool_requests_waiting{alias="default"} 0' in text
+
+    def test_connections_without_pool_are_skipped(self, registry):
+        unpooled = FakeConnection('default', {'connect_timeout': 5}, FakePool({'pool_size': 3}))
+        registry.add_collector(lambda registry: collect_pool_metrics(registry, [unpooled]))
+
+        text = render(registry.collect())
+
+        assert 'db_pool_size{' not in text
+
+    def test_pool_values_are_replaced_not_summed(self, registry):
+        pool = FakePool({'pool_size': 2})
+        pooled = FakeConnection('default', {'pool': True}, pool)
+        registry.add_collector(lambda registry: collect_pool_metrics(registry, [pooled]))
+
+        registry.collect()
+        pool.stats = {'pool_size': 4}
+        text = render(registry.collect())
+
+        assert 'db_pool_size{alias="default"} 4' in text
@@ -0,0 +1,113 @@
+import os
+import json
+
+import pytest
+
+from apps.monitoring.metrics import MetricsRegistry, mark_process_dead, merge_snapshots, render
+
+
+@pytest.fixture
+def registry(settings):
+    settings.METRICS_MULTIPROC_DIR = None
+    return MetricsRegistry()
+
+
+class TestMetricsRegistry:
+    def test_observe_request(self, registry):
+        registry.observe_request('quiz:subject-list', 'GET', 200, 0.02, 3, 0.004)
+        registry.observe_request('quiz:subject-list', 'GET', 200, 0.3, 2, 0.001)
+
+        text = render(registry.collect())
+
+        assert 'http_requests_total{view="quiz:subject-list",method="GET",status="200"} 2' in text
+        assert (
+            'http_request_duration_seconds_bucket{view="quiz:subject-list",method="GET",le="0.025"} 1'
+            in text
+        )
+        assert (
+            'http_request_duration_seconds_bucket{view="quiz:subject-list",method="GET",le="0.5"} 2'
+            in text
+        )
+        assert 'http_request_duration_seconds_count{view="quiz:subject-list",method="GET"} 2' in text
+        assert 'http_request_db_queries_bucket{view="quiz:subject-list",le="2"} 1' in text
+        assert 'http_request_db_queries_sum{view="quiz:subject-list"} 5' in text
+        assert 'http_request_db_seconds_total{view="quiz:subject-list"} 0.005' in text
+
+    def test_render_declares_every_metric(self, registry):
+        text = render(registry.collect())
+
+        assert '# TYPE http_requests_total counter' in text
+        assert '# TYPE http_request_duration_seconds histogram' in text
+        assert '# TYPE http_request_db_queries histogram' in text
+        assert '# TYPE http_request_db_seconds_total counter' in text
+
+    def test_values_above_all_buckets_only_count_in_inf(self, registry):
+        registry.observe('http_request_duration_seconds', (('view', 'a'), ('method', 'GET')), 60)
+
+        text = render(registry.collect())
+
+        assert 'http_request_duration_seconds_bucket{view="a",method="GET",le="10"} 0' in text
+        assert 'http_request_duration_seconds_bucket{view="a",method="GET",le="+Inf"} 1' in text
+
+    def test_label_values_are_escaped(self, registry):
+        registry.inc('http_requests_total', (('view', 'a"b\\c'), ('method', 'GET'), ('status', '200')))
+
+        assert 'view="a\\"b\\\\c"' in render(registry.collect())
+
+
+class TestMultiprocessMode:
+    def test_merge_snapshots(self):
+        first, second = MetricsRegistry(), MetricsRegistry()
+        first.observe_request('a', 'GET', 200, 0.01, 1, 0.001)
+        second.observe_request('a', 'GET', 200, 0.01, 1, 0.001)
+        second.observe_request('a', 'GET', 404, 0.01, 0, 0)
+
+        text = render(merge_snapshots([first.snapshot(), second.snapshot()]))
+
+        assert 'http_requests_total{view="a",method="GET",status="200"} 2' in text
+        assert 'http_requests_total{view="a",method="GET",status="404"} 1' in text
+        assert 'http_request_duration_seconds_count{view="a",method="GET"} 3' in text
+
+    def test_collect_sums_the_files_of_all_processes(self, settings, tmp_path):
+        settings.METRICS_MULTIPROC_DIR = str(tmp_path)
+        other_worker = MetricsRegistry()
+        other_worker.observe_request('a', 'GET', 200, 0.01, 1, 0.001)
+        (tmp_path / 'metrics_999999.json').write_text(json.dumps(other_worker.snapshot()))
+
+        registry = MetricsRegistry()
+        registry.observe_request('a', 'GET', 200, 0.01, 1, 0.001)
+        text = render(registry.collect())
+
+        assert os.path.exists(tmp_path / f'metrics_{os.getpid()}.json')
+        assert 'http_requests_total{view="a",method="GET",status="200"} 2' in text
+
+    def test_collect_skips_unreadable_files(self, settings, tmp_path):
+        settings.METRICS_MULTIPROC_DIR = str(tmp_path)
+        (tmp_path / 'metrics_999999.json').write_text('{"counters": [')
+
+        registry = MetricsRegistry()
+        registry.observe_request('a', 'GET', 200, 0.01, 1, 0.001)
+
+        assert 'http_requests_total{view="a",method="GET",status="200"} 1' in render(registry.collect())
+
+    def test_mark_process_dead_archives_counters(self, settings, tmp_path):
+        settings.METRICS_MULTIPROC_DIR = str(tmp_path)
+        for pid in (999998, 999999):
+            dead_worker = MetricsRegistry()
+            dead_worker.observe_request('a', 'GET', 200, 0.01, 1, 0.001)
+            dead_worker.set_value('db_pool_size', (('alias', 'default'),), 4)
+            (tmp_path / f'metrics_{pid}.json').write_text(json.dumps(dead_worker.snapshot()))
+            mark_process_dead(pid, str(tmp_path))
+
+        text = render(MetricsRegistry().collect())
+
+        assert not os.path.exists(tmp_path / 'metrics_999999.json')
+        assert os.path.exists(tmp_path / 'metrics_archive.json')
+        assert 'http_requests_total{view="a",method="GET",status="200"} 2' in text
+        assert 'http_request_duration_seconds_count{view="a",method="GET"} 2' in text
+        assert 'db_pool_size{' not in text
+
+    def test_mark_process_dead_without_file(self, tmp_path):
+        mark_process_dead(999999, str(tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
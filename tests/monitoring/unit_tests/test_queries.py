@@ -0,0 +1,79 @@
+import pytest
+
+from apps.monitoring.queries import QueryReport, fingerprint_sql, get_query_budget
+
+
+@pytest.mark.parametrize('sql, fingerprint', [
+    (
+        'SELECT "quiz_subject"."id" FROM "quiz_subject" WHERE "quiz_subject"."id" = 7',
+        'SELECT "quiz_subject"."id" FROM "quiz_subject" WHERE "quiz_subject"."id" = ?'
+    ),
+    (
+        'SELECT * FROM quiz_question WHERE lesson_id = %s AND text = \'It\'\'s\'',
+        'SELECT * FROM quiz_question WHERE lesson_id = ? AND text = ?'
+    ),
+    (
+        'SELECT * FROM quiz_question WHERE id IN (%s, %s, %s)',
+        'SELECT * FROM quiz_question WHERE id IN (...)'
+    ),
+    (
+        'SELECT *\n  FROM quiz_lesson\n LIMIT 21',
+        'SELECT * FROM quiz_lesson LIMIT ?'
+    ),
+])
+def test_fingerprint_sql(sql, fingerprint):
+    assert fingerprint_sql(sql) == fingerprint
+
+
+def test_in_lists_of_any_length_share_a_fingerprint():
+    assert (
+        fingerprint_sql('SELECT * FROM t WHERE id IN (1, 2)')
+        == fingerprint_sql('SELECT * FROM t WHERE id IN (%s, %s, %s, %s)')
+    )
+
+
+class TestGetQueryBudget:
+    def test_budget_per_method(self):
+        class View:
+            query_budget = {'GET': 2, 'POST': 4}
+
+        def view_func():
+            pass
+        view_func.view_class = View
+
+        assert get_query_budget(view_func, 'GET') == 2
+        assert get_query_budget(view_func, 'POST') == 4
+        assert get_query_budget(view_func, 'DELETE') is None
+
+    def test_single_budget(self):
+        def view_func():
+            pass
+        view_func.query_budget = 3
+
+        assert get_query_budget(view_func, 'GET') == 3
+
+    def test_no_budget(self):
+        assert get_query_budget(lambda: None, 'GET') is None
+
+
+class TestQueryReport:
+    def test_over_budget(self):
+        report = QueryReport('subject_detail', 'GET', budget=2)
+        report.count = 3
+        assert report.over_budget
+
+        report.budget = None
+        assert not report.over_budget
+
+    def test_repeated_and_describe(self, settings):
+        settings.QUERY_REPEAT_THRESHOLD = 3
+        report = QueryReport('question_list_create', 'GET', budget=4)
+        report.count = 6
+        report.fingerprints.update({'SELECT lesson WHERE id = ?': 5, 'SELECT count': 1})
+        report.stacks['SELECT lesson WHERE id = ?'] = ['apps/quiz/serializers.py:10 in to_representation']
+
+        assert report.repeated() == {'SELECT lesson WHERE id = ?': 5}
+        description = report.describe()
+        assert 'GET question_list_create: 6 queries (budget: 4)' in description
+        assert '5x SELECT lesson WHERE id = ?' in description
+        assert 'apps/quiz/serializers.py:10 in to_representation' in description
@@ -0,0 +1,25 @@
+import pytest
+
+from apps.monitoring.queries import queries_inspected
+
+
+@pytest.fixture(autouse=True)
+def query_budgets(settings):
+    # Fail any test whose requests exceed their view's query_budget
+    # (QueryInspectorMiddleware), listing the repeated query shapes
+    settings.QUERY_INSPECTOR_ENABLED = True
+    reports = []
+
+    def collect(sender, report, **kwargs):
+        reports.append(report)
+
+    queries_inspected.connect(collect)
+    yield reports
+    queries_inspected.disconnect(collect)
+
+    over_budget = [report for report in reports if report.over_budget]
+    if over_budget:
+        pytest.fail(
+            "Query budget exceeded:\n" + "\n".join(report.describe() for report in over_budget),
+            pytrace=False
+        )
@@ -0,0 +1,114 @@
+from io import StringIO
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.contrib.auth import get_user_model
+from django.db.models import Count, Max, Q
+
+from apps.quiz.answers import unpack_answers
+from apps.quiz.models import Subject, Lesson, Question, QuizAttempt
+
+
+def generate(*args, **options):
+    out = StringIO()
+    call_command(
+        'generate_load_data',
+        '--subjects=2', '--lessons=3', '--questions=18', '--users=25', '--attempts=400',
+        '--batch-size=64', *args, stdout=out, **options
+    )
+    return out.getvalue()
+
+
+def attempt_rows():
+    # Attempts independent of database IDs (questions by their number)
+    numbers = {
+        question_id: text.split(' of ')[0]
+        for question_id, text in Question.objects.values_list('id', 'text')
+    }
+    return [
+        (username, title, score, completed, [numbers[question_id] for question_id in question_ids], bytes(answers))
+        for username, title, score, completed, question_ids, answers in QuizAttempt.objects.order_by('id').values_list(
+            'user__username', 'lesson__title', 'score', 'completed', 'question_ids', 'answers'
+        )
+    ]
+
+
+@pytest.mark.django_db
+class TestGenerateLoadDataCommand:
+    def test_creates_requested_rows(self):
+        output = generate()
+
+        assert 'Generated 2 subjects, 6 lessons, 108 questions, 25 users, 400 attempts' in output
+        assert Subject.objects.count() == 2
+        assert Lesson.objects.count() == 6
+        assert Question.objects.count() == 108
+        assert get_user_model().objects.count() == 25
+        assert QuizAttempt.objects.count() == 400
+        assert (
+            Question.objects.values('lesson').annotate(total=Count('id'))
+            .filter(total__gt=30).count() == 0
+        )
+
+    def test_attempts_are_consistent(self):
+        generate()
+
+        correct_answers = dict(Question.objects.values_list('id', 'correct_answer'))
+        for attempt in QuizAttempt.objects.all():
+            assert len(attempt.question_ids) == 15
+            assert set(attempt.question_ids) <= set(
+                attempt.lesson.questions.values_list('id', flat=True)
+            )
+            if not attempt.completed:
+                assert attempt.score == 0
+                continue
+
+            answers = unpack_answers(attempt.answers, len(attempt.question_ids))
+            assert 0 not in answers
+            assert attempt.score == sum(
+                1 for question_id, option in zip(attempt.question_ids, answers)
+                if option == correct_answers[question_id]
+            )
+
+    def test_user_stats_match_attempts(self):
+        generate()
+
+        users = get_user_model().objects.annotate(
+            played=Count('quizattempt', filter=Q(quizattempt__completed=True)),
+            best=Max('quizattempt__score')
+        )
+        for user in users:
+            assert user.total_played == user.played
+            assert user.highest_score == (user.best or 0)
+        assert users.first().check_password('loadtest123')
+
+    def test_scores_are_spread(self):
+        generate()
+
+        scores = list(QuizAttempt.objects.filter(completed=True).values_list('score', flat=True))
+        assert len(set(scores)) > 5
+        assert 4 < sum(scores) / len(scores) < 13
+
+    def test_seed_is_reproducible(self):
+        generate('--seed=7')
+        first = attempt_rows()
+
+        generate('--seed=7', '--clear')
+        assert attempt_rows() == first
+
+        generate('--seed=8', '--clear')
+        assert attempt_rows() != first
+
+    def test_existing_prefix_requires_clear(self):
+        generate()
+
+        with pytest.raises(CommandError, match="exists already"):
+            generate()
+
+        generate('--prefix=other')
+        assert Subject.objects.count() == 4
+
+    def test_questions_per_lesson_limit(self):
+        with pytest.raises(CommandError, match="between 1 and 30"):
+            call_command('generate_load_data', '--questions=31', stdout=StringIO())
@@ -0,0 +1,71 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.urls import reverse
+
+from apps.quiz.caching import question_bank_key
+from apps.quiz.models import QuizAttempt
+from apps.quiz.warmers import get_warmup_plan, start_background_warmup
+
+
+@pytest.mark.django_db
+class TestWarmCachesCommand:
+    def test_warms_catalog_lessons_questions_and_leaderboards(
+        self, api_client, subject, lesson, questions, locmem_cache, django_assert_num_queries
+    ):
+        out = StringIO()
+        call_command('warm_caches', '--host=api.example.com', stdout=out)
+
+        output = out.getvalue()
+        assert 'Warmed 6 targets' in output
+        assert reverse('subject_list_create') in output
+        assert reverse('global_leaderboard') in output
+        assert f'question bank of lesson {lesson.id}' in output
+
+        # Every warmed page is served without a query
+        with django_assert_num_queries(0):
+            for url in [
+                reverse('subject_list_create'),
+                reverse('lesson_list_create', kwargs={'subject_id': subject.id}),
+                reverse('question_list_create', kwargs={'lesson_id': lesson.id}),
+                reverse('subject_leaderboard', kwargs={'subject_id': subject.id}),
+                reverse('global_leaderboard')
+            ]:
+                assert api_client.get(url).status_code == 200
+        assert len(locmem_cache.get(question_bank_key(lesson.id))) == 15
+
+    def test_plan_prefers_most_played_lessons(self, user, subject, lesson):
+        other_lesson = subject.lessons.create(title='Geometry')
+        QuizAttempt.objects.create(user=user, lesson=other_lesson, score=0)
+
+        endpoints, lesson_ids = get_warmup_plan(lesson_limit=1)
+
+        assert lesson_ids == [other_lesson.id]
+        assert ('question_list_create', {'lesson_id': other_lesson.id}) in endpoints
+
+    def test_limits(self, subject, lesson):
+        out = StringIO()
+        call_command('warm_caches', '--subjects=0', '--lessons=0', '--host=api.example.com', stdout=out)
+
+        assert 'Warmed 2 targets' in out.getvalue()  # Subject list & global leaderboard
+
+    def test_host_required(self, monkeypatch):
+        monkeypatch.delenv('WARM_CACHES_HOST', raising=False)
+        with pytest.raises(CommandError, match="--host"):
+            call_command('warm_caches', stdout=StringIO())
+
+    def test_failed_targets(self, subject, lesson):
+        with patch('apps.quiz.warmers.warm_endpoint', return_value=500):
+            with pytest.raises(CommandError, match="5 targets failed"):
+                call_command('warm_caches', '--host=api.example.com', stdout=StringIO())
+
+
+@pytest.mark.django_db(transaction=True)
+def test_background_warmup(subject, locmem_cache):
+    start_background_warmup(host='api.example.com').join(timeout=10)
+
+    assert any(':page:' in key for key in locmem_cache._cache)
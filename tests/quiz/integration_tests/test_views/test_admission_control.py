@@ -0,0 +1,101 @@
+import time
+import threading
+
+import pytest
+
+from django.urls import reverse
+
+from rest_framework import status
+
+from utils.admission import AdmissionGate, get_gate
+
+
+@pytest.fixture
+def limits(settings):
+    settings.ADMISSION_LIMITS = {'global_leaderboard': {'concurrency': 1, 'queue_timeout': 0}}
+    settings.ADMISSION_RETRY_AFTER = 2
+    return settings.ADMISSION_LIMITS
+
+
+class TestAdmissionGate:
+    def test_admits_up_to_concurrency(self):
+        gate = AdmissionGate(concurrency=2)
+
+        assert gate.acquire()
+        assert gate.acquire()
+        assert not gate.acquire()
+
+        gate.release()
+        assert gate.acquire()
+
+    def test_queued_request_admitted_when_slot_frees(self):
+        gate = AdmissionGate(concurrency=1, queue_timeout=5)
+        gate.acquire()
+        threading.Timer(0.05, gate.release).start()
+
+        assert gate.acquire()
+        assert gate.active == 1
+
+    def test_queued_request_shed_after_deadline(self):
+        gate = AdmissionGate(concurrency=1, queue_timeout=0.05)
+        gate.acquire()
+
+        start = time.monotonic()
+        assert not gate.acquire()
+        assert time.monotonic() - start >= 0.05
+        assert gate.waiting == 0
+
+    def test_full_queue_sheds_at_once(self):
+        gate = AdmissionGate(concurrency=1, queue_timeout=5, max_queue=1)
+        gate.acquire()
+        waiter = threading.Thread(target=gate.acquire)
+        waiter.start()
+        while gate.waiting == 0:
+            time.sleep(0.001)
+
+        start = time.monotonic()
+        assert not gate.acquire()
+        assert time.monotonic() - start < 1
+
+        gate.release()
+        waiter.join()
+
+
+@pytest.mark.django_db
+class TestAdmissionControlMiddleware:
+    def test_request_over_limit_rejected(self, api_client, limits):
+        gate = get_gate('global_leaderboard')
+        gate.acquire()  # A request in progress
+        try:
+            response = api_client.get(reverse('global_leaderboard'))
+        finally:
+            gate.release()
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response['Retry-After'] == '2'
+        assert response.json() == {"detail": "The server is busy, please try again shortly."}
+
+    def test_slot_released_after_response(self, api_client, limits):
+        for _ in range(3):
+            response = api_client.get(reverse('global_leaderboard'))
+            assert response.status_code == status.HTTP_200_OK
+
+        assert get_gate('global_leaderboard').active == 0
+
+    def test_other_endpoints_keep_capacity(self, authenticated_client, limits, lesson, questions):
+        gate = get_gate('global_leaderboard')
+        gate.acquire()
+        try:
+            response = authenticated_client.post(reverse('quiz_start', kwargs={'lesson_id': lesson.id}))
+        finally:
+            gate.release()
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_gate_follows_setting_changes(self, limits, settings):
+        gate = get_gate('global_leaderboard')
+        settings.ADMISSION_LIMITS = {'global_leaderboard': {'concurrency': 3, 'queue_timeout': 0}}
+
+        assert get_gate('global_leaderboard') is not gate
+        assert get_gate('global_leaderboard').concurrency == 3
+        assert get_gate('quiz_submit') is None
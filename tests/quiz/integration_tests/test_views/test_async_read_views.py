@@ -0,0 +1,226 @@
+import importlib
+from contextlib import contextmanager
+
+import pytest
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.exceptions import ImproperlyConfigured
+from django.test import AsyncClient
+from django.urls import clear_url_caches, resolve, reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
+
+import config.urls
+import apps.quiz.urls
+from apps.monitoring.metrics import registry, render
+from apps.quiz.caching import LEADERBOARD_NAMESPACE, get_namespace_versions
+from apps.quiz.models import Subject, QuizAttempt
+from apps.quiz.paginators import GlobalLeaderboardPagination
+from utils.admission import get_gate
+from utils.async_views import AsyncReadView
+
+from .test_statement_timeouts import cancel_queries
+
+
+def reload_urls():
+    importlib.reload(apps.quiz.urls)
+    importlib.reload(config.urls)
+    clear_url_caches()
+
+
+@contextmanager
+def async_read_views(settings):
+    # URLconf as built with ASYNC_READ_VIEWS (ASGI deployments)
+    settings.ASYNC_READ_VIEWS = True
+    reload_urls()
+    try:
+        yield
+    finally:
+        settings.ASYNC_READ_VIEWS = False
+        reload_urls()
+
+
+@pytest.fixture
+def async_urls(settings):
+    with async_read_views(settings):
+        yield
+
+
+@pytest.fixture
+def completed_attempts(user, admin_user, lesson):
+    return [
+        QuizAttempt.objects.create(user=player, lesson=lesson, score=score, completed=True)
+        for player, score in ((user, 7), (admin_user, 9))
+    ]
+
+
+def read_endpoints(subject, lesson, question):
+    return [
+        ('subject_list_create', {}),
+        ('subject_detail', {'subject_id': subject.id}),
+        ('lesson_list_create', {'subject_id': subject.id}),
+        ('lesson_detail', {'lesson_id': lesson.id}),
+        ('question_list_create', {'lesson_id': lesson.id}),
+        ('question_detail', {'question_id': question.id}),
+        ('subject_leaderboard', {'subject_id': subject.id}),
+        ('global_leaderboard', {}),
+    ]
+
+
+@pytest.mark.django_db
+class TestAsyncReadViews:
+    @pytest.mark.parametrize('query', ['', '?page_size=5&page=2', '?fields=id&expand=lesson'])
+    def test_payloads_match_drf_views(self, settings, subject, lesson, questions, completed_attempts, query):
+        urls = [
+            reverse(name, kwargs=kwargs) + query
+            for name, kwargs in read_endpoints(subject, lesson, questions[0])
+        ]
+        expected = [APIClient().get(url) for url in urls]
+
+        with async_read_views(settings):
+            for url, drf_response in zip(urls, expected):
+                assert iscoroutinefunction(resolve(url.split('?')[0]).func)
+                response = APIClient().get(url)
+
+                assert response.status_code == drf_response.status_code, url
+                assert response.json() == drf_response.json(), url
+                assert response['Content-Type'] == drf_response['Content-Type']
+
+    def test_sparse_fields(self, async_urls, api_client, lesson, questions):
+        response = api_client.get(
+            reverse('question_list_create', kwargs={'lesson_id': lesson.id}) + '?fields=id,text'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['results'][0] == {'id': questions[0].id, 'text': questions[0].text}
+
+    def test_missing_subject(self, async_urls, api_client):
+        response = api_client.get(reverse('lesson_list_create', kwargs={'subject_id': 999}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "Subject not found."}
+
+    def test_invalid_page(self, async_urls, api_client, subject):
+        response = api_client.get(reverse('subject_list_create') + '?page=9')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json() == {"detail": "Invalid page."}
+
+    def test_cache_shared_with_drf_views(self, settings, locmem_cache, api_client, subject, django_assert_num_queries):
+        url = reverse('subject_detail', kwargs={'subject_id': subject.id})
+        cached = api_client.get(url).json()  # Cached by the DRF view
+
+        Subject.objects.filter(id=subject.id).update(name='Renamed')  # Bypasses invalidation
+        with async_read_views(settings), django_assert_num_queries(0):
+            response = api_client.get(url)
+
+        assert response.json() == cached
+
+    def test_miss_fills_cache(self, async_urls, locmem_cache, api_client, lesson, questions, django_assert_num_queries):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        first = api_client.get(url)
+
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+
+        assert second.json() == first.json()
+        assert len(first.json()['results']) == 15
+
+    def test_writes_served_by_drf_view(self, async_urls, admin_client):
+        response = admin_client.post(reverse('subject_list_create'), {'name': 'Physics'}, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Subject.objects.filter(name='Physics').exists()
+
+    def test_writes_still_need_permission(self, async_urls, authenticated_client):
+        response = authenticated_client.post(reverse('subject_list_create'), {'name': 'Physics'}, format='json')
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_browsable_api_served_by_drf_view(self, async_urls, api_client, subject):
+        response = api_client.get(reverse('subject_list_create'), HTTP_ACCEPT='text/html')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'].startswith('text/html')
+
+    def test_stale_copy_served_on_timeout(self, async_urls, api_client, completed_attempts, locmem_cache):
+        url = reverse('global_leaderboard')
+        fresh = api_client.get(url)
+
+        version = get_namespace_versions(LEADERBOARD_NAMESPACE)
+        locmem_cache.delete(f'leaderboard:global:v{version}:page:1:size:{GlobalLeaderboardPagination.page_size}')
+        with cancel_queries('quiz_quizattempt'):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Cache-Status'] == 'stale'
+        assert response.json() == fresh.json()
+
+    def test_timeout_without_stale_copy(self, async_urls, api_client, completed_attempts, settings):
+        settings.STATEMENT_TIMEOUT_RETRY_AFTER = 5
+
+        with cancel_queries('quiz_quizattempt'):
+            response = api_client.get(reverse('global_leaderboard'))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response['Retry-After'] == '5'
+        assert response.json() == {"detail": "The server is busy, please try again shortly."}
+
+
+class TestAsyncReadViewContract:
+    def test_sync_view_without_payload_builder(self):
+        class PlainView(APIView):
+            def get(self, request):
+                pass
+
+        class AsyncPlainView(AsyncReadView):
+            sync_view = PlainView
+
+        with pytest.raises(ImproperlyConfigured, match="abuild_payload"):
+            AsyncPlainView.as_view()
+
+
+@pytest.mark.django_db
+class TestAsyncMiddlewareChain:
+    # Requests through Django's ASGI handler: every middleware runs async &
+    # still sees the queries the async ORM runs in sync_to_async threads
+    def get(self, url, **headers):
+        return async_to_sync(AsyncClient().get)(url, headers=headers)
+
+    def test_query_count_reported(self, async_urls, lesson, questions):
+        response = self.get(reverse('question_list_create', kwargs={'lesson_id': lesson.id}))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Query-Count'] == '3'  # Lesson, count & page
+        assert response['X-Query-Budget'] == '4'
+
+    def test_request_metrics_recorded(self, async_urls, subject, settings):
+        settings.METRICS_MULTIPROC_DIR = None
+        registry.reset()
+        self.get(reverse('subject_detail', kwargs={'subject_id': subject.id}))
+
+        text = render(registry.collect())
+        assert 'http_requests_total{view="subject_detail",method="GET",status="200"} 1' in text
+        assert 'http_request_db_queries_sum{view="subject_detail"} 1' in text
+        registry.reset()
+
+    def test_drf_view_served_async(self, subject):
+        response = self.get(reverse('subject_detail', kwargs={'subject_id': subject.id}))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['name'] == subject.name
+
+    def test_admission_control_sheds(self, async_urls, settings):
+        settings.ADMISSION_LIMITS = {'global_leaderboard': {'concurrency': 1, 'queue_timeout': 0}}
+        gate = get_gate('global_leaderboard')
+        gate.acquire()  # A request in progress
+        try:
+            response = self.get(reverse('global_leaderboard'))
+        finally:
+            gate.release()
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert self.get(reverse('global_leaderboard')).status_code == status.HTTP_200_OK
+        assert gate.active == 0
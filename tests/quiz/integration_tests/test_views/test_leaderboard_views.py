@@ -209,3 +209,34 @@ class TestGlobalLeaderboardView:
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data['detail'] == "No data found."
+
+
+@pytest.mark.django_db
+class TestLeaderboardInvalidation:
+    def test_lesson_deletion_drops_cached_leaderboards(self, api_client, admin_client, subject, quiz_attempt, locmem_cache):
+        quiz_attempt.completed = True
+        quiz_attempt.save()
+        urls = [
+            reverse('global_leaderboard'),
+            reverse('subject_leaderboard', kwargs={'subject_id': subject.id})
+        ]
+        for url in urls:
+            assert api_client.get(url).data['count'] == 1  # Cached
+
+        response = admin_client.delete(reverse('lesson_detail', kwargs={'lesson_id': quiz_attempt.lesson_id}))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        for url in urls:
+            assert api_client.get(url).data['count'] == 0
+
+    def test_subject_deletion_drops_cached_global_leaderboard(self, api_client, admin_client, subject, quiz_attempt, locmem_cache, settings):
+        settings.QUERY_INSPECTOR_ENABLED = False  # The cascade over lessons, questions & attempts exceeds the empty-subject budget
+        quiz_attempt.completed = True
+        quiz_attempt.save()
+        url = reverse('global_leaderboard')
+        assert api_client.get(url).data['count'] == 1
+
+        response = admin_client.delete(reverse('subject_detail', kwargs={'subject_id': subject.id}))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        assert api_client.get(url).data['count'] == 0
@@ -38,6 +38,20 @@ class TestLessonListCreateView:
             assert isinstance(entry['subject'], dict)
             assert set(entry['subject'].keys()) >= {'id', 'name'}
 
+    def test_list_lessons_collapses_subject_without_expand(self, authenticated_client, subject, lesson):
+        url = reverse('lesson_list_create', kwargs={'subject_id': subject.id})
+        response = authenticated_client.get(f"{url}?fields=id,title,subject")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0] == {
+            'id': lesson.id,
+            'title': lesson.title,
+            'subject': subject.id
+        }
+
+        response = authenticated_client.get(f"{url}?expand=subject")
+        assert response.data['results'][0]['subject'] == {'id': subject.id, 'name': subject.name}
+
     def test_list_lessons_pagination(self, authenticated_client, subject):
         # Clear cache to ensure fresh data
         cache.clear()
@@ -5,7 +5,10 @@ from django.core.cache import cache
 
 from rest_framework import status
 
-from apps.quiz.models import Question
+from apps.quiz import regrade
+from apps.quiz.answers import pack_answers
+from apps.quiz.caching import get_namespace_versions, lesson_namespace
+from apps.quiz.models import Question, QuizAttempt
 
 
 @pytest.mark.django_db
@@ -76,6 +79,105 @@ class TestQuestionListCreateView:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 30  # Should be limited to max_page_size
 
+    def test_list_questions_sparse_fields(self, authenticated_client, lesson, questions):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        response = authenticated_client.get(f"{url}?fields=id,text")
+        
+        assert response.status_code == status.HTTP_200_OK
+        for entry in response.data['results']:
+            assert set(entry.keys()) == {'id', 'text'}
+
+    def test_list_questions_expand(self, authenticated_client, lesson, questions):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        response = authenticated_client.get(f"{url}?fields=id,lesson&expand=lesson")
+        
+        assert response.status_code == status.HTTP_200_OK
+        entry = response.data['results'][0]
+        assert set(entry.keys()) == {'id', 'lesson'}
+        assert entry['lesson'] == {
+            'id': lesson.id,
+            'title': lesson.title,
+            'subject': lesson.subject.id
+        }
+
+    def test_list_questions_query_count(self, authenticated_client, lesson, questions, django_assert_num_queries):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        # Lesson lookup, COUNT(*) & a single page query joining lesson & subject
+        with django_assert_num_queries(3):
+            response = authenticated_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 15
+
+    def test_list_questions_cache_hit_without_queries(self, api_client, lesson, questions, locmem_cache, django_assert_num_queries):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        first = api_client.get(url)
+        assert first.status_code == status.HTTP_200_OK
+
+        # Cached page is served without touching the database
+        with django_assert_num_queries(0):
+            second = api_client.get(url)
+        assert second.status_code == status.HTTP_200_OK
+        assert second.data == first.data
+
+    def test_list_questions_caches_empty_page(self, api_client, lesson, locmem_cache, django_assert_num_queries):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        api_client.get(url)
+
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+        assert response.data['count'] == 0
+
+    def test_list_questions_equivalent_page_sizes_share_cache(self, api_client, lesson, questions, locmem_cache, django_assert_num_queries):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        api_client.get(url, {'page_size': 30})
+
+        # Zero-padded & over-the-limit sizes resolve to the same cached page
+        with django_assert_num_queries(0):
+            padded = api_client.get(url, {'page_size': '030'})
+            capped = api_client.get(url, {'page_size': 9999})
+        assert len(padded.data['results']) == len(capped.data['results']) == 15
+
+    def test_list_questions_invalid_page_not_cached(self, api_client, lesson, questions, locmem_cache):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        response = api_client.get(url, {'page': 'abc'})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+        assert not any(':page:' in key for key in locmem_cache._cache)
+
+    def test_list_questions_unknown_fields_share_cache(self, api_client, lesson, questions, locmem_cache):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        for i in range(5):
+            response = api_client.get(url, {'fields': f'id,junk{i}'})
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data['results'][0] == {'id': questions[0].id}
+
+        assert len([key for key in locmem_cache._cache if ':page:' in key]) == 1
+
+    def test_list_questions_shared_key_keeps_own_links(self, api_client, lesson, questions, locmem_cache):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        first = api_client.get(url, {'page_size': '010', 'fields': 'id,junk', 'utm': 'spam'})
+        second = api_client.get(url, {'page_size': '10', 'fields': 'id'})
+
+        # One cache entry, each response with the links of its own request
+        assert len([key for key in locmem_cache._cache if ':page:' in key]) == 1
+        assert first.data['results'] == second.data['results']
+        assert first.data['next'] == f"http://testserver{url}?fields=id%2Cjunk&page=2&page_size=010&utm=spam"
+        assert second.data['next'] == f"http://testserver{url}?fields=id&page=2&page_size=10"
+
+    def test_list_questions_cache_invalidated_by_subject_update(self, admin_client, subject, lesson, questions, locmem_cache):
+        url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        admin_client.get(url)
+
+        admin_client.patch(
+            reverse('subject_detail', kwargs={'subject_id': subject.id}),
+            {'name': 'Mathematics'},
+            format='json'
+        )
+
+        response = admin_client.get(url)
+        assert response.data['results'][0]['lesson']['subject']['name'] == 'Mathematics'
+
     def test_list_questions_no_data(self, authenticated_client, lesson):
         # Clear cache to ensure fresh data
         cache.clear()
@@ -257,6 +359,18 @@ class TestQuestionDetailView:
         assert response.data['correct_answer'] == question.correct_answer
         assert response.data['lesson']['id'] == question.lesson.id
 
+    def test_get_question_sparse_fields(self, authenticated_client, questions):
+        question = questions[0]
+        url = reverse('question_detail', kwargs={'question_id': question.id})
+        response = authenticated_client.get(f"{url}?fields=id,text,lesson")
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {
+            'id': question.id,
+            'text': question.text,
+            'lesson': question.lesson.id
+        }
+
     def test_get_question_not_found(self, authenticated_client):
         url = reverse('question_detail', kwargs={'question_id': 99999})
         response = authenticated_client.get(url)
@@ -303,6 +417,101 @@ class TestQuestionDetailView:
         assert response.data['options'] == question.options
         assert response.data['correct_answer'] == question.correct_answer
 
+    def test_update_question_correct_answer_regrades_attempts(
+        self, admin_client, user, questions, django_capture_on_commit_callbacks
+    ):
+        question = questions[0]
+        attempt = QuizAttempt.objects.create(
+            user=user,
+            lesson=question.lesson,
+            score=2,
+            completed=True,
+            question_ids=[q.id for q in questions[:3]],
+            answers=pack_answers([2, 1, 1])  # First answer was right all along
+        )
+        user.highest_score = 2
+        user.save()
+
+        url = reverse('question_detail', kwargs={'question_id': question.id})
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.patch(url, {'correct_answer': 2}, format='json')
+
+        assert response.status_code == status.HTTP_200_OK
+        attempt.refresh_from_db()
+        user.refresh_from_db()
+        assert attempt.score == 3
+        assert user.highest_score == 3
+
+    @pytest.mark.django_db(transaction=True)  # Autocommit: on_commit callbacks run during the request
+    def test_failed_regrade_keeps_edit(self, admin_client, questions, locmem_cache, monkeypatch, settings):
+        settings.QUERY_INSPECTOR_ENABLED = False  # The cache warm-up also runs within the request
+
+        def fail(question_ids):
+            raise RuntimeError("regrade failed")
+
+        monkeypatch.setattr(regrade, 'regrade_questions', fail)
+        question = questions[0]
+        versions = get_namespace_versions(lesson_namespace(question.lesson_id))
+
+        response = admin_client.patch(
+            reverse('question_detail', kwargs={'question_id': question.id}),
+            {'correct_answer': 2},
+            format='json'
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        question.refresh_from_db()
+        assert question.correct_answer == 2
+        assert get_namespace_versions(lesson_namespace(question.lesson_id)) != versions
+
+    def test_update_question_warms_caches(
+        self, admin_client, api_client, lesson, questions, locmem_cache,
+        django_capture_on_commit_callbacks, django_assert_num_queries
+    ):
+        question = questions[0]
+        url = reverse('question_detail', kwargs={'question_id': question.id})
+        with django_capture_on_commit_callbacks(execute=True):
+            response = admin_client.patch(url, {'text': 'Updated question'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+
+        # Rebuilt after commit: readers never hit the cold path
+        list_url = reverse('question_list_create', kwargs={'lesson_id': lesson.id})
+        with django_assert_num_queries(0):
+            listed = api_client.get(list_url)
+        assert 'Updated question' in [q['text'] for q in listed.data['results']]
+
+        with django_assert_num_queries(0):
+            detail = api_client.get(url)
+        assert detail.data['text'] == 'Updated question'
+
+    def test_get_question_cached(self, api_client, questions, locmem_cache, django_assert_num_queries):
+        url = reverse('question_detail', kwargs={'question_id': questions[0].id})
+        first = api_client.get(url)
+
+        with django_assert_num_queries(0):  # The key needs no lookup of the question's lesson
+            second = api_client.get(url)
+        assert second.data == first.data
+
+    def test_get_question_cache_invalidated_by_lesson_and_subject_updates(self, admin_client, subject, lesson, questions, locmem_cache):
+        url = reverse('question_detail', kwargs={'question_id': questions[0].id})
+        admin_client.get(url)
+
+        admin_client.patch(reverse('lesson_detail', kwargs={'lesson_id': lesson.id}), {'title': 'Algebra'}, format='json')
+        response = admin_client.get(url)
+        assert response.data['lesson']['title'] == 'Algebra'
+
+        admin_client.patch(reverse('subject_detail', kwargs={'subject_id': subject.id}), {'name': 'Mathematics'}, format='json')
+        response = admin_client.get(url)
+        assert response.data['lesson']['subject']['name'] == 'Mathematics'
+
+    def test_get_question_cache_invalidated_by_delete(self, admin_client, questions, locmem_cache):
+        url = reverse('question_detail', kwargs={'question_id': questions[0].id})
+        assert admin_client.get(url).status_code == status.HTTP_200_OK
+
+        admin_client.delete(url)
+
+        assert admin_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
     def test_update_question_as_staff(self, staff_client, questions):
         question = questions[0]
         url = reverse('question_detail', kwargs={'question_id': question.id})
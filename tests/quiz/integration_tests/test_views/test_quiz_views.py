@@ -4,7 +4,8 @@ from django.urls import reverse
 
 from rest_framework import status
 
-from apps.quiz.models import QuizAttempt
+from apps.quiz.models import Question, QuizAttempt
+from apps.quiz.shuffle import option_permutation, displayed_option, IDENTITY_PERMUTATION
 
 
 @pytest.mark.django_db
@@ -26,6 +27,66 @@ class TestQuizStartView:
         assert attempt.score == 0
         assert not attempt.completed
 
+    def test_quiz_start_compact_payload(self, authenticated_client, lesson, questions):
+        url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
+        response = authenticated_client.post(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        # Lesson metadata is sent once at the top level
+        assert response.data['lesson']['id'] == lesson.id
+        assert response.data['lesson']['subject']['id'] == lesson.subject.id
+        # Questions carry no lesson & never leak the correct answer
+        for question in response.data['questions']:
+            assert set(question.keys()) == {'id', 'text', 'options'}
+
+    @pytest.mark.parametrize('question_count', [1, 15, 30])
+    def test_quiz_start_query_count_is_constant(
+        self, authenticated_client, lesson, question_count, django_assert_num_queries
+    ):
+        for i in range(question_count):
+            Question.objects.create(
+                text=f'Question {i+1}',
+                options={'1': 'A', '2': 'B', '3': 'C'},
+                correct_answer=1,
+                lesson=lesson
+            )
+
+        url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
+        # Lesson + subject, question IDs, selected questions, attempt insert
+        with django_assert_num_queries(4):
+            response = authenticated_client.post(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['questions']) == min(question_count, 15)
+
+    def test_quiz_start_uses_cached_question_bank(
+        self, authenticated_client, lesson, questions, locmem_cache, django_assert_num_queries
+    ):
+        url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
+        authenticated_client.post(url)
+
+        # Lesson + subject, selected questions, attempt insert
+        with django_assert_num_queries(3):
+            response = authenticated_client.post(url)
+        assert len(response.data['questions']) == 15
+
+    def test_quiz_start_shuffles_options_by_seed(self, authenticated_client, lesson, questions):
+        url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
+        response = authenticated_client.post(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        attempt = QuizAttempt.objects.get(id=response.data['attempt_id'])
+        assert attempt.option_seed is not None
+
+        # Served options follow the permutation derived from the attempt seed
+        options = {'1': 'A', '2': 'B', '3': 'C'}
+        for question in response.data['questions']:
+            permutation = option_permutation(attempt.option_seed, question['id'])
+            assert question['options'] == {
+                str(position): options[str(original)]
+                for position, original in enumerate(permutation, start=1)
+            }
+
     def test_quiz_start_unauthorized(self, api_client, lesson):
         url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
         response = api_client.post(url)
@@ -78,6 +139,22 @@ class TestQuizSubmitView:
         assert user.total_played == 1
         assert user.highest_score == len(questions)
 
+    def test_quiz_submit_maps_shuffled_answers_back(self, authenticated_client, lesson, questions):
+        start_url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
+        attempt_id = authenticated_client.post(start_url).data['attempt_id']
+        attempt = QuizAttempt.objects.get(id=attempt_id)
+
+        # Pick the displayed position of every correct answer
+        answers = {
+            str(question_id): str(displayed_option(1, option_permutation(attempt.option_seed, question_id)))
+            for question_id in attempt.question_ids
+        }
+        url = reverse('quiz_submit', kwargs={'attempt_id': attempt_id})
+        response = authenticated_client.post(url, {'answers': answers}, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['score'] == len(attempt.question_ids)
+
     def test_quiz_submit_partial_score(self, authenticated_client, questions, quiz_attempt):
         url = reverse('quiz_submit', kwargs={'attempt_id': quiz_attempt.id})
         
@@ -193,3 +270,86 @@ class TestQuizSubmitView:
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data['detail'] == "Quiz attempt not found."
+
+
+@pytest.mark.django_db
+class TestQuizAttemptReviewView:
+    def test_quiz_review_success(self, authenticated_client, lesson, questions, monkeypatch):
+        # A seed shuffling the options of every question (none displayed as stored)
+        seed = next(
+            seed for seed in range(10000)
+            if all(option_permutation(seed, q.id) != IDENTITY_PERMUTATION for q in questions)
+        )
+        monkeypatch.setattr('apps.quiz.views.quiz.new_option_seed', lambda: seed)
+
+        # Start a quiz & answer the first two served questions only
+        start_url = reverse('quiz_start', kwargs={'lesson_id': lesson.id})
+        start_response = authenticated_client.post(start_url)
+        attempt_id = start_response.data['attempt_id']
+        served = start_response.data['questions']
+        served_ids = [q['id'] for q in served]
+
+        # Players answer by displayed position: pick options by their text
+        def position(question, text):
+            return next(int(key) for key, value in question['options'].items() if value == text)
+
+        answers = {
+            str(served_ids[0]): str(position(served[0], 'A')),  # Correct
+            str(served_ids[1]): str(position(served[1], 'B'))
+        }
+
+        submit_url = reverse('quiz_submit', kwargs={'attempt_id': attempt_id})
+        authenticated_client.post(submit_url, {'answers': answers}, format='json')
+
+        url = reverse('quiz_attempt_review', kwargs={'attempt_id': attempt_id})
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['attempt_id'] == attempt_id
+        assert response.data['score'] == 1
+        review = response.data['questions']
+        assert [item['question_id'] for item in review] == served_ids
+        # Options are reported at the positions the player saw
+        assert review[0] == {
+            'question_id': served_ids[0],
+            'selected_option': position(served[0], 'A'),
+            'correct_answer': position(served[0], 'A'),
+            'is_correct': True
+        }
+        assert review[1] == {
+            'question_id': served_ids[1],
+            'selected_option': position(served[1], 'B'),
+            'correct_answer': position(served[1], 'A'),
+            'is_correct': False
+        }
+        assert review[2]['selected_option'] is None
+        assert review[2]['correct_answer'] == position(served[2], 'A')
+        assert review[2]['is_correct'] is False
+
+    def test_quiz_review_not_completed(self, authenticated_client, quiz_attempt):
+        url = reverse('quiz_attempt_review', kwargs={'attempt_id': quiz_attempt.id})
+        response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['detail'] == "Quiz not completed yet."
+
+    def test_quiz_review_unauthorized(self, api_client, quiz_attempt):
+        url = reverse('quiz_attempt_review', kwargs={'attempt_id': quiz_attempt.id})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_quiz_review_wrong_user(self, api_client, quiz_attempt):
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+        other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        api_client.force_authenticate(user=other_user)
+
+        url = reverse('quiz_attempt_review', kwargs={'attempt_id': quiz_attempt.id})
+        response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data['detail'] == "Quiz attempt not found."
@@ -0,0 +1,214 @@
+import pytest
+
+from django.db import connections
+from django.urls import reverse
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import status
+
+from apps.quiz.models import Subject, QuizAttempt
+from utils.replicas import ReplicaRouter, pin_to_primary
+
+from .test_async_read_views import async_read_views
+
+
+# The replica alias mirrors the test database (see the test settings), so
+# both aliases see the same rows; transactional tests commit them, which
+# makes them visible to the replica's own connection
+pytestmark = pytest.mark.django_db(transaction=True, databases=['default', 'replica'])
+
+
+@pytest.fixture
+def replica(settings):
+    settings.REPLICA_DATABASES = ['replica']
+    settings.REPLICA_PIN_SECONDS = 60
+
+
+class CapturedAliases:
+    # Queries run on the primary & the replica during the block
+    def __enter__(self):
+        self.primary = CaptureQueriesContext(connections['default'])
+        self.replica = CaptureQueriesContext(connections['replica'])
+        self.primary.__enter__()
+        self.replica.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.replica.__exit__(*exc_info)
+        self.primary.__exit__(*exc_info)
+
+
+class TestReplicaRouting:
+    def test_uncached_reads_use_replica(self, replica, authenticated_client, subject, lesson, questions, quiz_attempt):
+        urls = [
+            reverse('subject_list_create'),
+            reverse('lesson_list_create', kwargs={'subject_id': subject.id}),
+            reverse('question_list_create', kwargs={'lesson_id': lesson.id}),
+            reverse('subject_leaderboard', kwargs={'subject_id': subject.id}),
+            reverse('global_leaderboard'),
+        ]
+        for url in urls:
+            with CapturedAliases() as queries:
+                response = authenticated_client.get(f'{url}?page=last')  # Never cached
+
+            assert response.status_code == status.HTTP_200_OK, url
+            assert len(queries.replica) > 0, url
+            assert len(queries.primary) == 0, url
+
+    def test_cache_misses_read_from_primary(
+        self, replica, locmem_cache, authenticated_client, subject, lesson, questions, quiz_attempt
+    ):
+        urls = [
+            reverse('subject_list_create'),
+            reverse('subject_detail', kwargs={'subject_id': subject.id}),
+            reverse('lesson_list_create', kwargs={'subject_id': subject.id}),
+            reverse('lesson_detail', kwargs={'lesson_id': lesson.id}),
+            reverse('question_list_create', kwargs={'lesson_id': lesson.id}),
+            reverse('question_detail', kwargs={'question_id': questions[0].id}),
+            reverse('subject_leaderboard', kwargs={'subject_id': subject.id}),
+            reverse('global_leaderboard'),
+        ]
+        for url in urls:
+            with CapturedAliases() as queries:
+                response = authenticated_client.get(url)
+
+            assert response.status_code == status.HTTP_200_OK, url
+            assert len(queries.primary) > 0, url
+            assert len(queries.replica) == 0, url
+
+            # Then served from the cache
+            with CapturedAliases() as queries:
+                authenticated_client.get(url)
+
+            assert len(queries.replica) == 0, url
+
+    def test_writes_use_primary(self, replica, authenticated_client, user, lesson, questions):
+        with CapturedAliases() as queries:
+            response = authenticated_client.post(reverse('quiz_start', kwargs={'lesson_id': lesson.id}))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert QuizAttempt.objects.filter(user=user).exists()
+        assert len(queries.primary) > 0
+        assert len(queries.replica) == 0
+
+    def test_quiz_submit_uses_primary(self, replica, authenticated_client, user, lesson, questions):
+        attempt = QuizAttempt.objects.create(
+            user=user,
+            lesson=lesson,
+            score=0,
+            question_ids=[question.id for question in questions]
+        )
+
+        with CapturedAliases() as queries:
+            response = authenticated_client.post(
+                reverse('quiz_submit', kwargs={'attempt_id': attempt.id}),
+                {'answers': {str(questions[0].id): '1'}},
+                format='json'
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries.replica) == 0
+
+    def test_reads_stay_on_primary_after_own_write(
+        self, replica, locmem_cache, authenticated_client, api_client, user, admin_user, subject, lesson, questions
+    ):
+        start = authenticated_client.post(reverse('quiz_start', kwargs={'lesson_id': lesson.id}))
+        assert start.status_code == status.HTTP_200_OK
+
+        url = reverse('subject_leaderboard', kwargs={'subject_id': subject.id})
+        with CapturedAliases() as queries:
+            response = authenticated_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries.primary) > 0
+        assert len(queries.replica) == 0
+
+        # Other users still read uncached pages from the replica
+        api_client.force_authenticate(user=admin_user)
+        with CapturedAliases() as queries:
+            response = api_client.get(f'{url}?page=last')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries.replica) > 0
+
+    def test_pinned_user_skips_cached_page(self, replica, locmem_cache, authenticated_client, api_client, user, lesson):
+        url = reverse('global_leaderboard')
+        assert api_client.get(url).data['count'] == 0  # Cached before the write
+
+        QuizAttempt.objects.create(user=user, lesson=lesson, score=5, completed=True)
+        pin_to_primary(user.pk)
+
+        response = authenticated_client.get(url)
+        assert response.data['results'][0]['username'] == user.username
+
+        # The pinned read refreshed the shared copy
+        assert api_client.get(url).data['count'] == 1
+
+    def test_failed_write_does_not_pin(self, replica, locmem_cache, authenticated_client, subject):
+        response = authenticated_client.post(reverse('subject_list_create'), {'name': 'Physics'}, format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+        with CapturedAliases() as queries:
+            authenticated_client.get(f"{reverse('subject_list_create')}?page=last")
+
+        assert len(queries.replica) > 0
+
+    def test_pinned_user_reads_from_primary(self, replica, locmem_cache, authenticated_client, user, subject):
+        pin_to_primary(user.pk)
+
+        with CapturedAliases() as queries:
+            authenticated_client.get(reverse('subject_list_create'))
+
+        assert len(queries.replica) == 0
+
+    def test_async_reads_use_replica(self, replica, settings, locmem_cache, authenticated_client, user, subject, quiz_attempt):
+        urls = [reverse('subject_list_create'), reverse('global_leaderboard')]
+        with async_read_views(settings):
+            for url in urls:
+                with CapturedAliases() as queries:
+                    response = authenticated_client.get(f'{url}?page=last')  # Never cached
+
+                assert response.status_code == status.HTTP_200_OK, url
+                assert len(queries.replica) > 0, url
+                assert len(queries.primary) == 0, url
+
+                with CapturedAliases() as queries:
+                    response = authenticated_client.get(url)  # Cache miss
+
+                assert response.status_code == status.HTTP_200_OK, url
+                assert len(queries.replica) == 0, url
+
+            locmem_cache.clear()
+            pin_to_primary(user.pk)
+            with CapturedAliases() as queries:
+                authenticated_client.get(urls[0])
+
+        assert len(queries.replica) == 0
+
+    def test_without_replicas_everything_uses_primary(self, authenticated_client, subject):
+        with CapturedAliases() as queries:
+            response = authenticated_client.get(reverse('subject_list_create'))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(queries.primary) > 0
+        assert len(queries.replica) == 0
+
+
+class TestReplicaRouter:
+    def test_writes_go_to_primary(self, replica):
+        assert ReplicaRouter().db_for_write(Subject) == 'default'
+
+    def test_reads_outside_replica_views_use_default(self, replica):
+        assert ReplicaRouter().db_for_read(Subject) is None
+        assert Subject.objects.all().db == 'default'
+
+    def test_replicas_are_not_migrated(self, replica):
+        router = ReplicaRouter()
+
+        assert router.allow_migrate('default', 'quiz') is True
+        assert router.allow_migrate('replica', 'quiz') is False
+
+    def test_relations_between_primary_and_replica_objects(self, replica, subject):
+        replica_subject = Subject.objects.using('replica').get(id=subject.id)
+
+        assert ReplicaRouter().allow_relation(subject, replica_subject) is True
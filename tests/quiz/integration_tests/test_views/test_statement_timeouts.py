@@ -0,0 +1,86 @@
+from unittest import mock
+
+import pytest
+
+from django.db import OperationalError
+from django.db.backends.utils import CursorWrapper
+from django.urls import reverse
+
+from rest_framework import status
+
+from apps.quiz.caching import LEADERBOARD_NAMESPACE, get_namespace_versions
+from apps.quiz.paginators import GlobalLeaderboardPagination
+
+
+class QueryCanceled(Exception):
+    pgcode = '57014'  # As raised by psycopg2 when statement_timeout cancels a query
+
+
+def cancel_queries(table):
+    # Queries on the table fail like statements cancelled by PostgreSQL
+    execute = CursorWrapper._execute
+
+    def _execute(self, sql, params, *ignored_wrapper_args):
+        if table in sql:
+            raise OperationalError('canceling statement due to statement timeout') from QueryCanceled()
+        return execute(self, sql, params, *ignored_wrapper_args)
+
+    return mock.patch.object(CursorWrapper, '_execute', _execute)
+
+
+@pytest.mark.django_db
+class TestStatementTimeouts:
+    def test_timed_out_leaderboard_returns_503(self, api_client, quiz_attempt, settings):
+        settings.STATEMENT_TIMEOUT_RETRY_AFTER = 5
+
+        with cancel_queries('quiz_quizattempt'):
+            response = api_client.get(reverse('global_leaderboard'))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response['Retry-After'] == '5'
+        assert response.data['detail'] == "The server is busy, please try again shortly."
+
+    def test_timed_out_leaderboard_serves_stale_page(self, api_client, quiz_attempt, locmem_cache):
+        url = reverse('global_leaderboard')
+        fresh = api_client.get(url)
+        assert fresh.status_code == status.HTTP_200_OK
+
+        # The cached page expired, the stale copy is still there
+        version = get_namespace_versions(LEADERBOARD_NAMESPACE)
+        locmem_cache.delete(f'leaderboard:global:v{version}:page:1:size:{GlobalLeaderboardPagination.page_size}')
+        with cancel_queries('quiz_quizattempt'):
+            response = api_client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response['X-Cache-Status'] == 'stale'
+        assert response.data == fresh.data
+
+    def test_timed_out_subject_leaderboard_returns_503(self, api_client, subject, quiz_attempt):
+        with cancel_queries('quiz_quizattempt'):
+            response = api_client.get(reverse('subject_leaderboard', kwargs={'subject_id': subject.id}))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert 'Retry-After' in response
+
+    def test_timeout_in_view_catching_all_errors_returns_503(self, api_client, subject, settings):
+        settings.STATEMENT_TIMEOUT_RETRY_AFTER = 5
+
+        with cancel_queries('quiz_subject'), mock.patch('apps.quiz.views.subject.logger'):
+            response = api_client.get(reverse('subject_list_create'))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert response['Retry-After'] == '5'
+        assert response.json() == {"detail": "The server is busy, please try again shortly."}
+
+    def test_other_database_errors_stay_500(self, api_client, subject):
+        execute = CursorWrapper._execute
+
+        def _execute(self, sql, params, *ignored_wrapper_args):
+            if 'quiz_subject' in sql:
+                raise OperationalError('server closed the connection unexpectedly')
+            return execute(self, sql, params, *ignored_wrapper_args)
+
+        with mock.patch.object(CursorWrapper, '_execute', _execute), mock.patch('apps.quiz.views.subject.logger'):
+            response = api_client.get(reverse('subject_list_create'))
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
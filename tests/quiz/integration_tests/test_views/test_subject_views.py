@@ -1,10 +1,14 @@
 import pytest
 
 from django.urls import reverse
+from django.test import RequestFactory
 
 from rest_framework import status
+from rest_framework.test import APIClient
+from rest_framework.views import APIView
 
-from apps.quiz.models import Subject
+from apps.quiz.models import Subject, Lesson
+from apps.quiz.views import SubjectListCreateView, LessonListCreateView
 
 
 @pytest.mark.django_db
@@ -59,6 +63,35 @@ class TestSubjectListCreateView:
         assert response.status_code == status.HTTP_404_NOT_FOUND
         assert response.data['detail'] == "No subjects found."
 
+    def test_cached_page_links_follow_each_request(self, api_client, locmem_cache, settings):
+        settings.ALLOWED_HOSTS = ['localhost', 'api.example.com']
+        for i in range(15):
+            Subject.objects.create(name=f"Subject {i}")
+        url = reverse('subject_list_create')
+
+        response = api_client.get(f"{url}?utm=spam", HTTP_HOST='localhost')
+        assert response.data['next'] == f"http://localhost{url}?page=2&utm=spam"
+
+        # Page 1 from the cache, with the links of the current request
+        response = api_client.get(url, HTTP_HOST='api.example.com', secure=True)
+        assert response.data['count'] == 15
+        assert response.data['next'] == f"https://api.example.com{url}?page=2"
+        assert response.data['previous'] is None
+        assert list(response.data) == ['count', 'next', 'previous', 'results']
+
+        response = api_client.get(f"{url}?page=2", HTTP_HOST='localhost')
+        assert response.data['previous'] == f"http://localhost{url}"
+        assert response.data['next'] is None
+
+    def test_cached_page_stores_no_links(self, api_client, subject, locmem_cache):
+        url = reverse('subject_list_create')
+        api_client.get(url, HTTP_HOST='localhost')
+
+        cache_key = SubjectListCreateView().get_cache_key(
+            APIView().initialize_request(RequestFactory().get(url))
+        )
+        assert locmem_cache.get(cache_key) == {'count': 1, 'results': [{'id': subject.id, 'name': subject.name}]}
+
     def test_create_subject_as_admin(self, admin_client):
         url = reverse('subject_list_create')
         data = {'name': 'New Subject'}
@@ -68,6 +101,37 @@ class TestSubjectListCreateView:
         assert response.data['name'] == 'New Subject'
         assert Subject.objects.filter(name='New Subject').exists()
 
+    def test_create_subject_invalidates_subject_list(self, admin_client, subject, locmem_cache):
+        url = reverse('subject_list_create')
+        response = admin_client.get(url)
+        assert response.data['count'] == 1
+
+        admin_client.post(url, {'name': 'Physics'}, format='json')
+
+        response = admin_client.get(url)
+        assert response.data['count'] == 2
+
+    def test_create_subject_keeps_unrelated_caches(self, admin_client, subject, locmem_cache):
+        other_subject = Subject.objects.create(name='Physics')
+        Lesson.objects.create(title='Optics', subject=other_subject)
+
+        # Warm the other subject's lesson list & record anonymous throttle history
+        anon_client = APIClient()
+        anon_client.get(reverse('lesson_list_create', kwargs={'subject_id': other_subject.id}))
+        lesson_list_url = reverse('lesson_list_create', kwargs={'subject_id': other_subject.id})
+        lesson_list_key = LessonListCreateView().get_cache_key(
+            APIView().initialize_request(RequestFactory().get(lesson_list_url)),
+            other_subject.id
+        )
+        assert locmem_cache.get(lesson_list_key) is not None
+        assert locmem_cache.get('throttle_anon_127.0.0.1')
+
+        response = admin_client.post(reverse('subject_list_create'), {'name': 'Chemistry'}, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
+
+        assert locmem_cache.get(lesson_list_key) is not None
+        assert locmem_cache.get('throttle_anon_127.0.0.1')
+
     def test_create_subject_as_staff(self, staff_client):
         url = reverse('subject_list_create')
         data = {'name': 'New Subject'}
@@ -101,6 +165,31 @@ class TestSubjectListCreateView:
 
 @pytest.mark.django_db
 class TestSubjectDetailView:
+    def test_get_missing_subject_negative_cached(self, api_client, locmem_cache, django_assert_num_queries):
+        url = reverse('subject_detail', kwargs={'subject_id': 999})
+        assert api_client.get(url).status_code == status.HTTP_404_NOT_FOUND
+
+        # Enumerating the same missing ID again never reaches the database
+        with django_assert_num_queries(0):
+            response = api_client.get(url)
+            lessons_response = api_client.get(reverse('lesson_list_create', kwargs={'subject_id': 999}))
+            leaderboard_response = api_client.get(reverse('subject_leaderboard', kwargs={'subject_id': 999}))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data['detail'] == "Subject not found."
+        assert lessons_response.status_code == status.HTTP_404_NOT_FOUND
+        assert leaderboard_response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_create_subject_clears_negative_cache(self, api_client, admin_client, locmem_cache, django_capture_on_commit_callbacks):
+        url = reverse('subject_detail', kwargs={'subject_id': 999})
+        api_client.get(url)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Subject.objects.create(id=999, name='Physics')
+
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['name'] == 'Physics'
+
     def test_update_subject_put_as_admin(self, admin_client, subject):
         url = reverse('subject_detail', kwargs={'subject_id': subject.id})
         data = {'name': 'Updated Subject'}
@@ -0,0 +1,126 @@
+import pickle
+from datetime import datetime
+
+import pytest
+
+from utils import cache_codec
+from utils.cache_codec import CacheCodec, JSON, PICKLE, RAW, ZLIB
+from utils.cache_backends import TwoTierCache
+
+
+PAGE = {
+    'count': 30,
+    'next': 'http://testserver/quiz/lessons/1/questions/?page=2',
+    'previous': None,
+    'results': [
+        {'id': i, 'text': f'Question {i}', 'options': {'1': 'A', '2': 'B', '3': 'C'}, 'correct_answer': 1}
+        for i in range(30)
+    ]
+}
+
+
+class TestCacheCodec:
+    def test_small_values_are_json_uncompressed(self):
+        data = CacheCodec().dumps([1, 2, 3])
+
+        assert data == JSON + RAW + b'[1,2,3]'
+        assert CacheCodec().loads(data) == [1, 2, 3]
+
+    def test_large_values_are_compressed(self):
+        codec = CacheCodec()
+        data = codec.dumps(PAGE)
+
+        assert data[:2] == JSON + ZLIB
+        assert len(data) < len(pickle.dumps(PAGE))
+        assert codec.loads(data) == PAGE
+
+    def test_compression_threshold(self):
+        assert CacheCodec(compress_min_size=None).dumps(PAGE)[1:2] == RAW
+        assert CacheCodec(compress_min_size=1).dumps('ab')[1:2] == ZLIB
+
+    def test_non_json_values_fall_back_to_pickle(self):
+        value = {'created_at': datetime(2025, 1, 1)}
+        data = CacheCodec().dumps(value)
+
+        assert data[:1] == PICKLE
+        assert CacheCodec().loads(data) == value
+
+    @pytest.mark.parametrize('value', [
+        {1: 'A', 2: 'B'},
+        (1, 2),
+        {'results': [{'options': {1: 'A'}}]},
+        {'ids': [(1, 2)]},
+    ])
+    def test_values_json_would_change_fall_back_to_pickle(self, value):
+        codec = CacheCodec()
+        data = codec.dumps(value)
+
+        assert data[:1] == PICKLE
+        assert codec.loads(data) == value
+
+    def test_msgpack_tuples_fall_back_to_pickle(self):
+        pytest.importorskip('msgpack')
+        codec = CacheCodec(format='msgpack')
+        data = codec.dumps({'ids': (1, 2)})
+
+        assert data[:1] == PICKLE
+        assert codec.loads(data) == {'ids': (1, 2)}
+
+    def test_msgpack_falls_back_to_json_when_missing(self, monkeypatch):
+        monkeypatch.setattr(cache_codec, 'msgpack', None)
+        assert CacheCodec(format='msgpack').format == JSON
+
+    def test_msgpack_roundtrip(self):
+        pytest.importorskip('msgpack')
+        codec = CacheCodec(format='msgpack')
+        assert codec.loads(codec.dumps(PAGE)) == PAGE
+
+    def test_pickle_format(self):
+        codec = CacheCodec(format='pickle')
+        data = codec.dumps(PAGE)
+
+        assert data[:2] == PICKLE + ZLIB
+        assert codec.loads(data) == PAGE
+
+    def test_unknown_format(self):
+        with pytest.raises(ValueError):
+            CacheCodec(format='xml')
+        with pytest.raises(ValueError):
+            CacheCodec().loads(b'x-data')
+
+
+class TestTwoTierCacheCodec:
+    @pytest.fixture
+    def worker(self, settings):
+        settings.CACHES = {
+            **settings.CACHES,
+            'shared': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+                'LOCATION': 'codec-shared',
+            }
+        }
+        worker = TwoTierCache('codec-worker', {
+            'OPTIONS': {'SHARED_ALIAS': 'shared', 'CODEC': {'COMPRESS_MIN_SIZE': 1024}}
+        })
+        yield worker
+        worker.clear()
+
+    def test_shared_tier_holds_encoded_values(self, worker):
+        worker.set('page', PAGE)
+
+        assert worker.shared.get('page')[:2] == JSON + ZLIB
+        worker.local.clear()
+        assert worker.get('page') == PAGE
+        assert worker.get_many(['page']) == {'page': PAGE}
+
+    def test_counters_are_not_encoded(self, worker):
+        worker.set('ns:catalog:version', 1)
+
+        assert worker.shared.get('ns:catalog:version') == 1
+        assert worker.incr('ns:catalog:version') == 2
+
+    def test_codec_can_be_disabled(self, settings, worker):
+        raw = TwoTierCache('raw-worker', {'OPTIONS': {'SHARED_ALIAS': 'shared', 'CODEC': None}})
+        raw.set('page', PAGE)
+
+        assert worker.shared.get('page') == PAGE
@@ -0,0 +1,103 @@
+import pytest
+
+from rest_framework.views import APIView
+
+from apps.quiz.paginators import QuestionListPagination
+from apps.quiz.serializers import QuestionResponseSerializer
+from utils.cache import (
+    get_page_cache_key,
+    record_cache_key,
+    get_key_cardinality,
+    reset_key_cardinality
+)
+from utils.serializers import get_sparse_cache_key
+
+
+def page_key(request_factory, query):
+    request = APIView().initialize_request(request_factory.get(f'/questions/{query}'))
+    return get_page_cache_key('questions:lesson:1:v1', request, QuestionListPagination)
+
+
+class TestPageCacheKey:
+    def test_default_page_and_size(self, request_factory):
+        assert page_key(request_factory, '') == 'questions:lesson:1:v1:page:1:size:15'
+
+    @pytest.mark.parametrize('query', [
+        '?page_size=10',
+        '?page_size=010',
+        '?page=1&page_size=10',
+        '?page=01&page_size=+10'
+    ])
+    def test_equivalent_requests_share_key(self, request_factory, query):
+        assert page_key(request_factory, query) == 'questions:lesson:1:v1:page:1:size:10'
+
+    @pytest.mark.parametrize('query', ['?page_size=31', '?page_size=9999'])
+    def test_page_size_capped_at_max(self, request_factory, query):
+        assert page_key(request_factory, query).endswith(':size:30')
+
+    @pytest.mark.parametrize('query', ['?page_size=0', '?page_size=-5', '?page_size=abc'])
+    def test_invalid_page_size_falls_back_to_default(self, request_factory, query):
+        assert page_key(request_factory, query).endswith(':size:15')
+
+    @pytest.mark.parametrize('query', ['?page=0', '?page=-1', '?page=abc', '?page=last'])
+    def test_invalid_page_not_cached(self, request_factory, query):
+        assert page_key(request_factory, query) is None
+
+    def test_extra_suffix(self, request_factory):
+        request = APIView().initialize_request(request_factory.get('/questions/?page=2'))
+        key = get_page_cache_key('subjects:v1', request, QuestionListPagination, extra=':fields:id')
+        assert key == 'subjects:v1:page:2:size:15:fields:id'
+
+
+class TestSparseCacheKey:
+    def sparse_key(self, request_factory, query):
+        request = APIView().initialize_request(request_factory.get(f'/questions/{query}'))
+        return get_sparse_cache_key(request, QuestionResponseSerializer)
+
+    def test_full_representation(self, request_factory):
+        assert self.sparse_key(request_factory, '?page=2') == ''
+
+    def test_names_are_sorted(self, request_factory):
+        key = self.sparse_key(request_factory, '?fields=text,id,lesson&expand=subject,lesson')
+        assert key == ':fields:id,lesson,text:expand:lesson,subject'
+
+    @pytest.mark.parametrize('query', [
+        '?fields=id,text,junk0',
+        '?fields=junk1,text,id&expand=junk2',
+        '?fields=id,,text,id,lesson__id',
+    ])
+    def test_unknown_names_share_canonical_key(self, request_factory, query):
+        assert self.sparse_key(request_factory, query) == self.sparse_key(request_factory, '?fields=id,text')
+
+    def test_only_unknown_names(self, request_factory):
+        keys = {self.sparse_key(request_factory, f'?fields=junk{i}') for i in range(5)}
+        assert keys == {self.sparse_key(request_factory, '?fields=')}
+
+    def test_non_relations_not_expandable(self, request_factory):
+        assert self.sparse_key(request_factory, '?expand=text,options') == ':fields:*:expand:'
+
+
+class TestKeyCardinality:
+    def setup_method(self):
+        reset_key_cardinality()
+
+    def teardown_method(self):
+        reset_key_cardinality()
+
+    def test_counts_distinct_keys_per_namespace(self):
+        record_cache_key('questions:lesson:1:v1:page:1:size:15')
+        record_cache_key('questions:lesson:1:v1:page:1:size:15')
+        record_cache_key('questions:lesson:1:v1:page:2:size:15')
+        record_cache_key('subjects:v1:page:1:size:10')
+
+        assert get_key_cardinality() == {
+            'questions': {'keys': 2, 'capped': False},
+            'subjects': {'keys': 1, 'capped': False}
+        }
+
+    def test_tracking_is_capped(self, monkeypatch):
+        monkeypatch.setattr('utils.cache.MAX_TRACKED_KEYS', 2)
+        for page in range(5):
+            record_cache_key(f'subjects:v1:page:{page}:size:10')
+
+        assert get_key_cardinality() == {'subjects': {'keys': 2, 'capped': True}}
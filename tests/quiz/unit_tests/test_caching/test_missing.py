@@ -0,0 +1,86 @@
+import pytest
+
+from asgiref.sync import async_to_sync
+
+from apps.quiz.caching import (
+    missing_key,
+    is_known_missing,
+    forget_missing,
+    get_existing,
+    aget_existing
+)
+from apps.quiz.models import Subject, Lesson, QuizAttempt
+
+
+@pytest.mark.django_db
+class TestNegativeCaching:
+    def test_missing_key(self, user):
+        assert missing_key(Subject, 42) == 'missing:quiz.subject:42'
+        assert missing_key(QuizAttempt, 7, user=user) == f'missing:quiz.quizattempt:7:user:{user.pk}'
+
+    def test_missing_id_is_cached(self, locmem_cache, django_assert_num_queries):
+        with pytest.raises(Subject.DoesNotExist):
+            get_existing(Subject.objects.all(), 999)
+        assert is_known_missing(Subject, 999)
+
+        with django_assert_num_queries(0):
+            with pytest.raises(Subject.DoesNotExist):
+                get_existing(Subject.objects.all(), 999)
+
+    def test_async_lookup(self, subject, locmem_cache, django_assert_num_queries):
+        assert async_to_sync(aget_existing)(Subject.objects.all(), subject.id) == subject
+
+        with pytest.raises(Subject.DoesNotExist):
+            async_to_sync(aget_existing)(Subject.objects.all(), 999)
+        assert is_known_missing(Subject, 999)
+
+        with django_assert_num_queries(0):
+            with pytest.raises(Subject.DoesNotExist):
+                async_to_sync(aget_existing)(Subject.objects.all(), 999)
+
+    def test_existing_object_is_returned(self, subject, locmem_cache):
+        assert get_existing(Subject.objects.all(), subject.id) == subject
+        assert not is_known_missing(Subject, subject.id)
+
+    def test_created_object_is_forgotten(self, locmem_cache, django_capture_on_commit_callbacks):
+        with pytest.raises(Subject.DoesNotExist):
+            get_existing(Subject.objects.all(), 999)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            subject = Subject.objects.create(id=999, name='Physics')
+            assert is_known_missing(Subject, 999)  # Until the row is committed
+
+        assert not is_known_missing(Subject, 999)
+        assert get_existing(Subject.objects.all(), 999) == subject
+
+    def test_scoped_lookups(self, user, admin_user, lesson, locmem_cache):
+        attempt = QuizAttempt.objects.create(user=user, lesson=lesson, score=0)
+
+        # Another user's attempt is missing for them only
+        with pytest.raises(QuizAttempt.DoesNotExist):
+            get_existing(QuizAttempt.objects.all(), attempt.id, user=admin_user)
+        assert is_known_missing(QuizAttempt, attempt.id, user=admin_user)
+        assert get_existing(QuizAttempt.objects.all(), attempt.id, user=user) == attempt
+
+    def test_created_attempt_is_forgotten_for_its_user(self, user, lesson, locmem_cache, django_capture_on_commit_callbacks):
+        with pytest.raises(QuizAttempt.DoesNotExist):
+            get_existing(QuizAttempt.objects.all(), 999, user=user)
+
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            QuizAttempt.objects.create(id=999, user=user, lesson=lesson, score=0)
+
+        assert len(callbacks) == 1
+        assert not is_known_missing(QuizAttempt, 999, user=user)
+
+    def test_forget_missing(self, locmem_cache):
+        with pytest.raises(Lesson.DoesNotExist):
+            get_existing(Lesson.objects.all(), 5)
+
+        forget_missing(Lesson, 5)
+        assert not is_known_missing(Lesson, 5)
+
+    def test_without_cache_backend(self):
+        # DummyCache stores nothing; lookups still hit the database
+        with pytest.raises(Subject.DoesNotExist):
+            get_existing(Subject.objects.all(), 999)
+        assert not is_known_missing(Subject, 999)
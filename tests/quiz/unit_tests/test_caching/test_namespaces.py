@@ -0,0 +1,40 @@
+from apps.quiz.caching import (
+    CATALOG_NAMESPACE,
+    subject_namespace,
+    lesson_namespace,
+    get_namespace_versions,
+    bump_namespaces
+)
+
+
+class TestNamespaceVersions:
+    def test_versions_are_stable_until_bumped(self, locmem_cache):
+        first = get_namespace_versions(CATALOG_NAMESPACE)
+        assert get_namespace_versions(CATALOG_NAMESPACE) == first
+
+        bump_namespaces(CATALOG_NAMESPACE)
+        assert get_namespace_versions(CATALOG_NAMESPACE) != first
+
+    def test_bump_only_touches_given_namespaces(self, locmem_cache):
+        subject_version = get_namespace_versions(subject_namespace(1))
+        other_version = get_namespace_versions(subject_namespace(2))
+
+        bump_namespaces(subject_namespace(1))
+
+        assert get_namespace_versions(subject_namespace(1)) != subject_version
+        assert get_namespace_versions(subject_namespace(2)) == other_version
+
+    def test_combined_versions_change_with_any_namespace(self, locmem_cache):
+        combined = get_namespace_versions(subject_namespace(1), lesson_namespace(5))
+
+        bump_namespaces(subject_namespace(1))
+        assert get_namespace_versions(subject_namespace(1), lesson_namespace(5)) != combined
+
+    def test_bump_without_counter_does_not_fail(self, locmem_cache):
+        bump_namespaces(lesson_namespace(99))
+        assert get_namespace_versions(lesson_namespace(99))
+
+    def test_versions_without_cache_backend(self):
+        # DummyCache stores nothing; versions must still be usable in keys
+        assert get_namespace_versions(CATALOG_NAMESPACE)
+        bump_namespaces(CATALOG_NAMESPACE)
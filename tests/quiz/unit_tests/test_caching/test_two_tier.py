@@ -0,0 +1,161 @@
+import time
+
+import pytest
+
+from asgiref.sync import async_to_sync
+from django.core.cache import caches
+
+from apps.quiz.caching import (
+    CATALOG_NAMESPACE,
+    get_namespace_versions,
+    bump_namespaces
+)
+from utils.cache_backends import TwoTierCache
+
+
+def make_worker(name, **options):
+    # A TwoTierCache as a separate worker process would build it
+    return TwoTierCache(name, {
+        'OPTIONS': {'SHARED_ALIAS': 'shared', 'LOCAL_TIMEOUT': 60, **options}
+    })
+
+
+@pytest.fixture
+def shared_cache(settings, tmp_path):
+    # File-based shared tier (as in the default settings)
+    settings.CACHES = {
+        **settings.CACHES,
+        'shared': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmp_path),
+        }
+    }
+    yield caches['shared']
+    caches['shared'].clear()
+
+
+class TestTwoTierCache:
+    def test_set_and_get(self, shared_cache):
+        worker = make_worker('worker-set')
+        worker.set('page', {'count': 1})
+
+        assert worker.get('page') == {'count': 1}
+        assert shared_cache.get('page') is not None
+        assert make_worker('worker-set-other').get('page') == {'count': 1}
+        assert worker.get('missing', 'default') == 'default'
+
+    def test_reads_fill_local_tier(self, shared_cache):
+        shared_cache.set('page', 'v1')
+        worker = make_worker('worker-fill')
+
+        assert worker.get('page') == 'v1'
+
+        # Served from the local tier until it expires
+        shared_cache.set('page', 'v2')
+        assert worker.get('page') == 'v1'
+        assert worker.local.get('page') == 'v1'
+
+    def test_other_workers_read_shared_writes(self, shared_cache):
+        writer, reader = make_worker('worker-a'), make_worker('worker-b')
+        writer.set('page', 'cached by a')
+
+        assert reader.get('page') == 'cached by a'
+
+    def test_shared_only_keys_skip_local_tier(self, shared_cache):
+        worker = make_worker('worker-ns')
+        worker.set('ns:catalog:version', 1)
+        worker.get('ns:catalog:version')
+
+        assert worker.local.get('ns:catalog:version') is None
+        shared_cache.set('ns:catalog:version', 2)
+        assert worker.get('ns:catalog:version') == 2
+
+    def test_version_bump_propagates_across_workers(self, shared_cache, settings):
+        settings.CACHES = {
+            **settings.CACHES,
+            'default': {
+                'BACKEND': 'utils.cache_backends.TwoTierCache',
+                'LOCATION': 'worker-default',
+                'OPTIONS': {'SHARED_ALIAS': 'shared', 'LOCAL_TIMEOUT': 60},
+            }
+        }
+        other_worker = make_worker('worker-other')
+
+        version = get_namespace_versions(CATALOG_NAMESPACE)
+        assert other_worker.get(f'ns:{CATALOG_NAMESPACE}:version') == int(version)
+
+        bump_namespaces(CATALOG_NAMESPACE)
+        assert other_worker.get(f'ns:{CATALOG_NAMESPACE}:version') == int(version) + 1
+
+    def test_local_tier_is_bounded(self, shared_cache):
+        worker = make_worker('worker-lru', LOCAL_MAX_ENTRIES=5)
+        for i in range(20):
+            worker.set(f'page:{i}', i)
+
+        assert len(worker.local._cache) <= 5
+        assert worker.get('page:0') == 0  # Evicted locally, still shared
+
+    def test_local_copy_never_outlives_timeout(self, shared_cache):
+        worker = make_worker('worker-ttl')
+        worker.set('page', 'v1', timeout=0)
+
+        assert worker.local.get('page') is None
+
+    def test_delete_and_incr_drop_local_copy(self, shared_cache):
+        worker = make_worker('worker-delete')
+        worker.set('page', 'v1')
+        worker.set('counter', 1)
+
+        worker.delete('page')
+        assert worker.get('page') is None
+
+        assert worker.incr('counter') == 2
+        assert worker.get('counter') == 2
+
+    def test_incr_keeps_stamps_without_expiry(self, shared_cache, monkeypatch):
+        # FileBasedCache has no incr() of its own (BaseCache: get + set)
+        worker = make_worker('worker-incr-stamp')
+        worker.add('ns:catalog:version', 1, timeout=None)
+        worker.set('counter', 1)
+
+        assert worker.incr('ns:catalog:version') == 2
+        assert worker.decr('ns:catalog:version', 3) == -1
+        assert worker.incr('counter') == 2
+
+        # Past the default timeout (300s) only the stamp is left
+        later = time.time() + 400
+        monkeypatch.setattr('django.core.cache.backends.filebased.time.time', lambda: later)
+        assert shared_cache.get('ns:catalog:version') == -1
+        assert shared_cache.get('counter') is None
+
+        with pytest.raises(ValueError):
+            worker.incr('ns:missing:version')
+
+    def test_async_get(self, shared_cache):
+        worker = make_worker('worker-async')
+        shared_cache.set('page', worker._encode('v1'))
+
+        assert async_to_sync(worker.aget)('page') == 'v1'  # From the shared tier
+
+        shared_cache.delete('page')
+        assert async_to_sync(worker.aget)('page') == 'v1'  # Local copy
+        assert async_to_sync(worker.aget)('missing', 'default') == 'default'
+
+    def test_many(self, shared_cache):
+        worker = make_worker('worker-many')
+        worker.set_many({'a': 1, 'ns:b:version': 2})
+
+        assert worker.get_many(['a', 'ns:b:version', 'c']) == {'a': 1, 'ns:b:version': 2}
+
+        worker.delete_many(['a', 'ns:b:version'])
+        assert worker.get_many(['a', 'ns:b:version']) == {}
+
+    def test_add_and_clear(self, shared_cache):
+        worker = make_worker('worker-clear')
+        assert worker.add('page', 'v1')
+        assert not worker.add('page', 'v2')
+        assert worker.has_key('page')
+
+        worker.clear()
+        assert worker.get('page') is None
+        assert shared_cache.get('page') is None
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from django.urls import reverse
+
+from apps.quiz.caching import question_bank_key
+from apps.quiz.models import Subject
+from apps.quiz.views import SubjectListCreateView
+from apps.quiz.warmers import (
+    build_warm_request,
+    warm_endpoint,
+    warm_caches,
+    schedule_lesson_warmup
+)
+
+
+@pytest.mark.django_db
+class TestWarmers:
+    def test_warm_endpoint_caches_first_page(self, subject, locmem_cache):
+        assert warm_endpoint('subject_list_create', host='api.example.com') == 200
+
+        request = build_warm_request(reverse('subject_list_create'), host='api.example.com')
+        payload = locmem_cache.get(SubjectListCreateView().get_cache_key(request))
+        assert payload['count'] == 1
+
+    def test_warmed_page_links_follow_client(self, api_client, subject, locmem_cache, settings):
+        settings.ALLOWED_HOSTS = ['api.example.com', 'localhost']
+        for i in range(12):
+            Subject.objects.create(name=f'Subject {i}')
+        warm_caches(endpoints=[('subject_list_create', {})], host='api.example.com', secure=True)
+
+        response = api_client.get(reverse('subject_list_create'), HTTP_HOST='localhost')
+        assert response.data['count'] == 13
+        assert response.data['next'] == 'http://localhost/quiz/subjects/?page=2'
+
+    def test_host_required(self):
+        with pytest.raises(ValueError, match="public host"):
+            build_warm_request('/quiz/subjects/', host=None)
+        with pytest.raises(ValueError, match="public host"):
+            warm_caches(endpoints=[('subject_list_create', {})])
+
+    def test_warm_request_uses_given_host(self):
+        request = build_warm_request('/quiz/subjects/', host='localhost', secure=True)
+        assert request.build_absolute_uri() == 'https://localhost/quiz/subjects/'
+
+    def test_warm_caches_reports_timings(self, subject, lesson, questions, locmem_cache):
+        timings = warm_caches(
+            endpoints=[('lesson_list_create', {'subject_id': subject.id})],
+            lesson_ids=[lesson.id],
+            host='api.example.com'
+        )
+
+        assert set(timings) == {
+            reverse('lesson_list_create', kwargs={'subject_id': subject.id}),
+            f'question bank of lesson {lesson.id}'
+        }
+        assert len(locmem_cache.get(question_bank_key(lesson.id))) == 15
+
+    def test_warm_caches_logs_failures(self, lesson):
+        with patch('apps.quiz.warmers.get_question_bank', side_effect=RuntimeError('cache down')), \
+                patch('apps.quiz.warmers.logger') as logger:
+            assert warm_caches(lesson_ids=[lesson.id]) == {}
+
+        logger.warning.assert_called_once()
+        assert 'cache down' in logger.warning.call_args.args[0]
+
+    def test_non_200_responses_are_failures(self, locmem_cache):
+        with patch('apps.quiz.warmers.logger') as logger:
+            timings = warm_caches(endpoints=[('lesson_list_create', {'subject_id': 999})], host='api.example.com')
+
+        assert timings == {}
+        assert 'HTTP 404' in logger.warning.call_args.args[0]
+
+    def test_warmup_runs_after_commit(
+        self, request_factory, subject, lesson, locmem_cache, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks() as callbacks:
+            schedule_lesson_warmup(request_factory.post('/'), subject.id, lesson.id)
+        assert locmem_cache.get(question_bank_key(lesson.id)) is None
+
+        for callback in callbacks:
+            callback()
+        assert locmem_cache.get(question_bank_key(lesson.id)) == []
@@ -0,0 +1,151 @@
+from types import SimpleNamespace
+from contextlib import contextmanager
+
+import pytest
+from django.db import OperationalError
+
+from utils.timeouts import StatementTimeout, StatementTimeoutGuard, get_statement_timeout
+
+
+class QueryCanceled(Exception):
+    pgcode = '57014'
+
+
+class FakeCursor:
+    def __init__(self, log, fail=False):
+        self.log = log
+        self.fail = fail
+
+    def execute(self, sql, params=None):
+        if self.fail:
+            raise OperationalError('connection already closed')
+        self.log.append(sql)
+
+
+class FakeConnection:
+    def __init__(self, alias='default', vendor='postgresql', fail_reset=False):
+        self.alias = alias
+        self.vendor = vendor
+        self.fail_reset = fail_reset
+        self.log = []
+        self.closed = False
+
+    @contextmanager
+    def cursor(self):
+        yield FakeCursor(self.log, fail=self.fail_reset)
+
+    def close(self):
+        self.closed = True
+
+
+class TimedView:
+    statement_timeout = {'GET': 2}
+
+
+def make_request(view=TimedView, method='GET', url_name='global_leaderboard'):
+    return SimpleNamespace(
+        method=method,
+        resolver_match=SimpleNamespace(func=SimpleNamespace(view_class=view), view_name=url_name)
+    )
+
+
+def run_query(guard, connection, execute=None):
+    context = {'connection': connection, 'cursor': SimpleNamespace(cursor=FakeCursor(connection.log))}
+    execute = execute or (lambda sql, params, many, context: connection.log.append(sql))
+    return guard(execute, 'SELECT 1', None, False, context)
+
+
+class TestGetStatementTimeout:
+    def test_per_method(self):
+        view = SimpleNamespace(view_class=TimedView)
+
+        assert get_statement_timeout(view, 'GET') == 2
+        assert get_statement_timeout(view, 'POST') is None
+
+    def test_url_name_override(self, settings):
+        settings.STATEMENT_TIMEOUTS = {'global_leaderboard': 5}
+
+        assert get_statement_timeout(SimpleNamespace(view_class=TimedView), 'GET', 'global_leaderboard') == 5
+
+    def test_views_without_timeout(self):
+        assert get_statement_timeout(SimpleNamespace(view_class=object), 'GET') is None
+
+
+class TestStatementTimeoutGuard:
+    def test_timeout_set_once_per_connection(self):
+        guard = StatementTimeoutGuard(make_request())
+        connection = FakeConnection()
+
+        run_query(guard, connection)
+        run_query(guard, connection)
+
+        assert connection.log == ['SET statement_timeout = 2000', 'SELECT 1', 'SELECT 1']
+
+    def test_each_connection_gets_the_timeout(self):
+        guard = StatementTimeoutGuard(make_request())
+        primary, replica = FakeConnection('default'), FakeConnection('replica')
+
+        run_query(guard, primary)
+        run_query(guard, replica)
+
+        assert replica.log[0] == 'SET statement_timeout = 2000'
+
+    def test_no_timeout_for_other_methods_or_databases(self):
+        connection = FakeConnection()
+        run_query(StatementTimeoutGuard(make_request(method='POST')), connection)
+
+        sqlite = FakeConnection(vendor='sqlite')
+        run_query(StatementTimeoutGuard(make_request()), sqlite)
+
+        assert connection.log == ['SELECT 1']
+        assert sqlite.log == ['SELECT 1']
+
+    def test_no_timeout_before_url_resolution(self):
+        connection = FakeConnection()
+        run_query(StatementTimeoutGuard(SimpleNamespace(method='GET')), connection)
+
+        assert connection.log == ['SELECT 1']
+
+    def test_cancelled_statement_raises_statement_timeout(self, settings):
+        settings.STATEMENT_TIMEOUT_RETRY_AFTER = 7
+        guard = StatementTimeoutGuard(make_request())
+
+        def execute(sql, params, many, context):
+            raise OperationalError('canceling statement due to statement timeout') from QueryCanceled()
+
+        with pytest.raises(StatementTimeout) as error:
+            run_query(guard, FakeConnection(), execute)
+
+        assert guard.timed_out
+        assert error.value.status_code == 503
+        assert error.value.wait == 7
+
+    def test_other_database_errors_pass_through(self):
+        guard = StatementTimeoutGuard(make_request())
+
+        def execute(sql, params, many, context):
+            raise OperationalError('server closed the connection unexpectedly')
+
+        with pytest.raises(OperationalError):
+            run_query(guard, FakeConnection(), execute)
+
+        assert not guard.timed_out
+
+    def test_reset(self):
+        guard = StatementTimeoutGuard(make_request())
+        connection = FakeConnection()
+        run_query(guard, connection)
+
+        guard.reset()
+
+        assert connection.log[-1] == 'RESET statement_timeout'
+        assert not connection.closed
+
+    def test_failed_reset_closes_connection(self):
+        guard = StatementTimeoutGuard(make_request())
+        connection = FakeConnection(fail_reset=True)
+        run_query(guard, connection)
+
+        guard.reset()
+
+        assert connection.closed
@@ -0,0 +1,30 @@
+from apps.quiz.answers import (
+    pack_answers,
+    unpack_answers,
+    pack_answer_matrix,
+    unpack_answer_matrix
+)
+
+
+class TestAnswerPacking:
+    def test_pack_answers_uses_two_bits_per_question(self):
+        data = pack_answers([1, 2, 3, 0, 1])
+        assert len(data) == 2
+        assert data == bytes([0b00111001, 0b00000001])
+
+    def test_unpack_answers_roundtrip(self):
+        options = [3, 0, 2, 1, 1, 2, 3, 0, 1, 3, 2, 1, 0, 0, 3]
+        assert unpack_answers(pack_answers(options), len(options)) == options
+
+    def test_unpack_answers_pads_missing_bytes(self):
+        assert unpack_answers(b'', 3) == [0, 0, 0]
+
+    def test_unpack_answer_matrix(self):
+        rows = [pack_answers([1, 2, 3]), pack_answers([3, 3, 3, 3, 2])]
+        matrix = unpack_answer_matrix(rows, 5)
+        assert matrix.shape == (2, 5)
+        assert matrix.tolist() == [[1, 2, 3, 0, 0], [3, 3, 3, 3, 2]]
+
+    def test_pack_answer_matrix_matches_pack_answers(self):
+        matrix = [[1, 2, 3, 0, 1], [3, 3, 3, 3, 2]]
+        assert pack_answer_matrix(matrix) == [pack_answers(row) for row in matrix]
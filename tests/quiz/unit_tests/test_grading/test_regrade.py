@@ -0,0 +1,83 @@
+import pytest
+
+import numpy as np
+
+from apps.quiz.answers import pack_answers
+from apps.quiz.caching import LEADERBOARD_NAMESPACE, get_namespace_versions
+from apps.quiz.models import QuizAttempt
+from apps.quiz.regrade import score_attempts, regrade_questions
+
+
+class TestScoreAttempts:
+    def test_score_attempts_matches_answer_key(self):
+        key_ids = np.array([10, 11, 12])
+        key_answers = np.array([1, 2, 3])
+        scores = score_attempts(
+            [[10, 11, 12], [12, 10], [11]],
+            [pack_answers([1, 2, 1]), pack_answers([3, 0]), pack_answers([1])],
+            key_ids,
+            key_answers
+        )
+        assert scores.tolist() == [2, 1, 0]
+
+    def test_score_attempts_ignores_unknown_questions(self):
+        scores = score_attempts(
+            [[99, 10]],
+            [pack_answers([1, 1])],
+            np.array([10]),
+            np.array([1])
+        )
+        assert scores.tolist() == [1]
+
+
+@pytest.mark.django_db
+class TestRegradeQuestions:
+    def test_regrade_updates_scores_and_highest_score(self, user, lesson, questions):
+        question_ids = [q.id for q in questions[:4]]
+        attempt = QuizAttempt.objects.create(
+            user=user,
+            lesson=lesson,
+            score=4,
+            completed=True,
+            question_ids=question_ids,
+            answers=pack_answers([1, 1, 1, 1])
+        )
+        user.highest_score = 4
+        user.save()
+
+        questions[0].correct_answer = 3
+        questions[0].save()
+
+        assert regrade_questions([questions[0].id]) == 1
+        attempt.refresh_from_db()
+        user.refresh_from_db()
+        assert attempt.score == 3
+        assert user.highest_score == 3
+
+    def test_regrade_invalidates_leaderboards_on_commit(self, user, lesson, questions, locmem_cache, django_capture_on_commit_callbacks):
+        QuizAttempt.objects.create(
+            user=user,
+            lesson=lesson,
+            score=1,
+            completed=True,
+            question_ids=[questions[0].id],
+            answers=pack_answers([1])
+        )
+        version = get_namespace_versions(LEADERBOARD_NAMESPACE)
+
+        questions[0].correct_answer = 3
+        questions[0].save()
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            assert regrade_questions([questions[0].id]) == 1
+            assert get_namespace_versions(LEADERBOARD_NAMESPACE) == version  # Not before the commit
+
+        assert len(callbacks) == 1
+        assert get_namespace_versions(LEADERBOARD_NAMESPACE) != version
+
+    def test_regrade_skips_attempts_without_stored_answers(self, quiz_attempt, questions):
+        quiz_attempt.completed = True
+        quiz_attempt.save()
+
+        assert regrade_questions([questions[0].id]) == 0
+        quiz_attempt.refresh_from_db()
+        assert quiz_attempt.score == 5
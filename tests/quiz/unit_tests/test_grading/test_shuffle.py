@@ -0,0 +1,29 @@
+from apps.quiz.shuffle import (
+    OPTION_PERMUTATIONS,
+    IDENTITY_PERMUTATION,
+    option_permutation,
+    shuffle_options,
+    displayed_option,
+    original_option
+)
+
+
+class TestOptionShuffle:
+    def test_option_permutation_is_deterministic(self):
+        assert option_permutation(12345, 7) == option_permutation(12345, 7)
+        assert option_permutation(12345, 7) in OPTION_PERMUTATIONS
+
+    def test_option_permutation_without_seed_is_identity(self):
+        assert option_permutation(None, 7) == IDENTITY_PERMUTATION
+
+    def test_option_permutation_covers_all_orders(self):
+        seen = {option_permutation(42, question_id) for question_id in range(1, 200)}
+        assert seen == set(OPTION_PERMUTATIONS)
+
+    def test_shuffle_and_unshuffle_roundtrip(self):
+        options = {'1': 'A', '2': 'B', '3': 'C'}
+        permutation = (3, 1, 2)
+        assert shuffle_options(options, permutation) == {'1': 'C', '2': 'A', '3': 'B'}
+        for original in (1, 2, 3):
+            position = displayed_option(original, permutation)
+            assert original_option(position, permutation) == original
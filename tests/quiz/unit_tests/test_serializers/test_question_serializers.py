@@ -1,7 +1,9 @@
 import pytest
 
+from rest_framework.request import Request
 from rest_framework.exceptions import ValidationError
 
+from apps.quiz.models import Question
 from apps.quiz.serializers import (
     QuestionSerializer,
     QuestionResponseSerializer,
@@ -63,3 +65,33 @@ class TestQuestionSerializers:
         assert data['previous'] is None
         assert len(data['results']) == len(questions)
         assert data['results'][0]['id'] == questions[0].id
+
+    def test_question_response_serializer_sparse_fields(self, request_factory, questions):
+        request = Request(request_factory.get('/', {'fields': 'id,text'}))
+        data = QuestionResponseSerializer(questions[0], context={'request': request}).data
+        assert data == {'id': questions[0].id, 'text': questions[0].text}
+
+    def test_question_response_serializer_expand(self, request_factory, questions):
+        question = questions[0]
+        request = Request(request_factory.get('/', {'expand': 'lesson'}))
+        data = QuestionResponseSerializer(question, context={'request': request}).data
+        assert data['lesson']['id'] == question.lesson.id
+        assert data['lesson']['subject'] == question.lesson.subject.id  # Not expanded
+
+    def test_question_response_serializer_collapses_relations(self, request_factory, questions):
+        request = Request(request_factory.get('/', {'fields': 'id,lesson'}))
+        data = QuestionResponseSerializer(questions[0], context={'request': request}).data
+        assert data == {'id': questions[0].id, 'lesson': questions[0].lesson.id}
+
+    def test_question_response_serializer_optimize_queryset(self, request_factory, questions):
+        request = Request(request_factory.get('/', {'fields': 'id,text'}))
+        queryset = QuestionResponseSerializer.optimize_queryset(
+            Question.objects.all(),
+            {'request': request}
+        )
+        assert queryset.query.deferred_loading == ({'id', 'text'}, False)
+        assert not queryset.query.select_related
+
+        # Full representation joins the nested lesson & subject
+        queryset = QuestionResponseSerializer.optimize_queryset(Question.objects.all())
+        assert queryset.query.select_related == {'lesson': {'subject': {}}}
@@ -21,6 +21,17 @@ class TestQuizSerializers:
         assert len(data['questions']) == len(questions)
         assert data['questions'][0]['id'] == questions[0].id
 
+    def test_quiz_start_response_serializer_hides_correct_answer(self, lesson, questions, quiz_attempt):
+        serializer = QuizStartResponseSerializer({
+            'attempt_id': quiz_attempt.id,
+            'lesson': lesson,
+            'questions': questions
+        })
+        data = serializer.data
+        assert data['lesson']['id'] == lesson.id
+        assert set(data['questions'][0].keys()) == {'id', 'text', 'options'}
+        assert data['questions'][0]['options'] == questions[0].options
+
     def test_quiz_submit_serializer_valid(self, questions):
         answers = {str(q.id): '1' for q in questions}
         serializer = QuizSubmitSerializer(data={'answers': answers})
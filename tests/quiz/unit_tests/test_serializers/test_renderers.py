@@ -0,0 +1,115 @@
+import io
+from decimal import Decimal
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+
+import pytest
+
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework import status
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from apps.quiz.serializers import QuizSubmitResponseSerializer
+from utils import parsers, renderers
+from utils.parsers import FastJSONParser
+from utils.renderers import FastJSONRenderer
+
+
+requires_orjson = pytest.mark.skipif(renderers.orjson is None, reason="orjson is not installed")
+
+PAYLOADS = [
+    {'count': 2, 'next': None, 'previous': None, 'results': [{'username': 'ana', 'avg_score': 7.5}]},
+    {'start_time': datetime(2025, 3, 1, 9, 30, 15, 123456, tzinfo=dt_timezone.utc)},
+    {'start_time': datetime(2025, 3, 1, 9, 30, tzinfo=dt_timezone(timedelta(hours=6)))},
+    {'naive': datetime(2025, 3, 1, 9, 30), 'day': date(2025, 3, 1), 'took': timedelta(seconds=90)},
+    {'accuracy': Decimal('0.75'), 'total': Decimal('12')},
+    {'detail': gettext_lazy("Subject not found.")},
+    {'options': {1: 'A', 2: 'B'}, 'text': 'Grüße   line   para'},
+    [1, (2, 3), 'x'],
+]
+
+
+@requires_orjson
+class TestFastJSONRenderer:
+    @pytest.mark.parametrize('payload', PAYLOADS)
+    def test_matches_drf_renderer(self, payload):
+        assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_datetimes_and_decimals(self):
+        rendered = FastJSONRenderer().render(PAYLOADS[1] | PAYLOADS[4])
+
+        assert rendered == (
+            b'{"start_time":"2025-03-01T09:30:15.123456Z","accuracy":0.75,"total":12.0}'
+        )
+
+    def test_serializer_output(self, quiz_attempt):
+        data = QuizSubmitResponseSerializer(quiz_attempt).data
+
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indent_uses_drf_renderer(self):
+        rendered = FastJSONRenderer().render({'a': [1]}, 'application/json; indent=2')
+
+        assert rendered == b'{\n  "a": [\n    1\n  ]\n}'
+
+    def test_empty_response(self):
+        assert FastJSONRenderer().render(None) == b''
+
+    def test_unserializable_value(self):
+        with pytest.raises(TypeError):
+            FastJSONRenderer().render({'value': object()})
+
+
+class TestFallback:
+    def test_renderer_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(renderers, 'orjson', None)
+
+        for payload in PAYLOADS:
+            assert FastJSONRenderer().render(payload) == JSONRenderer().render(payload)
+
+    def test_parser_without_orjson(self, monkeypatch):
+        monkeypatch.setattr(parsers, 'orjson', None)
+
+        assert FastJSONParser().parse(io.BytesIO(b'{"name":"Physics"}')) == {'name': 'Physics'}
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"name":'))
+
+
+@requires_orjson
+class TestFastJSONParser:
+    def test_matches_drf_parser(self):
+        body = JSONRenderer().render(PAYLOADS[0] | PAYLOADS[6])
+
+        assert FastJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+
+    @pytest.mark.parametrize('body', [b'', b'{"name":', b'{"score": NaN}', b'\xff'])
+    def test_invalid_json(self, body):
+        with pytest.raises(ParseError, match="JSON parse error"):
+            FastJSONParser().parse(io.BytesIO(body))
+
+    def test_other_encodings_use_drf_parser(self):
+        body = '{"name":"Grüße"}'.encode('latin-1')
+
+        assert FastJSONParser().parse(io.BytesIO(body), parser_context={'encoding': 'latin-1'}) == {'name': 'Grüße'}
+
+
+@pytest.mark.django_db
+class TestDefaultRendering:
+    def test_responses_use_fast_renderer(self, api_client, subject):
+        response = api_client.get(reverse('subject_detail', kwargs={'subject_id': subject.id}))
+
+        assert isinstance(response.accepted_renderer, FastJSONRenderer)
+        assert response.content == JSONRenderer().render(response.data)
+
+    def test_requests_use_fast_parser(self, api_client, user):
+        response = api_client.post(
+            reverse('login'),
+            data=b'{"username":"%s","password":"testpass123"}' % user.username.encode(),
+            content_type='application/json'
+        )
+
+        assert api_settings.DEFAULT_PARSER_CLASSES[0] is FastJSONParser
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,124 @@
+import logging
+import threading
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import JsonResponse
+from rest_framework import status
+
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+
+# Admission control (load shedding) per worker process.
+# ADMISSION_LIMITS caps the concurrent requests of a URL name, e.g.
+# {'global_leaderboard': {'concurrency': 4, 'queue_timeout': 0.5, 'max_queue': 4}}.
+# Requests over the limit wait up to queue_timeout seconds for a free slot
+# (at most max_queue of them, default: concurrency); the others are rejected
+# at once with a 503 & Retry-After. Slow endpoints can then only tie up a
+# few threads, leaving the rest to critical paths like quiz_submit.
+class AdmissionGate:
+    def __init__(self, concurrency, queue_timeout=0, max_queue=None):
+        self.concurrency = concurrency
+        self.queue_timeout = queue_timeout
+        self.max_queue = concurrency if max_queue is None else max_queue
+        self.active = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        # True if admitted (call release() when done), False if shed
+        with self._condition:
+            if self.active < self.concurrency:
+                self.active += 1
+                return True
+            if self.queue_timeout <= 0 or self.waiting >= self.max_queue:
+                return False
+
+            self.waiting += 1
+            try:
+                admitted = self._condition.wait_for(
+                    lambda: self.active < self.concurrency,
+                    timeout=self.queue_timeout
+                )
+            finally:
+                self.waiting -= 1
+            if admitted:
+                self.active += 1
+            return admitted
+
+    def release(self):
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+
+_gates = {}  # URL name -> (limits, AdmissionGate)
+_gates_lock = threading.Lock()
+
+
+def get_gate(url_name):
+    # The URL name's gate (None without a limit); rebuilt if its limits change
+    limits = getattr(settings, 'ADMISSION_LIMITS', {}).get(url_name)
+    if not limits:
+        return None
+
+    with _gates_lock:
+        entry = _gates.get(url_name)
+        if entry is None or entry[0] != limits:
+            entry = (dict(limits), AdmissionGate(**limits))
+            _gates[url_name] = entry
+        return entry[1]
+
+
+class AdmissionControlMiddleware:
+    # Applies ADMISSION_LIMITS once the URL is resolved; shed requests never
+    # reach the view (they count as 503s in the request metrics). Under ASGI
+    # Django runs process_view in the request's sync thread, so a queued
+    # request waits there, never on the event loop.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        try:
+            return self.get_response(request)
+        finally:
+            self.release(request)
+
+    async def __acall__(self, request):
+        try:
+            return await self.get_response(request)
+        finally:
+            self.release(request)
+
+    def release(self, request):
+        gate = getattr(request, '_admission_gate', None)
+        if gate is not None:
+            gate.release()
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        url_name = request.resolver_match.view_name
+        gate = get_gate(url_name)
+        if gate is None:
+            return None
+
+        if not gate.acquire():
+            logger.info(f"Admission control: shed {request.method} {url_name} ({gate.active} active)")
+            response = JsonResponse(
+                {"detail": "The server is busy, please try again shortly."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+            response['Retry-After'] = str(settings.ADMISSION_RETRY_AFTER)
+            return response
+
+        request._admission_gate = gate
+        return None
@@ -0,0 +1,112 @@
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from rest_framework.views import APIView
+
+from .cache import aget_page_payload
+from .replicas import choose_read_alias, is_read_pinned, read_from
+
+
+# Async (ASGI-native) GET for DRF read views.
+# DRF's APIView is sync only, so under ASGI Django runs it in a thread for
+# the whole request. An AsyncReadView runs the DRF view's checks
+# (authentication, permissions, throttles, content negotiation) & cache key
+# in one sync_to_async call, then serves cached payloads with the async
+# cache API & builds misses with the async ORM (aget, acount, async for).
+# Payloads, cache keys & error responses are those of the DRF view
+# (sync_view), which still serves every other method & non-JSON renderers
+# (e.g. the browsable API).
+# Contract: sync_view's get() is wrapped by cache_page_payload & builds its
+# payload with build_payload(request, **kwargs), & sync_view provides
+# abuild_payload(request, **kwargs), the same payload with the async ORM
+# (e.g. apps/quiz/views/payloads.py ReadPayloadMixin); checked by as_view().
+class AsyncReadView:
+    sync_view = None  # The DRF APIView this view serves GET for
+
+    @classmethod
+    def as_view(cls):
+        if not hasattr(cls.sync_view, 'abuild_payload') or not hasattr(cls.sync_view.get, 'cache_timeout'):
+            raise ImproperlyConfigured(
+                f"{cls.__name__}.sync_view needs abuild_payload() & a get() wrapped by cache_page_payload"
+            )
+
+        sync_view = cls.sync_view.as_view()
+
+        async def view(request, *args, **kwargs):
+            if request.method != 'GET':
+                return await sync_to_async(sync_view)(request, *args, **kwargs)
+            return await cls().get(request, *args, **kwargs)
+
+        # Schema generation, query budgets, statement timeouts & CSRF
+        # exemption follow the DRF view
+        view.cls = view.view_class = cls.sync_view
+        view.initkwargs = view.view_initkwargs = sync_view.initkwargs
+        view.csrf_exempt = True
+        return view
+
+    async def get(self, request, *args, **kwargs):
+        view, response, cache_key, alias = await sync_to_async(self.initial)(request, *args, **kwargs)
+        if response is not None:
+            return response
+
+        request = view.request
+        try:
+            with read_from(alias):
+                response = await aget_page_payload(
+                    view,
+                    request,
+                    lambda: view.abuild_payload(request, **kwargs),
+                    cache_key
+                )
+        except Exception as exc:
+            response = view.handle_exception(exc)  # e.g. StatementTimeout: 503 with Retry-After
+        return render(view.finalize_response(request, response, *args, **kwargs))
+
+    def initial(self, request, *args, **kwargs):
+        # Runs in a thread: APIView.dispatch() up to the handler, returning
+        # (view, response or None, cache key, read alias)
+        view = self.sync_view()
+        view.setup(request, *args, **kwargs)
+        request = view.initialize_request(request, *args, **kwargs)
+        view.request = request
+        view.headers = view.default_response_headers
+
+        try:
+            # Authentication, permissions, throttles & content negotiation
+            # (the replica is chosen below, for the whole async request)
+            APIView.initial(view, request, *args, **kwargs)
+            view.read_pinned = is_read_pinned(request)
+            alias = choose_read_alias(request, view.read_pinned)
+
+            if request.accepted_renderer.format != 'json':
+                with read_from(alias):
+                    response = view.get(request, *args, **kwargs)
+            else:
+                return view, None, view.get_cache_key(request, *args, **kwargs), alias
+
+        except Exception as exc:
+            response = view.handle_exception(exc)
+
+        return view, render(view.finalize_response(request, response, *args, **kwargs)), None, None
+
+def render(response):
+    # Render the DRF Response into a plain HttpResponse, so Django does not
+    # render it in a thread after the view returns
+    response.render()
+    rendered = HttpResponse(response.content, status=response.status_code)
+    for header, value in response.items():
+        rendered[header] = value
+    return rendered
+
+
+async def apaginate(paginator, queryset, request):
+    # paginator.paginate_queryset() with the async ORM. The page is resolved
+    # against the row count (page validation, errors & links stay DRF's),
+    # then only its rows are fetched.
+    if not paginator.get_page_size(request):
+        return None
+
+    positions = paginator.paginate_queryset(range(await queryset.acount()), request)
+    if not positions:
+        return []
+    return [row async for row in queryset[positions[0]:positions[-1] + 1]]
@@ -0,0 +1,191 @@
+import threading
+from functools import wraps
+from collections import defaultdict
+
+from django.core.cache import cache
+
+from rest_framework import status
+from rest_framework.response import Response
+
+from .replicas import read_from
+from .timeouts import StatementTimeout
+
+
+def cache_page_payload(timeout, stale_timeout=None):
+    # Cache-aside decorator for paginated list & detail endpoints.
+    # Caches the final serialized payload under the view's
+    # get_cache_key(request, **kwargs), so a hit serves it without touching
+    # the database. Pages of views with a pagination_class are cached as
+    # count & results only: their next/previous links are rebuilt from each
+    # request (see page_payload()), so one client's host, scheme & query
+    # params never leak into another's links. Empty pages are cached too;
+    # error responses & requests without a cache key (None) never are.
+    # Misses are built from the primary database, never from a replica that
+    # may trail a write that just bumped the key's namespace; users pinned
+    # to the primary after a write (view.read_pinned, see utils/replicas.py)
+    # skip the cached copy & refresh it.
+    # With stale_timeout, the last payload is also kept that long under a
+    # "stale:" key & served (X-Cache-Status: stale) when the view raises
+    # StatementTimeout, instead of the 503.
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            cache_key = self.get_cache_key(request, *args, **kwargs)
+            if cache_key is None:
+                return view_method(self, request, *args, **kwargs)
+
+            pagination_class = getattr(self, 'pagination_class', None)
+            payload = None if getattr(self, 'read_pinned', False) else cache.get(cache_key)  # Try getting cached page
+            if payload is not None:
+                return Response(page_payload(payload, pagination_class, request), status=status.HTTP_200_OK)
+
+            try:
+                with read_from(None):  # Cached payloads come from the primary
+                    response = view_method(self, request, *args, **kwargs)
+            except StatementTimeout:
+                payload = cache.get(f'stale:{cache_key}') if stale_timeout else None
+                if payload is None:
+                    raise
+                return Response(
+                    page_payload(payload, pagination_class, request),
+                    status=status.HTTP_200_OK,
+                    headers={'X-Cache-Status': 'stale'}
+                )
+
+            if response.status_code == status.HTTP_200_OK:
+                payload = cacheable_payload(response.data, pagination_class)
+                cache.set(cache_key, payload, timeout=timeout)
+                record_cache_key(cache_key)
+                if stale_timeout:
+                    cache.set(f'stale:{cache_key}', payload, timeout=stale_timeout)
+            return response
+
+        wrapper.cache_timeout = timeout  # Read by the async variants (aget_page_payload)
+        wrapper.stale_timeout = stale_timeout
+        return wrapper
+
+    return decorator
+
+
+async def aget_page_payload(view, request, get_response, cache_key):
+    # cache_page_payload() for async views, with the async cache API:
+    # get_response() is the coroutine building the uncached response of the
+    # DRF view, whose get() holds the timeouts
+    if cache_key is None:
+        return await get_response()
+
+    cached_get = type(view).get  # Wrapped by cache_page_payload
+    timeout, stale_timeout = cached_get.cache_timeout, cached_get.stale_timeout
+    pagination_class = getattr(view, 'pagination_class', None)
+
+    payload = None if getattr(view, 'read_pinned', False) else await cache.aget(cache_key)
+    if payload is not None:
+        return Response(page_payload(payload, pagination_class, request), status=status.HTTP_200_OK)
+
+    try:
+        with read_from(None):  # Cached payloads come from the primary
+            response = await get_response()
+    except StatementTimeout:
+        payload = await cache.aget(f'stale:{cache_key}') if stale_timeout else None
+        if payload is None:
+            raise
+        return Response(
+            page_payload(payload, pagination_class, request),
+            status=status.HTTP_200_OK,
+            headers={'X-Cache-Status': 'stale'}
+        )
+
+    if response.status_code == status.HTTP_200_OK:
+        payload = cacheable_payload(response.data, pagination_class)
+        await cache.aset(cache_key, payload, timeout=timeout)
+        record_cache_key(cache_key)
+        if stale_timeout:
+            await cache.aset(f'stale:{cache_key}', payload, timeout=stale_timeout)
+    return response
+
+
+def cacheable_payload(data, pagination_class):
+    # A page without its absolute next/previous links (count & results)
+    if pagination_class is None:
+        return data
+    return {'count': data['count'], 'results': data['results']}
+
+
+def page_payload(payload, pagination_class, request):
+    # A cached page with the next/previous links of the current request,
+    # built by the paginator as for an uncached page. Only pages that were
+    # served (200) are cached, so the page number is always valid here.
+    if pagination_class is None:
+        return payload
+
+    paginator = pagination_class()
+    paginator.request = request
+    paginator.page = paginator.django_paginator_class(
+        range(payload['count']),  # Row positions only, never fetched
+        paginator.get_page_size(request)
+    ).page(request.query_params.get(paginator.page_query_param, 1))
+    return {
+        'count': payload['count'],
+        'next': paginator.get_next_link(),
+        'previous': paginator.get_previous_link(),
+        'results': payload['results'],
+    }
+
+
+def get_page_cache_key(prefix, request, pagination_class, extra=''):
+    # Canonical cache key of a paginated page.
+    # Page size is resolved through the paginator's rules (invalid sizes fall
+    # back to the default, sizes above max_page_size are capped) & the page
+    # number is parsed as a positive integer, so equivalent requests share one
+    # key ("page_size=010" == "page_size=10", "page_size=9999" == max).
+    # Nothing else of the request is in the key, & nothing else of it is in
+    # the cached page: next/previous links are rebuilt from each request
+    # (see page_payload()), so other query params, host & scheme only ever
+    # show in the links of the request carrying them.
+    # Returns None for page numbers that must not be cached.
+    paginator = pagination_class()
+    page_size = paginator.get_page_size(request)
+
+    page_number = request.query_params.get(paginator.page_query_param, '1')
+    try:
+        page_number = int(str(page_number).strip())
+    except ValueError:
+        return None  # Invalid page (including "last"), never cached
+
+    if page_number < 1:
+        return None
+
+    return f'{prefix}:page:{page_number}:size:{page_size}{extra}'
+
+
+# Key-cardinality metrics: distinct page keys cached per namespace in this
+# process (namespace = key prefix before the first ':'), capped per namespace
+MAX_TRACKED_KEYS = 10000
+
+_tracked_keys = defaultdict(set)
+_tracked_keys_lock = threading.Lock()
+
+
+def record_cache_key(cache_key):
+    namespace = cache_key.split(':', 1)[0]
+    with _tracked_keys_lock:
+        keys = _tracked_keys[namespace]
+        if len(keys) < MAX_TRACKED_KEYS:
+            keys.add(cache_key)
+
+
+def get_key_cardinality():
+    # {namespace: {"keys": distinct keys cached, "capped": tracking limit hit}}
+    with _tracked_keys_lock:
+        return {
+            namespace: {
+                'keys': len(keys),
+                'capped': len(keys) >= MAX_TRACKED_KEYS
+            }
+            for namespace, keys in _tracked_keys.items()
+        }
+
+
+def reset_key_cardinality():
+    with _tracked_keys_lock:
+        _tracked_keys.clear()
@@ -0,0 +1,252 @@
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache, DEFAULT_TIMEOUT
+from django.core.cache.backends.locmem import LocMemCache
+
+from .cache_codec import CacheCodec
+from .cache_stats import cache_stats
+
+
+_MISSING = object()
+
+
+class LocalTier(LocMemCache):
+    # LocMemCache reporting the entries it evicts to make room
+    def _cull(self):
+        keys = set(self._cache)
+        super()._cull()
+        for key in keys.difference(self._cache):
+            cache_stats.record_eviction(key.split(':', 2)[-1])  # Strip prefix & version
+
+
+class TwoTierCache(BaseCache):
+    # Two-tier cache: a small per-process LRU (LocMemCache) in front of a
+    # shared backend (file-based or Redis) that every worker reads & writes.
+    #
+    # - Reads hit the local tier first, then the shared tier (filling the
+    #   local tier for LOCAL_TIMEOUT seconds)
+    # - Writes go to the shared tier & refresh the local copy
+    # - Keys starting with a SHARED_ONLY_PREFIXES entry (namespace version
+    #   stamps, throttle history) are never held locally, so a version bump
+    #   made by one worker is seen by all others on their next read
+    # - incr() on a shared backend without an atomic incr (BaseCache's
+    #   get + set, e.g. FileBasedCache) re-sets PERSISTENT_PREFIXES keys
+    #   (namespace version stamps) without expiry instead of the default
+    #   timeout. That get + set (and add()) still race across processes: the
+    #   file-based tier is for development & single-worker setups only
+    # - Values are stored in the shared tier encoded by a CacheCodec (JSON or
+    #   msgpack, zlib above a size threshold) instead of pickles; integers are
+    #   stored as they are, so incr() keeps working
+    # - Hits (local/shared), misses, sets, evictions, bytes & latency are
+    #   counted per key namespace in utils.cache_stats
+    #
+    # OPTIONS:
+    #   SHARED_ALIAS         alias of the shared cache in CACHES (required)
+    #   LOCAL_MAX_ENTRIES    size of the local tier (default: 1000)
+    #   LOCAL_TIMEOUT        max. seconds a local copy is served (default: 5)
+    #   SHARED_ONLY_PREFIXES key prefixes kept out of the local tier
+    #   PERSISTENT_PREFIXES  key prefixes incr() keeps without expiry
+    #                        (default: ('ns:',))
+    #   CODEC                {"FORMAT": "json"|"msgpack", "COMPRESS_MIN_SIZE":
+    #                        bytes, "COMPRESS_LEVEL": 1-9} (default: JSON,
+    #                        compressed from 1 KB); None stores values as is
+    #
+    # Keys are passed to both tiers unchanged; each tier applies its own
+    # KEY_PREFIX & VERSION.
+
+    def __init__(self, location, params):
+        options = params.get('OPTIONS', {})
+        self._shared_alias = options['SHARED_ALIAS']
+        self._local_timeout = options.get('LOCAL_TIMEOUT', 5)
+        self._shared_only_prefixes = tuple(
+            options.get('SHARED_ONLY_PREFIXES', ('ns:', 'throttle_'))
+        )
+        self._persistent_prefixes = tuple(options.get('PERSISTENT_PREFIXES', ('ns:',)))
+
+        codec_options = options.get('CODEC', {})
+        self._codec = None if codec_options is None else CacheCodec(
+            **{name.lower(): value for name, value in codec_options.items()}
+        )
+
+        super().__init__({
+            **params,
+            'OPTIONS': {}  # Options of this backend are not BaseCache options
+        })
+
+        self._local = LocalTier(f'{location}-local', {
+            'TIMEOUT': self._local_timeout,
+            'OPTIONS': {
+                'MAX_ENTRIES': options.get('LOCAL_MAX_ENTRIES', 1000),
+            }
+        })
+
+    @property
+    def shared(self):
+        return caches[self._shared_alias]
+
+    @property
+    def local(self):
+        return self._local
+
+    def _is_local(self, key):
+        return not str(key).startswith(self._shared_only_prefixes)
+
+    def _encode(self, value):
+        if self._codec is None or isinstance(value, int):
+            return value  # Counters stay incr()-able
+        return self._codec.dumps(value)
+
+    def _decode(self, value):
+        if self._codec is None or not isinstance(value, bytes):
+            return value
+        return self._codec.loads(value)
+
+    def _fill_local(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        # Keep a local copy for at most LOCAL_TIMEOUT seconds
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None and timeout <= 0:
+            self._local.delete(key, version=version)
+            return
+
+        local_timeout = self._local_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            local_timeout = min(local_timeout, timeout)
+        self._local.set(key, value, timeout=local_timeout, version=version)
+
+    def get(self, key, default=None, version=None):
+        start = time.perf_counter()
+        value, result = self._get(key, version)
+        cache_stats.record_get(key, time.perf_counter() - start, result)
+        return default if value is _MISSING else value
+
+    async def aget(self, key, default=None, version=None):
+        # Local hits are served on the event loop, only shared-tier reads
+        # run in a thread (BaseCache.aget runs every read in one)
+        if self._is_local(key):
+            start = time.perf_counter()
+            value = self._local.get(key, _MISSING, version=version)
+            if value is not _MISSING:
+                cache_stats.record_get(key, time.perf_counter() - start, 'local_hits')
+                return value
+        return await sync_to_async(self.get)(key, default, version)
+
+    def _get(self, key, version):
+        # Returns (value or _MISSING, stats result)
+        if self._is_local(key):
+            value = self._local.get(key, _MISSING, version=version)
+            if value is not _MISSING:
+                return value, 'local_hits'
+
+        value = self.shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            return value, 'misses'
+
+        value = self._decode(value)
+        if self._is_local(key):
+            self._fill_local(key, value, version=version)
+        return value, 'shared_hits'
+
+    def get_many(self, keys, version=None):
+        start = time.perf_counter()
+        found, results = {}, {}
+        local_keys = [key for key in keys if self._is_local(key)]
+        if local_keys:
+            found.update(self._local.get_many(local_keys, version=version))
+            results.update(dict.fromkeys(found, 'local_hits'))
+
+        missing = [key for key in keys if key not in found]
+        if missing:
+            shared_values = {
+                key: self._decode(value)
+                for key, value in self.shared.get_many(missing, version=version).items()
+            }
+            for key, value in shared_values.items():
+                if self._is_local(key):
+                    self._fill_local(key, value, version=version)
+            found.update(shared_values)
+            results.update(dict.fromkeys(shared_values, 'shared_hits'))
+
+        seconds = (time.perf_counter() - start) / max(len(keys), 1)
+        for key in keys:
+            cache_stats.record_get(key, seconds, results.get(key, 'misses'))
+        return found
+
+    def _record_set(self, key, encoded, start):
+        size = len(encoded) if isinstance(encoded, bytes) else 0
+        cache_stats.record_set(key, time.perf_counter() - start, size)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        start = time.perf_counter()
+        encoded = self._encode(value)
+        self.shared.set(key, encoded, timeout=timeout, version=version)
+        if self._is_local(key):
+            self._fill_local(key, value, timeout=timeout, version=version)
+        self._record_set(key, encoded, start)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        start = time.perf_counter()
+        encoded = {key: self._encode(value) for key, value in data.items()}
+        failed = self.shared.set_many(encoded, timeout=timeout, version=version)
+        for key, value in data.items():
+            if self._is_local(key) and key not in failed:
+                self._fill_local(key, value, timeout=timeout, version=version)
+
+        seconds = (time.perf_counter() - start) / max(len(data), 1)
+        for key, value in encoded.items():
+            cache_stats.record_set(key, seconds, len(value) if isinstance(value, bytes) else 0)
+        return failed
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        start = time.perf_counter()
+        encoded = self._encode(value)
+        added = self.shared.add(key, encoded, timeout=timeout, version=version)
+        if added:
+            if self._is_local(key):
+                self._fill_local(key, value, timeout=timeout, version=version)
+            self._record_set(key, encoded, start)
+        return added
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def delete(self, key, version=None):
+        self._local.delete(key, version=version)
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        self._local.delete_many(keys, version=version)
+        self.shared.delete_many(keys, version=version)
+
+    def has_key(self, key, version=None):
+        if self._is_local(key) and self._local.has_key(key, version=version):
+            return True
+        return self.shared.has_key(key, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        self._local.delete(key, version=version)
+        shared = self.shared
+        if type(shared).incr is not BaseCache.incr:
+            return shared.incr(key, delta, version=version)  # Atomic & keeps the expiry (Redis, LocMem)
+
+        # BaseCache.incr() re-sets the value with the default timeout, which
+        # would expire version stamps stored without one
+        value = shared.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            raise ValueError("Key '%s' not found" % key)
+        new_value = value + delta
+        timeout = None if str(key).startswith(self._persistent_prefixes) else DEFAULT_TIMEOUT
+        shared.set(key, new_value, timeout=timeout, version=version)
+        return new_value
+
+    def decr(self, key, delta=1, version=None):
+        return self.incr(key, -delta, version=version)
+
+    def clear(self):
+        # Clears the shared tier & this worker's local tier; local copies of
+        # other workers expire within LOCAL_TIMEOUT seconds
+        self.shared.clear()
+        self._local.clear()
+
+    def close(self, **kwargs):
+        self.shared.close(**kwargs)
@@ -0,0 +1,91 @@
+import json
+import pickle
+import zlib
+
+try:
+    import msgpack  # Optional, more compact & faster than JSON
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+
+# Cache value codec.
+# Cached API payloads are JSON-like (they are rendered to JSON anyway), so
+# they are stored as JSON or msgpack instead of pickles of Python objects &
+# compressed with zlib once they exceed a size threshold. Values that would
+# not decode as they were (tuples come back as lists, non-str dict keys as
+# str, other types fail) fall back to pickle. The "pickle" format (pickle + zlib)
+# trades JSON's portability for faster encoding (see
+# scripts/benchmark_cache_codec.py).
+#
+# Encoded value: 1 format byte + 1 compression byte + body
+JSON, MSGPACK, PICKLE = b'j', b'm', b'p'
+RAW, ZLIB = b'-', b'z'
+
+DEFAULT_COMPRESS_MIN_SIZE = 1024  # Bytes; smaller bodies are not worth it
+DEFAULT_COMPRESS_LEVEL = 1  # Fastest zlib level, most of the size gain
+
+JSON_SCALARS = (str, int, float, type(None))  # bool is an int
+MSGPACK_SCALARS = JSON_SCALARS + (bytes,)
+
+
+def round_trips(value, scalars=JSON_SCALARS):
+    # Whether JSON (or msgpack, with MSGPACK_SCALARS) decodes the value back
+    # equal to itself: scalars, lists & dicts with str keys, nested
+    if isinstance(value, scalars):
+        return True
+    if isinstance(value, list):
+        return all(round_trips(item, scalars) for item in value)
+    if isinstance(value, dict):
+        return all(
+            isinstance(key, str) and round_trips(item, scalars)
+            for key, item in value.items()
+        )
+    return False
+
+
+class CacheCodec:
+    def __init__(self, format='json', compress_min_size=DEFAULT_COMPRESS_MIN_SIZE,
+                 compress_level=DEFAULT_COMPRESS_LEVEL):
+        if format not in ('json', 'msgpack', 'pickle'):
+            raise ValueError(f"Unknown cache codec format: {format}")
+
+        if format == 'pickle':
+            self.format = PICKLE
+        else:
+            # Fall back to JSON if msgpack is not installed
+            self.format = MSGPACK if format == 'msgpack' and msgpack is not None else JSON
+        self.compress_min_size = compress_min_size
+        self.compress_level = compress_level
+
+    def _encode(self, value):
+        try:
+            if self.format == PICKLE:
+                return PICKLE, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            if self.format == MSGPACK and round_trips(value, MSGPACK_SCALARS):
+                return MSGPACK, msgpack.packb(value, use_bin_type=True)
+            if self.format == JSON and round_trips(value):
+                return JSON, json.dumps(value, separators=(',', ':')).encode()
+        except (TypeError, ValueError, OverflowError, RecursionError):
+            pass  # e.g. integers out of msgpack's range, self-referencing values
+        return PICKLE, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def dumps(self, value):
+        value_format, body = self._encode(value)
+
+        if self.compress_min_size is not None and len(body) >= self.compress_min_size:
+            return value_format + ZLIB + zlib.compress(body, self.compress_level)
+        return value_format + RAW + body
+
+    def loads(self, data):
+        value_format, compression, body = data[:1], data[1:2], data[2:]
+
+        if compression == ZLIB:
+            body = zlib.decompress(body)
+
+        if value_format == JSON:
+            return json.loads(body)
+        if value_format == MSGPACK:
+            return msgpack.unpackb(body, raw=False, strict_map_key=False)
+        if value_format == PICKLE:
+            return pickle.loads(body)
+        raise ValueError(f"Unknown cache value format: {value_format!r}")
@@ -0,0 +1,98 @@
+import time
+import logging
+import threading
+from collections import defaultdict
+
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+
+# Cache statistics per key namespace ("questions", "subjects", "leaderboard",
+# "ns", "throttle", ...), collected by TwoTierCache in this process.
+# Counters: local/shared hits, misses, sets, local-tier evictions, bytes
+# written to the shared tier & total get/set time.
+STATS_LOG_INTERVAL = 300  # Seconds between summaries in the logs
+
+COUNTERS = (
+    'local_hits', 'shared_hits', 'misses', 'sets', 'evictions', 'bytes',
+    'get_seconds', 'set_seconds'
+)
+
+
+def key_namespace(key):
+    # "questions:lesson:1:v..." -> "questions", "throttle_anon_1.2.3.4" -> "throttle"
+    key = str(key)
+    if ':' in key:
+        return key.split(':', 1)[0]
+    return key.split('_', 1)[0]
+
+
+class CacheStats:
+    def __init__(self, log_interval=STATS_LOG_INTERVAL):
+        self._lock = threading.Lock()
+        self._counters = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+        self._log_interval = log_interval
+        self._last_log = time.monotonic()
+
+    def record_get(self, key, seconds, result):
+        # result: "local_hits", "shared_hits" or "misses"
+        with self._lock:
+            counters = self._counters[key_namespace(key)]
+            counters[result] += 1
+            counters['get_seconds'] += seconds
+        self._maybe_log()
+
+    def record_set(self, key, seconds, size=0):
+        with self._lock:
+            counters = self._counters[key_namespace(key)]
+            counters['sets'] += 1
+            counters['bytes'] += size
+            counters['set_seconds'] += seconds
+        self._maybe_log()
+
+    def record_eviction(self, key):
+        with self._lock:
+            self._counters[key_namespace(key)]['evictions'] += 1
+
+    def snapshot(self):
+        # {namespace: counters + hit_ratio, avg_get_ms & avg_set_ms}
+        with self._lock:
+            counters = {namespace: dict(values) for namespace, values in self._counters.items()}
+
+        for values in counters.values():
+            hits = values['local_hits'] + values['shared_hits']
+            gets = hits + values['misses']
+            values['hit_ratio'] = round(hits / gets, 4) if gets else None
+            values['avg_get_ms'] = round(values['get_seconds'] / gets * 1000, 3) if gets else None
+            values['avg_set_ms'] = (
+                round(values['set_seconds'] / values['sets'] * 1000, 3) if values['sets'] else None
+            )
+        return counters
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+    def log_summary(self):
+        for namespace, values in sorted(self.snapshot().items()):
+            logger.info(
+                f"Cache stats [{namespace}]: hit ratio {values['hit_ratio']}, "
+                f"local hits {values['local_hits']}, shared hits {values['shared_hits']}, "
+                f"misses {values['misses']}, sets {values['sets']}, "
+                f"evictions {values['evictions']}, bytes {values['bytes']}, "
+                f"avg get {values['avg_get_ms']} ms, avg set {values['avg_set_ms']} ms"
+            )
+
+    def _maybe_log(self):
+        now = time.monotonic()
+        if now - self._last_log < self._log_interval:
+            return
+        with self._lock:
+            if now - self._last_log < self._log_interval:
+                return  # Logged by another thread meanwhile
+            self._last_log = now
+        self.log_summary()
+
+
+cache_stats = CacheStats()  # Stats of this process
@@ -1,4 +1,3 @@
-from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
 
@@ -15,6 +14,8 @@ def custom_exception_handler(exc, context):
             "detail": data['detail']  # keep the original details for debugging and frontend mapping
         }
 
-        return Response(wrapped_response, status=response.status_code)
+        # Same response, so headers (Retry-After, WWW-Authenticate) are kept
+        response.data = wrapped_response
+        return response
 
-    return response
\ No newline at end of file
+    return response
\ No newline at end of file
@@ -0,0 +1,48 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+
+# Database execute wrappers that follow the request rather than the thread.
+# connection.execute_wrapper() only covers the calling thread's connections,
+# but under ASGI the ORM runs in sync_to_async threads. Wrappers entered with
+# execute_wrapper() are kept in a ContextVar (copied into those threads by
+# asgiref) & applied by a dispatcher installed on every connection.
+_wrappers = ContextVar('execute_wrappers', default=())
+
+
+def _dispatch(execute, sql, params, many, context):
+    # The first wrapper entered runs outermost, as with connection.execute_wrapper()
+    for wrapper in reversed(_wrappers.get()):
+        execute = partial(wrapper, execute)
+    return execute(sql, params, many, context)
+
+
+def install(connection):
+    # First in the list, so connection.execute_wrapper() blocks (which pop
+    # the last wrapper on exit) never remove it
+    if _dispatch not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _dispatch)
+
+
+@receiver(connection_created, dispatch_uid='utils.execute_wrappers.install')
+def install_on_connect(sender, connection, **kwargs):
+    install(connection)
+
+
+@contextmanager
+def execute_wrapper(wrapper):
+    # Install an execute wrapper on every database connection the current
+    # context queries, in this thread & in sync_to_async threads alike
+    for connection in connections.all():
+        install(connection)  # Connections opened before this module was imported
+
+    token = _wrappers.set((*_wrappers.get(), wrapper))
+    try:
+        yield
+    finally:
+        _wrappers.reset(token)
@@ -0,0 +1,35 @@
+from rest_framework.renderers import JSONRenderer
+
+try:
+    import orjson  # Optional, several times faster than the json module
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+# JSON renderer on orjson.
+# Output matches DRF's JSONRenderer (compact, UTF-8, datetimes as ISO 8601
+# with "Z" for UTC, Decimals as numbers, \u2028/\u2029 escaped): types orjson
+# does not serialize natively (Decimal, lazy strings, querysets, ...) go
+# through DRF's JSON encoder. Indented output (e.g. the browsable API, or
+# "Accept: application/json; indent=4"), non-default UNICODE_JSON,
+# COMPACT_JSON & STRICT_JSON settings & environments without orjson use
+# DRF's renderer (see scripts/benchmark_json.py).
+class FastJSONRenderer(JSONRenderer):
+    # "Z" for UTC datetimes & non-string dict keys as strings, as with json
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson is not None else None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if (
+            orjson is None
+            or self.ensure_ascii or not self.compact or not self.strict
+            or self.get_indent(accepted_media_type, renderer_context or {}) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+
+        # Escaped like DRF's output, so it stays a strict JavaScript subset
+        return ret.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
@@ -0,0 +1,146 @@
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.permissions import SAFE_METHODS
+
+
+# Read replicas (settings.REPLICA_DATABASES, empty: everything on `default`).
+# Only views with ReplicaReadMixin read from a replica, and only for safe
+# methods; authentication & permission checks run on the primary before the
+# switch. Writes always go to the primary. After a successful write, the
+# user's reads stay on the primary for REPLICA_PIN_SECONDS (longer than the
+# replication lag), so players see their own scores & edits right away.
+# Cached payloads are always built from the primary (cache_page_payload
+# reads misses there; warmers call view.get() directly), so a page cached
+# right after a write never trails it, & pinned users skip the cached copy.
+# Replicas serve the reads that are not cached (e.g. "?page=last").
+_read_alias = ContextVar('replica_read_alias', default=None)
+
+
+def get_replica_aliases():
+    return list(getattr(settings, 'REPLICA_DATABASES', []))
+
+
+def _pin_key(user_id):
+    return f'replica:pin:{user_id}'
+
+
+def pin_to_primary(user_id):
+    cache.set(_pin_key(user_id), True, settings.REPLICA_PIN_SECONDS)
+
+
+def is_pinned(user_id):
+    return cache.get(_pin_key(user_id)) is not None
+
+
+def is_read_pinned(request):
+    # A safe request of a user pinned to the primary (with replicas only)
+    return (
+        bool(get_replica_aliases())
+        and request.method in SAFE_METHODS
+        and request.user.is_authenticated
+        and is_pinned(request.user.pk)
+    )
+
+
+def choose_read_alias(request, pinned=False):
+    # A random replica for a safe request, None to read from the primary
+    # (pinned: the request is_read_pinned())
+    aliases = get_replica_aliases()
+    if not aliases or request.method not in SAFE_METHODS or pinned:
+        return None
+    return random.choice(aliases)
+
+
+@contextmanager
+def read_from(alias):
+    # Route reads to the alias (None: the primary) within the block; the
+    # choice follows the context into sync_to_async threads
+    token = _read_alias.set(alias)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()  # None: Django's default (the primary)
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Objects read from a replica are rows of the primary
+        aliases = {'default', *get_replica_aliases()}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # Replicas get the schema through replication
+        return db not in get_replica_aliases()
+
+
+class ReplicaReadMixin:
+    # For APIViews: safe requests read from a random replica, unless the
+    # user is pinned to the primary (read_pinned, also read by
+    # cache_page_payload)
+    read_pinned = False
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)  # Authentication, permissions & throttles
+
+        self.read_pinned = is_read_pinned(request)
+        alias = choose_read_alias(request, self.read_pinned)
+        if alias is not None:
+            self._replica_token = _read_alias.set(alias)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, '_replica_token', None)
+        if token is not None:
+            _read_alias.reset(token)
+            self._replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+class ReplicaPinMiddleware:
+    # Pin users to the primary after their successful writes
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        response = self.get_response(request)
+        if self.is_write(request, response):
+            self.pin_user(request)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.is_write(request, response):
+            await sync_to_async(self.pin_user)(request)  # request.user may load the session
+        return response
+
+    def is_write(self, request, response):
+        return (
+            bool(get_replica_aliases())
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        )
+
+    def pin_user(self, request):
+        user = getattr(request, 'user', None)  # Set by DRF's authentication too
+        if user is not None and user.is_authenticated:
+            pin_to_primary(user.pk)
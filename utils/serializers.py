@@ -1,5 +1,132 @@
-from rest_framework import serializers
-
-
-class ErrorResponseSerializer(serializers.Serializer):
-    detail = serializers.CharField()
\ No newline at end of file
+from functools import lru_cache
+
+from rest_framework import serializers
+
+
+class ErrorResponseSerializer(serializers.Serializer):
+    detail = serializers.CharField()
+
+
+def get_sparse_params(context):
+    # Read ?fields= & ?expand= from the request in serializer context.
+    # Returns None when neither is given (full representation).
+    request = context.get('request')
+    if request is None:
+        return None
+
+    params = getattr(request, 'query_params', request.GET)
+    if 'fields' not in params and 'expand' not in params:
+        return None
+
+    def split(value):
+        return {name.strip() for name in value.split(',') if name.strip()}
+
+    fields = split(params['fields']) if 'fields' in params else None
+    expand = split(params.get('expand', ''))
+    return fields, expand
+
+
+class SparseFieldsetMixin:
+    # Sparse fieldsets & opt-in expansion for (model) serializers:
+    # - ?fields=id,text keeps only the listed fields of the primary resource
+    # - ?expand=lesson,subject serializes the listed relations in full
+    #   (at any depth), every other nested relation collapses to its ID
+    # Without both query params the full nested representation is kept.
+
+    def get_fields(self):
+        fields = super().get_fields()
+
+        params = get_sparse_params(self.context)
+        if params is None:
+            return fields
+
+        only, expand = params
+        if only is not None and self._is_primary_resource():
+            fields = {
+                name: field for name, field in fields.items() if name in only
+            }
+
+        for name, field in list(fields.items()):
+            if isinstance(field, serializers.BaseSerializer) and name not in expand:
+                fields[name] = serializers.PrimaryKeyRelatedField(
+                    source=field.source,
+                    many=isinstance(field, serializers.ListSerializer),
+                    read_only=True
+                )
+
+        return fields
+
+    def _is_primary_resource(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
+
+    @classmethod
+    def optimize_queryset(cls, queryset, context=None):
+        # Push the serialized fields down into .only() & .select_related()
+        columns, relations = _get_query_plan(cls(context=context or {}))
+        if relations:
+            queryset = queryset.select_related(*relations)
+        if columns:
+            queryset = queryset.only(*columns)
+        return queryset
+
+
+def _get_query_plan(serializer, prefix=''):
+    # Collect model columns & forward relations read by a serializer
+    model_fields = {
+        field.name: field for field in serializer.Meta.model._meta.concrete_fields
+    }
+    columns, relations = [], []
+
+    for field in serializer.fields.values():
+        source = field.source
+        model_field = model_fields.get(source)
+        if model_field is None:
+            continue  # Not a concrete column (reverse relation, method, '*', ...)
+
+        columns.append(prefix + source)
+
+        if isinstance(field, serializers.BaseSerializer):
+            if not model_field.is_relation or isinstance(field, serializers.ListSerializer):
+                continue
+            relations.append(prefix + source)
+            nested_columns, nested_relations = _get_query_plan(
+                field,
+                prefix=f'{prefix}{source}__'
+            )
+            columns += nested_columns
+            relations += nested_relations
+
+    return columns, relations
+
+
+@lru_cache(maxsize=None)
+def _get_sparse_names(serializer_class):
+    # (field names, expandable relation names at any depth) of a serializer
+    def relations(serializer):
+        if isinstance(serializer, serializers.ListSerializer):
+            serializer = serializer.child
+        names = set()
+        for name, field in serializer.fields.items():
+            if isinstance(field, serializers.BaseSerializer):
+                names |= {name} | relations(field)
+        return names
+
+    serializer = serializer_class()
+    return frozenset(serializer.fields), frozenset(relations(serializer))
+
+
+def get_sparse_cache_key(request, serializer_class):
+    # Canonical cache key suffix for ?fields= & ?expand= (empty if not used).
+    # Names the serializer does not have are dropped, as they do not change
+    # the response, so junk names cannot multiply cache entries.
+    params = get_sparse_params({'request': request})
+    if params is None:
+        return ''
+
+    field_names, relation_names = _get_sparse_names(serializer_class)
+    fields, expand = params
+    fields = ','.join(sorted(fields & field_names)) if fields is not None else '*'
+    return f":fields:{fields}:expand:{','.join(sorted(expand & relation_names))}"
@@ -0,0 +1,141 @@
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import DatabaseError
+from django.http import JsonResponse
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .execute_wrappers import execute_wrapper
+
+
+# Create a logger instance
+logger = logging.getLogger(__name__)
+
+
+# Per-view PostgreSQL statement timeouts.
+# Views declare "statement_timeout" (seconds, an int/float or a {method:
+# seconds} dict), STATEMENT_TIMEOUTS overrides it per URL name. The timeout
+# is SET on every PostgreSQL connection the request queries & RESET at its
+# end, so a slow aggregate is cancelled by the server instead of holding a
+# pooled connection. A cancelled statement (including by the connection-wide
+# DB_STATEMENT_TIMEOUT) raises StatementTimeout: a 503 with Retry-After.
+QUERY_CANCELED = '57014'  # SQLSTATE of statements cancelled by a timeout
+
+
+class StatementTimeout(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The server is busy, please try again shortly."
+    default_code = 'statement_timeout'
+
+    def __init__(self, detail=None, code=None):
+        super().__init__(detail, code)
+        self.wait = settings.STATEMENT_TIMEOUT_RETRY_AFTER  # Retry-After header (seconds)
+
+
+def is_query_canceled(error):
+    # psycopg2 exposes the SQLSTATE as pgcode, psycopg 3 as sqlstate
+    cause = error.__cause__ or error
+    return QUERY_CANCELED in (getattr(cause, 'pgcode', None), getattr(cause, 'sqlstate', None))
+
+
+def get_statement_timeout(view_func, method, url_name=None):
+    # Seconds for the view & method (None: no per-view timeout)
+    overrides = getattr(settings, 'STATEMENT_TIMEOUTS', {})
+    if url_name in overrides:
+        return overrides[url_name]
+
+    view_class = getattr(view_func, 'view_class', None)
+    timeout = getattr(view_class or view_func, 'statement_timeout', None)
+    if isinstance(timeout, dict):
+        return timeout.get(method)
+    return timeout
+
+
+class StatementTimeoutGuard:
+    # connection.execute_wrapper applying the request's timeout to each
+    # PostgreSQL connection before its first query, & turning cancelled
+    # statements into StatementTimeout
+    def __init__(self, request):
+        self.request = request
+        self.connections = {}  # alias -> connection with the timeout SET
+        self.timed_out = False
+
+    def get_timeout(self):
+        # Known once the URL is resolved (middleware queries run without it)
+        match = getattr(self.request, 'resolver_match', None)
+        if match is None:
+            return None
+        return get_statement_timeout(match.func, self.request.method, match.view_name)
+
+    def __call__(self, execute, sql, params, many, context):
+        connection = context['connection']
+        if connection.vendor == 'postgresql' and connection.alias not in self.connections:
+            timeout = self.get_timeout()
+            if timeout:
+                context['cursor'].cursor.execute(f'SET statement_timeout = {int(timeout * 1000)}')
+                self.connections[connection.alias] = connection
+
+        try:
+            return execute(sql, params, many, context)
+        except DatabaseError as e:
+            if not is_query_canceled(e):
+                raise
+            self.timed_out = True
+            raise StatementTimeout() from e
+
+    def reset(self):
+        # Back to the connection's default for the next request
+        for connection in self.connections.values():
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute('RESET statement_timeout')
+            except DatabaseError:
+                connection.close()  # Never reuse it with this request's timeout
+        self.connections.clear()
+
+
+class StatementTimeoutMiddleware:
+    # Applies per-view statement timeouts. Views catching every exception
+    # turn a StatementTimeout into a 500; such responses are replaced by the
+    # 503 with Retry-After here.
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        guard = StatementTimeoutGuard(request)
+        try:
+            with execute_wrapper(guard):
+                response = self.get_response(request)
+        finally:
+            guard.reset()
+        return self.finish(request, response, guard)
+
+    async def __acall__(self, request):
+        guard = StatementTimeoutGuard(request)
+        try:
+            with execute_wrapper(guard):
+                response = await self.get_response(request)
+        finally:
+            if guard.connections:
+                # In the request's sync thread, which owns the connections
+                await sync_to_async(guard.reset)()
+        return self.finish(request, response, guard)
+
+    def finish(self, request, response, guard):
+        if guard.timed_out:
+            logger.warning(f"Statement timeout in {request.method} {request.path} ({response.status_code})")
+            if response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR:
+                error = StatementTimeout()
+                response = JsonResponse({"detail": str(error.detail)}, status=error.status_code)
+                response['Retry-After'] = str(error.wait)
+        return response